@@ -0,0 +1,85 @@
+"""Mesure du coût d'import des modules de l'application
+
+Chaque module est importé dans un processus Python neuf avec `-X importtime` ;
+le rapport donne la durée cumulée de l'import et signale les dépendances
+lourdes (matplotlib, numpy) chargées au passage.
+
+    python benchmarks/import_time.py [--json rapport.json] [module ...]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "utils.logger",
+    "utils.config_manager",
+    "utils.theme_manager",
+    "utils.score_manager",
+    "utils.stats_manager",
+    "utils.services",
+    "games.game_manager",
+    "utils.gui_manager",
+]
+
+# Dépendances qui ne doivent pas être chargées au démarrage
+HEAVY_PACKAGES = ("matplotlib", "numpy")
+
+
+def measure_import(module):
+    """Importe un module dans un processus neuf ; retourne sa durée et les paquets chargés"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import de {module} impossible:\n{result.stderr.strip().splitlines()[-1]}")
+
+    cumulative_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        # Format : "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if not fields[1].isdigit():
+            continue
+        name = fields[2].strip()
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(fields[1])
+    return {
+        "module": module,
+        "cumulative_ms": round(cumulative_us / 1000, 2),
+        "heavy_imports": sorted(packages.intersection(HEAVY_PACKAGES)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure du temps d'import des modules")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--json", help="Écrit le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    report = []
+    for module in args.modules:
+        try:
+            entry = measure_import(module)
+        except RuntimeError as e:
+            print(e)
+            continue
+        report.append(entry)
+        heavy = f"  ⚠ charge {', '.join(entry['heavy_imports'])}" if entry["heavy_imports"] else ""
+        print(f"{module:<24} {entry['cumulative_ms']:>9.2f} ms{heavy}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "imports": report}, f, ensure_ascii=False, indent=2)
+    return 1 if any(entry["heavy_imports"] for entry in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
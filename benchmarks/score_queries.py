@@ -0,0 +1,74 @@
+"""Temps des requêtes du stockage SQLite des scores
+
+Remplit une base temporaire (un million de scores par défaut, répartis sur
+les jeux de la collection et quelques centaines de joueurs) puis mesure le
+classement, le record personnel et le comptage.
+
+    python benchmarks/score_queries.py [--rows 1000000] [--repeat 1000]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.score_storage import SqliteScoreStore  # noqa: E402
+
+GAMES = ["number_guess", "mental_calc", "slot_machine", "typer_game", "virtual_pet"]
+
+
+def fill(store, rows, batch=50_000):
+    """Ajoute `rows` scores aléatoires, par lots"""
+    rng = random.Random(42)
+    for start in range(0, rows, batch):
+        by_game = {game_id: [] for game_id in GAMES}
+        for _ in range(min(batch, rows - start)):
+            by_game[rng.choice(GAMES)].append({
+                'id': uuid.UUID(int=rng.getrandbits(128)).hex,
+                'player': f"Joueur{rng.randrange(500)}",
+                'score': rng.randrange(100_000),
+                'date': f"2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T12:00:00",
+            })
+        for game_id, entries in by_game.items():
+            store.append(game_id, entries)
+
+def timed(label, repeat, func):
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    per_call = (time.perf_counter() - start) / repeat * 1e3
+    print(f"{label:<22} {per_call:8.4f} ms")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps des requêtes du stockage SQLite des scores")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        store = SqliteScoreStore(os.path.join(directory, "scores.db"))
+        start = time.perf_counter()
+        fill(store, args.rows)
+        print(f"Insertion de {args.rows} scores : {time.perf_counter() - start:.1f} s")
+
+        timed("top 10", args.repeat, lambda i: store.top(GAMES[i % len(GAMES)], limit=10))
+        timed("record personnel", args.repeat,
+              lambda i: store.best(GAMES[i % len(GAMES)], f"Joueur{i % 500}"))
+        timed("nombre de scores", args.repeat, lambda i: store.count(GAMES[i % len(GAMES)]))
+        timed("chargement du cache", max(1, args.repeat // 10), lambda i: store.load(GAMES[i % len(GAMES)]))
+        store.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
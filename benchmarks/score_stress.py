@@ -0,0 +1,88 @@
+"""Écritures concurrentes de scores par plusieurs processus
+
+Chaque processus enregistre `--scores` scores avec son propre
+ScoreManager, par lots de `--batch`, sur les mêmes fichiers. À la fin, les
+scores sont relus et comptés : aucun ne doit manquer. Affiche le débit.
+Code de sortie 1 si des scores ont été perdus.
+
+    python benchmarks/score_stress.py [--processes 4] [--scores 2000] [--backend json]
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.score_manager import ScoreManager  # noqa: E402
+
+GAME_ID = "stress"
+
+
+def open_manager(directory, backend, capacity):
+    """Gestionnaire qui garde tous les scores, pour pouvoir les compter"""
+    return ScoreManager(
+        os.path.join(directory, "scores.json"),
+        flush_delay=3600,  # Écritures déclenchées par lots, à la main
+        check_interval=0,
+        compact_threshold=500,
+        backend=backend,
+        database_file=os.path.join(directory, "scores.db"),
+        max_scores=capacity,
+    )
+
+
+def worker(directory, backend, capacity, index, count, batch):
+    manager = open_manager(directory, backend, capacity)
+    for i in range(count):
+        manager.save_score(GAME_ID, f"Joueur{index}", i)
+        if (i + 1) % batch == 0:
+            manager.flush()
+    manager.close()
+
+
+def run_stress(directory, processes=4, scores=2000, batch=20, backend="json"):
+    """Lance les processus ; retourne (scores attendus, scores perdus, scores/s)"""
+    capacity = processes * scores
+    start = time.perf_counter()
+    workers = [
+        multiprocessing.Process(target=worker, args=(directory, backend, capacity, index, scores, batch))
+        for index in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    reader = open_manager(directory, backend, capacity)
+    found = {(entry['player'], entry['score']) for entry in reader.get_top_scores(GAME_ID, capacity)}
+    reader.close()
+    expected = {(f"Joueur{index}", i) for index in range(processes) for i in range(scores)}
+    return len(expected), len(expected - found), capacity / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Écritures concurrentes de scores")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--scores", type=int, default=2000, help="Scores par processus")
+    parser.add_argument("--batch", type=int, default=20, help="Scores par écriture")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        expected, lost, throughput = run_stress(directory, args.processes, args.scores, args.batch, args.backend)
+    finally:
+        shutil.rmtree(directory)
+    print(f"{args.processes} processus, {expected} scores ({args.backend}) : "
+          f"{lost} perdus, {throughput:.0f} scores/s")
+    return 1 if lost else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Contrôle des budgets de temps du démarrage
+
+Lance `main.py --startup-profile` plusieurs fois dans des processus neufs
+(l'application se ferme au premier événement d'inactivité), relit le
+rapport JSON écrit par le profileur et compare la médiane de chaque phase à
+son budget (`performance.startup_budgets_ms` dans config.json).
+Code de sortie : 0 si tout est dans les budgets, 1 sinon, 2 si l'application
+n'a pas pu démarrer (par exemple sans affichage).
+
+    python benchmarks/startup_budget.py [--runs 3] [--json résumé.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.config_manager import ConfigManager  # noqa: E402
+
+
+def run_startup(report_path):
+    """Démarre l'application une fois et retourne son rapport de démarrage"""
+    if os.path.exists(report_path):
+        os.remove(report_path)
+    result = subprocess.run(
+        [sys.executable, "main.py", "--startup-profile"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0 or not os.path.exists(report_path):
+        lines = (result.stdout + result.stderr).splitlines()
+        fatal = [line for line in lines if line.startswith("Erreur fatale")]
+        raise RuntimeError(fatal[0] if fatal else f"code de sortie {result.returncode}")
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contrôle des budgets de temps du démarrage")
+    parser.add_argument("--runs", type=int, default=3, help="Nombre de démarrages mesurés")
+    parser.add_argument("--json", help="Écrit le résumé dans ce fichier")
+    args = parser.parse_args()
+
+    config = ConfigManager(os.path.join(ROOT, "config.json"))
+    budgets = config.get_performance_setting("startup_budgets_ms", {})
+    report_path = os.path.join(ROOT, config.get_performance_setting(
+        "startup_report", os.path.join("logs", "startup_profile.json")))
+
+    durations = {}
+    slowest_imports = []
+    for _ in range(max(1, args.runs)):
+        try:
+            report = run_startup(report_path)
+        except RuntimeError as e:
+            print(f"Démarrage impossible : {e}")
+            return 2
+        for phase in report["phases"]:
+            durations.setdefault(phase["name"], []).append(phase["duration_ms"])
+        slowest_imports = report["imports"]["slowest"][:5]
+
+    summary = []
+    failed = False
+    for name, values in durations.items():
+        median = statistics.median(values)
+        budget = budgets.get(name)
+        over = budget is not None and median > budget
+        failed = failed or over
+        summary.append({"phase": name, "median_ms": round(median, 2), "budget_ms": budget, "over_budget": over})
+        status = "DÉPASSÉ" if over else "ok"
+        budget_text = f"{budget:>8} ms" if budget is not None else "       -   "
+        print(f"{name:<14} {median:>9.2f} ms / {budget_text}  {status}")
+
+    print("Imports les plus coûteux :")
+    for entry in slowest_imports:
+        print(f"  {entry['module']:<40} {entry['self_ms']:>8.2f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "phases": summary}, f, ensure_ascii=False, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
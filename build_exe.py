@@ -1,6 +1,7 @@
 import PyInstaller.__main__
 import os
 import shutil
+from utils.word_store import BinaryWordStore, compile_dictionary, compiled_path
 
 def build_exe():
     # Assurez-vous que les dossiers nécessaires existent
@@ -19,6 +20,15 @@ def build_exe():
         print(f"ERREUR: Le fichier source {source_dico} n'existe pas!")
         return
 
+    # Compiler le dictionnaire avant l'empaquetage (inclus via assets/*)
+    source_bin = compiled_path(source_dico)
+    try:
+        info = compile_dictionary(source_dico, source_bin)
+        print(f"Dictionnaire compilé: {info['words']} mots uniques, {info['bytes']} octets")
+    except Exception as e:
+        print(f"Erreur lors de la compilation du dictionnaire: {e}")
+        return
+
     # Utilisez le fichier spec
     PyInstaller.__main__.run([
         'Mini-Jeux.spec',
@@ -26,26 +36,33 @@ def build_exe():
         '--noconfirm',
     ])
 
-    # Copier manuellement le fichier dico.txt
+    # Copier manuellement le fichier dico.txt et sa version compilée
     dist_dico = os.path.join('dist', 'assets', 'dico.txt')
+    dist_bin = compiled_path(dist_dico)
     try:
         shutil.copy2(source_dico, dist_dico)
-        print(f"Fichier dico.txt copié avec succès vers {dist_dico}")
+        shutil.copy2(source_bin, dist_bin)
+        print(f"Fichiers du dictionnaire copiés avec succès vers {os.path.dirname(dist_dico)}")
     except Exception as e:
         print(f"Erreur lors de la copie du fichier: {e}")
 
-    # Vérification finale
-    if os.path.exists(dist_dico):
-        print(f"Vérification: Le fichier {dist_dico} existe bien")
-        # Afficher le contenu pour vérification
+    # Vérification finale : seul l'en-tête compilé est lu pour compter les mots
+    if os.path.exists(dist_bin):
+        print(f"Vérification: Le fichier {dist_bin} existe bien")
         try:
-            with open(dist_dico, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                print(f"Nombre de mots dans le dictionnaire: {len(lines)}")
+            store = BinaryWordStore(dist_bin)
+            try:
+                if not store.verify():
+                    print(f"ERREUR: Somme de contrôle invalide pour {dist_bin}")
+                elif store.is_stale(dist_dico):
+                    print(f"ERREUR: {dist_bin} ne correspond pas à {dist_dico}")
+                print(f"Nombre de mots dans le dictionnaire: {len(store)}")
+            finally:
+                store.close()
         except Exception as e:
             print(f"Erreur lors de la lecture du fichier: {e}")
     else:
-        print(f"ERREUR: Le fichier {dist_dico} n'a pas été créé!")
+        print(f"ERREUR: Le fichier {dist_bin} n'a pas été créé!")
 
     print("Build terminé ! L'exécutable se trouve dans le dossier 'dist'")
 
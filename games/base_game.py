@@ -3,26 +3,29 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import time
-from utils.score_manager import ScoreManager
-from utils.theme_manager import ThemeManager
-from utils.animation_manager import AnimationManager
-from utils.config_manager import ConfigManager
-from utils.logger import get_logger
+from utils.services import get_services
 
 class BaseGame(ABC):
-    def __init__(self, name, game_id):
+    def __init__(self, name, game_id, services=None):
         self._name = name
         self.game_id = game_id
-        self.score_manager = ScoreManager()
+        # Gestionnaires partagés avec l'application (un seul par processus)
+        self.services = services or get_services()
+        self.score_manager = self.services.scores
         self.current_score = 0
         
-        # Initialisation des gestionnaires
-        self.theme_manager = ThemeManager()
-        self.animation_manager = AnimationManager()
-        self.config_manager = ConfigManager()
-        self.logger = get_logger()
+        self.theme_manager = self.services.theme
+        self.animation_manager = self.services.animations
+        self.config_manager = self.services.config
+        self.logger = self.services.logger
         
-        # Couleurs du thème actuel
+        # Couleurs du thème actuel, tenues à jour à chaque changement de thème
+        self.refresh_colors()
+        # Annulations des abonnements, appelées à la fermeture du jeu
+        self._subscriptions = self.subscribe_changes()
+        
+    def refresh_colors(self):
+        """Recopie les couleurs du thème actuel"""
         self.game_colors = {
             'bg_primary': self.theme_manager.get_color('bg_primary'),
             'bg_secondary': self.theme_manager.get_color('bg_secondary'),
@@ -36,8 +39,27 @@ class BaseGame(ABC):
             'error': self.theme_manager.get_color('error')
         }
         
+    def on_theme_changed(self, theme_name):
+        """Appelé par le gestionnaire de thèmes ; la prochaine fenêtre utilise le nouveau thème"""
+        self.refresh_colors()
+        
+    def subscribe_changes(self):
+        """Abonne le jeu aux changements partagés et retourne les annulations"""
+        return [self.theme_manager.subscribe(self.on_theme_changed)]
+
+    def catch_up_changes(self):
+        """Prend en compte les changements faits pendant que le jeu était fermé"""
+        self.refresh_colors()
+
+    def ensure_subscriptions(self):
+        """Réabonne un jeu rouvert : le gestionnaire de jeux garde l'instance"""
+        if not self._subscriptions:
+            self._subscriptions = self.subscribe_changes()
+            self.catch_up_changes()
+
     def create_game_widgets(self, parent):
         """Crée l'interface de base du jeu avec le nouveau design"""
+        self.ensure_subscriptions()
         self.parent = parent
         self.setup_styles()
         
@@ -133,7 +155,7 @@ class BaseGame(ABC):
         self.score_label.grid(row=0, column=0, sticky='w', padx=15, pady=10)
         
         # Meilleur score
-        high_score = self.score_manager.get_high_score(self.game_id)
+        high_score = self.score_manager.get_high_score(self.game_id, *self.get_score_variant())
         if high_score is not None:
             high_score_text = f"Meilleur: {high_score['score']}"
             if 'player' in high_score:
@@ -298,7 +320,7 @@ class BaseGame(ABC):
                 self.score_label.config(text=f"Score: {self.current_score}")
                 
             # Met à jour le meilleur score si nécessaire
-            high_score = self.score_manager.get_high_score(self.game_id)
+            high_score = self.score_manager.get_high_score(self.game_id, *self.get_score_variant())
             if high_score is None or self.current_score > high_score['score']:
                 if hasattr(self, 'high_score_label'):
                     self.high_score_label.config(
@@ -314,13 +336,24 @@ class BaseGame(ABC):
         except Exception as e:
             self.logger.log_error_with_context(e, "update_score")
             
-    def save_score(self, player_name=None):
-        """Sauvegarde le score actuel"""
+    def get_score_variant(self):
+        """(mode, difficulté) du classement de la partie en cours ; (None, None) par défaut"""
+        return None, None
+
+    def save_score(self, player_name=None, details=None):
+        """Sauvegarde le score actuel (details : résumé de la partie, optionnel)
+
+        Le score est rangé dans le classement de `get_score_variant()`.
+        """
         try:
             if not player_name:
                 player_name = "Joueur"
             if self.current_score > 0:  # Ne sauvegarde que les scores positifs
-                self.score_manager.save_score(self.game_id, player_name, self.current_score)
+                mode, difficulty = self.get_score_variant()
+                self.score_manager.save_score(
+                    self.game_id, player_name, self.current_score, details,
+                    mode=mode, difficulty=difficulty
+                )
                 self.logger.log_score(self._name, player_name, self.current_score)
         except Exception as e:
             self.logger.log_error_with_context(e, "save_score")
@@ -329,18 +362,29 @@ class BaseGame(ABC):
                 "Impossible de sauvegarder le score. Veuillez réessayer."
             )
         
+    def get_rank_text(self):
+        """Situe le score de la partie parmi toutes celles de son classement ("" s'il n'y en a pas d'autre)"""
+        rank = self.score_manager.get_score_rank(self.game_id, self.current_score, *self.get_score_variant())
+        if not rank or rank["total"] < 2:
+            return ""
+        return f"Mieux que {rank['percentile']:.0f} % des parties ({rank['rank']}e sur {rank['total']})"
+
     def show_game_over(self, message="Partie terminée !"):
         """Affiche l'écran de fin de partie moderne"""
         try:
+            # Enregistré avant l'affichage : le score compte dans son propre rang
+            self.save_score()
             if self.current_score > 0:  # Ne montre le score que s'il est positif
                 message = f"{message}\nScore final: {self.current_score}"
+                rank_text = self.get_rank_text()
+                if rank_text:
+                    message += f"\n{rank_text}"
                 
             # Animation avant la boîte de dialogue
             if self.config_manager.are_animations_enabled():
                 self.animation_manager.shake(self.main_frame, intensity=3, duration=0.2)
                 
             messagebox.showinfo("Fin de partie", message)
-            self.save_score()
             self.quit_game()
             
             self.logger.log_game_event(self._name, "game_over", score=self.current_score)
@@ -382,6 +426,7 @@ class BaseGame(ABC):
         except Exception as e:
             self.logger.log_error_with_context(e, "quit_game")
             # Force la fermeture même en cas d'erreur
+            self.release_subscriptions()
             if hasattr(self, 'parent'):
                 self.parent.destroy()
                 
@@ -389,9 +434,19 @@ class BaseGame(ABC):
         """Destruction de la fenêtre (utilisé par l'animation)"""
         if hasattr(self, 'cleanup'):
             self.cleanup()
+        self.release_subscriptions()
         if hasattr(self, 'parent'):
             self.parent.destroy()
-        
+
+    def release_subscriptions(self):
+        """Désabonne le jeu des changements de thème et de configuration"""
+        while self._subscriptions:
+            self._subscriptions.pop()()
+        
+    def user_data_path(self, filename):
+        """Chemin d'un fichier de données utilisateur, rangé à côté des scores"""
+        return os.path.join(os.path.dirname(self.score_manager.scores_file), filename)
+
     def resource_path(self, relative_path):
         """Obtient le chemin absolu des ressources"""
         try:
@@ -400,6 +455,10 @@ class BaseGame(ABC):
         except Exception:
             return relative_path
             
+    def get_status_text(self):
+        """Statut affiché sur la carte du jeu (ex. chargement en cours)"""
+        return ""
+            
     def update_status(self, status_text):
         """Met à jour le texte de statut"""
         if hasattr(self, 'status_label'):
@@ -1,24 +1,93 @@
-from games.number_guess import NumberGuessGame
-from games.mental_calc import MentalCalcGame
-from games.slot_machine import SlotMachineGame
-from games.typer_game import TyperGame
-from games.virtual_pet import VirtualPetGame
+import importlib
+
+
+class GameDescriptor:
+    """Description légère d'un jeu : de quoi l'afficher sans le construire
+
+    Le module du jeu n'est importé, et le jeu construit, qu'au premier
+    appel de `create()`.
+    """
+
+    def __init__(self, game_id, name, module_path, class_name, description="", factory=None, status=None):
+        self.game_id = game_id
+        self.name = name
+        self.module_path = module_path
+        self.class_name = class_name
+        self.description = description
+        self.factory = factory
+        # Fonction (services) -> texte de statut de la carte, sans construire le jeu
+        self.status = status
+
+    def get_status_text(self, services):
+        """Statut affiché sur la carte du jeu (ex. chargement en cours)"""
+        return self.status(services) if self.status else ""
+
+    def load_factory(self):
+        """Importe le module du jeu et retourne sa classe (ou la fabrique fournie)"""
+        if self.factory is None:
+            module = importlib.import_module(self.module_path)
+            self.factory = getattr(module, self.class_name)
+        return self.factory
+
+    def create(self):
+        """Construit une instance du jeu"""
+        return self.load_factory()()
+
+
+def dictionary_status(services):
+    """Statut du dictionnaire partagé du jeu de frappe (chargé dès l'affichage du menu)"""
+    return "⏳ Chargement du dictionnaire..." if services.words.is_loading() else ""
+
+
+# Jeux de la collection, dans l'ordre du menu
+GAME_REGISTRY = [
+    GameDescriptor("number_guess", "Devine le Nombre", "games.number_guess", "NumberGuessGame",
+                   "Devinez un nombre entre 1 et 100"),
+    GameDescriptor("mental_calc", "Calcul Mental", "games.mental_calc", "MentalCalcGame",
+                   "Résolvez des opérations rapidement"),
+    GameDescriptor("slot_machine", "Machine à Sous", "games.slot_machine", "SlotMachineGame",
+                   "Alignez les symboles colorés"),
+    GameDescriptor("typer_game", "Jeu de Frappe", "games.typer_game", "TyperGame",
+                   "Testez votre vitesse de frappe", status=dictionary_status),
+    GameDescriptor("virtual_pet", "Tamagotchi", "games.virtual_pet", "VirtualPetGame",
+                   "Prenez soin de votre animal virtuel"),
+]
+
 
 class GameManager:
-    def __init__(self):
-        """Initialise la collection de jeux"""
-        self.games = {
-            "1": NumberGuessGame(),
-            "2": MentalCalcGame(),
-            "3": SlotMachineGame(),
-            "4": TyperGame(),
-            "5": VirtualPetGame()
+    def __init__(self, descriptors=None):
+        """Initialise le registre des jeux, sans en construire aucun"""
+        self.descriptors = {
+            descriptor.game_id: descriptor
+            for descriptor in (GAME_REGISTRY if descriptors is None else descriptors)
         }
-        
+        self._instances = {}
+
+    def get_descriptor(self, game_id):
+        """Récupère la description d'un jeu par son ID"""
+        return self.descriptors.get(game_id)
+
+    def get_all_descriptors(self):
+        """Récupère la description de tous les jeux, dans l'ordre du menu"""
+        return list(self.descriptors.values())
+
+    def is_loaded(self, game_id):
+        """Indique si le jeu a déjà été construit"""
+        return game_id in self._instances
+
     def get_game(self, game_id):
-        """Récupère un jeu par son ID"""
-        return self.games.get(game_id)
-        
+        """Récupère un jeu par son ID, en le construisant au premier appel"""
+        if game_id not in self._instances:
+            descriptor = self.descriptors.get(game_id)
+            if descriptor is None:
+                return None
+            self._instances[game_id] = descriptor.create()
+        return self._instances[game_id]
+
+    def get_loaded_game(self, game_id):
+        """Récupère un jeu seulement s'il est déjà construit"""
+        return self._instances.get(game_id)
+
     def get_all_games(self):
-        """Récupère tous les jeux"""
-        return self.games 
\ No newline at end of file
+        """Récupère tous les jeux (les construit tous : à éviter pour l'affichage)"""
+        return {game_id: self.get_game(game_id) for game_id in self.descriptors}
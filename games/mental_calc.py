@@ -143,6 +143,11 @@ class MentalCalcGame(BaseGame):
             command=self.start_lives_mode
         ).pack(side='left', expand=True, padx=5)
 
+        # Meilleurs scores de chaque mode
+        self.scores_frame = ttk.Frame(self.frame, style='Game.TFrame')
+        self.scores_frame.pack(fill='x', padx=20, pady=10)
+        self.update_scores_display()
+
         # Zone de jeu (initialement cachée)
         self.game_frame = ttk.Frame(self.frame, style='Game.TFrame')
         self.game_frame.pack(fill='x', pady=20)
@@ -272,12 +277,16 @@ class MentalCalcGame(BaseGame):
         self.cleanup()  # Nettoie les timers et événements
         self.timer_running = False
         self.save_score()
+        self.update_scores_display()
         
         # Message personnalisé selon le mode
         if self.current_mode == 'timer':
             message = f"Temps écoulé !\nProblèmes résolus : {self.problems_solved}\nScore final: {self.current_score}"
         else:
             message = f"Partie terminée!\nScore final: {self.current_score}"
+        rank_text = self.get_rank_text() if self.current_score > 0 else ""
+        if rank_text:
+            message += f"\n{rank_text}"
             
         self.problem_label.config(text=message)
         self.entry.pack_forget()
@@ -368,11 +377,14 @@ class MentalCalcGame(BaseGame):
         self.mode_frame.pack(fill='x', padx=20, pady=10)
         self.game_frame.pack_forget()
 
+    def get_score_variant(self):
+        """Chaque mode (timer, vies) a son propre classement"""
+        return self.current_mode, None
+
     def save_score(self):
-        """Sauvegarde le score actuel"""
+        """Sauvegarde le score actuel dans le classement du mode"""
         try:
-            player_name = f"Joueur ({self.current_mode})"
-            super().save_score(player_name)
+            super().save_score()
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du score : {e}")
             messagebox.showerror(
@@ -394,10 +406,10 @@ class MentalCalcGame(BaseGame):
             font=('Helvetica', 10, 'bold')
         ).pack(pady=(0,5))
         
-        for i, score in enumerate(self.high_scores['timer'][:5], 1):
+        for i, score in enumerate(self.score_manager.get_scores(self.game_id, 'timer')[:5], 1):
             ttk.Label(
                 timer_frame, 
-                text=f"{i}. {score} points",
+                text=f"{i}. {score['score']} points",
                 font=('Helvetica', 10)
             ).pack(pady=1)
 
@@ -416,10 +428,10 @@ class MentalCalcGame(BaseGame):
             font=('Helvetica', 10, 'bold')
         ).pack(pady=(0,5))
         
-        for i, score in enumerate(self.high_scores['lives'][:5], 1):
+        for i, score in enumerate(self.score_manager.get_scores(self.game_id, 'lives')[:5], 1):
             ttk.Label(
                 lives_frame, 
-                text=f"{i}. {score} points",
+                text=f"{i}. {score['score']} points",
                 font=('Helvetica', 10)
             ).pack(pady=1)
 
@@ -1,21 +1,40 @@
 import tkinter as tk
 from tkinter import ttk
-import random
-import time
 from games.base_game import BaseGame
 import os
 import sys
 import tkinter.messagebox as messagebox
+from tkinter import filedialog
+from utils.word_store import FALLBACK_WORDS, BackgroundLoader, DifficultySampler, ListWordStore, fold_word
+from utils.ngram_index import load_or_build_ngram_index, ngram_cache_path
+from utils.text_source import TextProgress
+from utils.word_trie import PrefixTracker, PrefixTrie
+from utils.typing_stats import AdaptiveSampler, ErrorProfile, KeystrokeRecorder
 
 class TyperGame(BaseGame):
     def __init__(self):
         super().__init__("Jeu de Frappe", "typer_game")
-        self.words = self.load_words()
+        self._words = None  # Dictionnaire installé dès que le chargement est terminé
+        self._fallback_words = ListWordStore(FALLBACK_WORDS)
+        # Chargement partagé, lancé dès l'affichage du menu
+        self.word_loader = self.services.words
+        self._samplers = {}  # Un échantillonneur par niveau de difficulté
+        self._tries = {}  # Arbre exact et arbre des formes normalisées
+        self.tracker = PrefixTracker()
+        self.recorder = KeystrokeRecorder()
+        self.error_profile = ErrorProfile(self.user_data_path("typing_profile.json"))
+        self.training_mode = False  # Mots orientés vers les fautes fréquentes
+        self.drill = None  # Exercice ciblé sur des groupes de lettres
+        # Saisie acceptée sans accents ni majuscules
+        self.accent_insensitive = self.config_manager.get_game_setting('typer_game', 'accent_insensitive', False)
+        self.ngram_loader = None  # Index n-grammes, chargé au premier exercice
+        self.text_source = None  # Texte personnalisé à la place du dictionnaire
+        self.text_progress = TextProgress(self.user_data_path("text_progress.json"))
         self.current_word = ""
         self.start_time = None
         self.words_typed = 0
         self.max_words = 20
-        self.current_mode = "normal"  # Mode par défaut
+        self.current_mode = self.config_manager.get_difficulty()  # Mode par défaut
         # Suppression de la gestion individuelle des scores - utilise ScoreManager
         self.reset()
 
@@ -38,15 +57,234 @@ class TyperGame(BaseGame):
         print(f"Chemin complet du fichier: {full_path}")
         return full_path
 
-    def load_words(self):
-        """Charge la liste des mots depuis le fichier"""
+    @property
+    def words(self):
+        """Dictionnaire des mots ; liste intégrée tant qu'il est en chargement"""
+        if self._words is None:
+            store = self.word_loader.poll()
+            if store is None and self.word_loader.error is None:
+                return self._fallback_words
+            self._install_words(store or self._fallback_words)
+        return self._words
+
+    def _install_words(self, store):
+        """Remplace la liste intégrée par le dictionnaire chargé"""
+        self._words = store
+        # Échantillonneurs et arbres construits sur la liste intégrée
+        self._samplers.clear()
+        self._tries.clear()
+
+    def is_loading(self):
+        """Indique si le dictionnaire est encore en cours de chargement"""
+        return self._words is None and self.word_loader.is_loading()
+
+    def get_status_text(self):
+        if self.is_loading():
+            return "⏳ Chargement du dictionnaire..."
+        if self.drill and ('drill', self.drill) not in self._samplers:
+            return "⏳ Préparation de l'exercice..."
+        return ""
+
+    def poll_words(self):
+        """Surveille le chargement depuis la boucle Tk"""
         try:
-            file_path = self.resource_path('assets/dico.txt')
-            with open(file_path, "r", encoding='utf-8') as file:
-                return [word.strip() for word in file.readlines() if word.strip()]
-        except Exception as e:
-            print(f"Erreur lors du chargement du dictionnaire: {str(e)}")
-            return ["python", "programmation", "ordinateur", "clavier", "écran"]
+            if self.is_loading():
+                self.update_status(self.get_status_text())
+                self.parent.after(100, self.poll_words)
+            else:
+                self.words  # Installe le dictionnaire chargé
+                self.update_status("")
+        except tk.TclError:
+            pass  # Fenêtre fermée pendant le chargement
+
+    @property
+    def trie(self):
+        """Arbre des préfixes du dictionnaire, construit à la première frappe"""
+        words = self.words
+        folded = self.accent_insensitive
+        if folded not in self._tries:
+            self._tries[folded] = PrefixTrie.from_store(words, folded=folded)
+        return self._tries[folded]
+
+    def words_match(self, typed, expected):
+        """Compare la saisie au mot attendu selon le mode d'accents"""
+        if self.accent_insensitive:
+            return fold_word(typed) == fold_word(expected)
+        return typed == expected
+
+    def toggle_accents(self):
+        """Active ou désactive la saisie insensible aux accents et à la casse"""
+        self.accent_insensitive = not self.accent_insensitive
+        if hasattr(self, 'accent_button'):
+            self.accent_button.config(text=self.get_accent_button_text())
+            self.tracker = PrefixTracker()  # Reconstruit à la prochaine frappe
+            self.tracker.set_target(self.current_word)
+            self.on_keystroke()
+            self.entry.focus()
+
+    def get_accent_button_text(self):
+        return "Accents : ignorés" if self.accent_insensitive else "Accents : exacts"
+
+    @property
+    def ngram_index(self):
+        """Index n-grammes du dictionnaire ; None tant qu'il est en préparation"""
+        if self._words is None:
+            return None
+        if self.ngram_loader is None:
+            store = self._words
+            cache_path = ngram_cache_path(self.resource_path('assets/dico.txt'))
+            self.ngram_loader = BackgroundLoader(lambda: load_or_build_ngram_index(store, cache_path))
+            self.ngram_loader.start()
+        return self.ngram_loader.poll()
+
+    def get_drill_sampler(self):
+        """Échantillonneur des mots de l'exercice en cours, ou None s'il n'est pas prêt"""
+        key = ('drill', self.drill)
+        if key not in self._samplers:
+            self.words  # Installe le dictionnaire s'il vient d'être chargé
+            index = self.ngram_index
+            if index is None:
+                return None
+            drills = self.config_manager.get_game_setting('typer_game', 'drills', {})
+            try:
+                ids = index.query(drills.get(self.drill, []))
+            except ValueError as e:
+                print(f"Exercice invalide: {e}")
+                ids = []
+            self._samplers[key] = DifficultySampler(self.words, [ids]) if ids else None
+        return self._samplers[key]
+
+    def get_sampler(self, mode=None):
+        """Retourne l'échantillonneur du niveau demandé, construit une seule fois"""
+        mode = mode or self.current_mode
+        if mode not in self._samplers:
+            levels = self.config_manager.get_game_setting('typer_game', 'word_difficulty', {})
+            self._samplers[mode] = self.words.sampler(levels.get(mode))
+        if self.drill:
+            sampler = self.get_drill_sampler()
+            if sampler is not None:
+                return sampler
+        if not self.training_mode:
+            return self._samplers[mode]
+        key = ('training', mode)
+        if key not in self._samplers:
+            self._samplers[key] = AdaptiveSampler(self.words, self._samplers[mode], self.error_profile)
+        return self._samplers[key]
+
+    def toggle_training(self):
+        """Active ou désactive l'entraînement ciblé sur les fautes fréquentes"""
+        self.training_mode = not self.training_mode
+        if hasattr(self, 'training_button'):
+            self.training_button.config(
+                text="🎯 Entraînement : activé" if self.training_mode else "🎯 Entraînement"
+            )
+            self.next_word()
+            self.entry.focus()
+
+    def set_drill(self, drill):
+        """Choisit un exercice (None pour revenir aux mots du niveau)"""
+        self.drill = drill or None
+        if hasattr(self, 'word_label'):
+            self.poll_drill()
+            self.entry.focus()
+
+    def poll_drill(self):
+        """Attend que l'index soit prêt avant de proposer les mots de l'exercice"""
+        try:
+            if self.drill:
+                self.get_drill_sampler()
+            if self.drill and ('drill', self.drill) not in self._samplers:
+                self.update_status(self.get_status_text())
+                self.parent.after(100, self.poll_drill)
+                return
+            self.update_status("")
+            self.next_word()
+            if self.drill and self._samplers.get(('drill', self.drill)) is None:
+                self.feedback_label.config(text="Aucun mot du dictionnaire pour cet exercice")
+        except tk.TclError:
+            pass  # Fenêtre fermée pendant la préparation
+
+    def choose_text(self):
+        """Ouvre un texte personnalisé, ou revient au dictionnaire"""
+        if self.text_source:
+            self.close_text()
+        else:
+            path = filedialog.askopenfilename(
+                title="Choisir un texte",
+                filetypes=[("Fichiers texte", "*.txt"), ("Tous les fichiers", "*.*")]
+            )
+            if path:
+                self.open_text(path)
+        if hasattr(self, 'text_button'):
+            self.text_button.config(text=self.get_text_button_text())
+            self.next_word()
+            self.entry.focus()
+
+    def get_text_button_text(self):
+        return "📖 Dictionnaire" if self.text_source else "📖 Texte..."
+
+    def open_text(self, path):
+        """Lit un texte au fil de la partie, depuis la dernière position connue"""
+        prefetch = self.config_manager.get_game_setting('typer_game', 'text_prefetch', 32)
+        try:
+            self.text_source = self.text_progress.open(path, prefetch)
+        except OSError as e:
+            print(f"Erreur lors de l'ouverture du texte: {e}")
+            messagebox.showerror("Erreur", f"Impossible d'ouvrir le texte :\n{path}")
+
+    def close_text(self):
+        """Mémorise la position dans le texte puis revient au dictionnaire"""
+        if self.text_source:
+            self.save_text_progress()
+            self.text_source.close()
+            self.text_source = None
+
+    def save_text_progress(self):
+        if self.text_source:
+            self.text_progress.set_offset(self.text_source.path, self.text_source.position)
+            self.text_progress.save_progress()
+
+    def next_text_word(self):
+        """Mot suivant du texte personnalisé ; None sans texte ou si le texte est vide"""
+        if not self.text_source:
+            return None
+        word = self.text_source.next_word()
+        if word is None:
+            # Fin du texte : on reprend au début
+            self.text_source.rewind()
+            word = self.text_source.next_word()
+            if word is None:
+                self.close_text()
+        return word
+
+    def end_round(self):
+        """Sauvegarde le profil d'erreurs et recalcule les pondérations"""
+        self.error_profile.save_profile()
+        self.save_text_progress()
+        for key, sampler in self._samplers.items():
+            if isinstance(key, tuple) and key[0] == 'training':
+                sampler.rebuild()
+
+    def subscribe_changes(self):
+        # Niveaux et exercices relus dès qu'ils changent dans la configuration
+        return super().subscribe_changes() + [
+            self.config_manager.subscribe('game_settings.typer_game', self.on_settings_changed)
+        ]
+
+    def catch_up_changes(self):
+        super().catch_up_changes()
+        self.on_settings_changed(None, self.config_manager.get('game_settings.typer_game'))
+
+    def on_settings_changed(self, key, settings):
+        """Oublie les échantillonneurs construits sur l'ancienne configuration"""
+        self._samplers.clear()
+
+    def set_mode(self, mode):
+        """Change le niveau de difficulté et propose un nouveau mot"""
+        self.current_mode = mode
+        if hasattr(self, 'word_label'):
+            self.next_word()
+            self.entry.focus()
 
     def reset(self):
         self.score = 0
@@ -57,12 +295,65 @@ class TyperGame(BaseGame):
         self.start_time = None
         self.words_typed = 0
         self.max_words = 20
+        self.recorder.reset()
         
     def init_game(self, game_frame):
         # Frame pour le jeu
         self.game_container = ttk.Frame(game_frame, style='Game.TFrame')
         self.game_container.pack(expand=True, pady=20)
         
+        # Sélection du niveau de difficulté
+        mode_frame = ttk.Frame(self.game_container, style='Game.TFrame')
+        mode_frame.pack(pady=5)
+        for mode, label in self.config_manager.get_all_difficulties().items():
+            ttk.Button(
+                mode_frame,
+                text=label,
+                style='Game.TButton',
+                command=lambda m=mode: self.set_mode(m)
+            ).pack(side='left', padx=5)
+        self.training_button = ttk.Button(
+            mode_frame,
+            text="🎯 Entraînement : activé" if self.training_mode else "🎯 Entraînement",
+            style='Game.TButton',
+            command=self.toggle_training
+        )
+        self.training_button.pack(side='left', padx=5)
+        self.accent_button = ttk.Button(
+            mode_frame,
+            text=self.get_accent_button_text(),
+            style='Game.TButton',
+            command=self.toggle_accents
+        )
+        self.accent_button.pack(side='left', padx=5)
+        self.text_button = ttk.Button(
+            mode_frame,
+            text=self.get_text_button_text(),
+            style='Game.TButton',
+            command=self.choose_text
+        )
+        self.text_button.pack(side='left', padx=5)
+
+        # Exercices ciblés sur des groupes de lettres
+        drills = self.config_manager.get_game_setting('typer_game', 'drills', {})
+        if drills:
+            drill_frame = ttk.Frame(self.game_container, style='Game.TFrame')
+            drill_frame.pack(pady=5)
+            ttk.Label(drill_frame, text="Exercice :", style='GameScore.TLabel').pack(side='left', padx=5)
+            self.drill_var = tk.StringVar(value=self.drill or "Aucun")
+            drill_box = ttk.Combobox(
+                drill_frame,
+                textvariable=self.drill_var,
+                values=["Aucun"] + list(drills),
+                state='readonly',
+                width=12
+            )
+            drill_box.pack(side='left', padx=5)
+            drill_box.bind(
+                '<<ComboboxSelected>>',
+                lambda e: self.set_drill(None if self.drill_var.get() == "Aucun" else self.drill_var.get())
+            )
+
         # Compteur de mots
         self.counter_label = ttk.Label(
             self.game_container,
@@ -71,14 +362,45 @@ class TyperGame(BaseGame):
         )
         self.counter_label.pack(pady=10)
         
-        # Zone d'affichage du mot
+        # Zone d'affichage du mot : préfixe correct, caractère faux, reste du mot
+        style = ttk.Style()
+        for style_name, color in (('TypedOk.TLabel', 'success'), ('TypedError.TLabel', 'error')):
+            style.configure(
+                style_name,
+                foreground=self.game_colors[color],
+                background=self.game_colors['bg_primary']
+            )
+        word_frame = ttk.Frame(self.game_container, style='Game.TFrame')
+        word_frame.pack(pady=20)
+        self.typed_ok_label = ttk.Label(
+            word_frame,
+            text="",
+            font=('Helvetica', 36, 'bold'),
+            style='TypedOk.TLabel'
+        )
+        self.typed_ok_label.pack(side='left')
+        self.typed_error_label = ttk.Label(
+            word_frame,
+            text="",
+            font=('Helvetica', 36, 'bold'),
+            style='TypedError.TLabel'
+        )
+        self.typed_error_label.pack(side='left')
         self.word_label = ttk.Label(
-            self.game_container,
+            word_frame,
             text="",
             font=('Helvetica', 36, 'bold'),
             style='GameTitle.TLabel'
         )
-        self.word_label.pack(pady=20)
+        self.word_label.pack(side='left')
+
+        # Mots suivants du texte personnalisé
+        self.upcoming_label = ttk.Label(
+            self.game_container,
+            text="",
+            style='GameScore.TLabel'
+        )
+        self.upcoming_label.pack()
         
         # Zone de saisie
         self.entry = ttk.Entry(
@@ -116,25 +438,85 @@ class TyperGame(BaseGame):
         )
         self.accuracy_label.pack(side='right', padx=10)
         
-        # Bind la touche Enter
+        # Bind la touche Enter et le retour visuel à chaque frappe
         self.entry.bind('<Return>', lambda e: self.check_word())
+        self.entry.bind('<KeyPress>', self.on_key_press)
         
-        # Démarre le jeu
+        # Démarre le jeu (avec la liste intégrée si le dictionnaire n'est pas prêt)
         self.next_word()
-        self.start_time = time.time()
+        self.recorder.start()
+        self.poll_words()
         
     def next_word(self):
         """Affiche le prochain mot"""
-        self.current_word = random.choice(self.words)
-        self.word_label.config(text=self.current_word)
+        self.current_word = self.next_text_word() or self.get_sampler().random_word()
         self.entry.delete(0, tk.END)
+        self.tracker.set_target(self.current_word)
+        self.render_progress()
+        upcoming = self.text_source.peek() if self.text_source else []
+        self.upcoming_label.config(text=" ".join(upcoming))
+
+    def on_key_press(self, event):
+        """Horodate la touche à l'appui, puis valide une fois le champ mis à jour"""
+        key = event.char if event.char and event.char.isprintable() else None
+        timestamp_ns = self.recorder.clock() if key else None
+        # Le champ n'insère le caractère qu'après ce binding
+        self.entry.after_idle(self.on_keystroke, key, timestamp_ns)
+
+    def on_keystroke(self, key=None, timestamp_ns=None):
+        """Enregistre la touche pressée et valide la saisie en cours"""
+        if self.tracker.trie is not self.trie:
+            # Première frappe, ou dictionnaire chargé depuis le début du mot
+            typed = self.tracker.typed
+            self.tracker = PrefixTracker(self.trie, fold_word if self.accent_insensitive else None)
+            self.tracker.set_target(self.current_word)
+            self.tracker.update(typed)
+        previous_length = len(self.tracker.typed)
+        # Le contenu du champ ne sert qu'à suivre les corrections (effacement, collage)
+        self.tracker.update(self.entry.get())
+        typed = self.tracker.typed
+        if key is not None:
+            correct = self.tracker.error_index() is None
+            self.recorder.record(key, correct, timestamp_ns)
+            position = len(typed) - 1
+            if (len(typed) > previous_length and position < len(self.current_word)
+                    and self.tracker.correct_length() >= position):
+                previous = self.current_word[position - 1] if position else ""
+                self.error_profile.record_key(self.current_word[position], previous, correct)
+            self.update_typing_stats()
+        self.render_progress()
+        if not self.text_source and not self.tracker.is_known_prefix():
+            self.feedback_label.config(text="Aucun mot ne commence ainsi")
+        elif self.tracker.error_index() is not None:
+            self.feedback_label.config(text="Faute de frappe !")
+        else:
+            self.feedback_label.config(text="")
+
+    def update_typing_stats(self):
+        """Affiche la vitesse glissante et la précision"""
+        self.wpm_label.config(text=f"WPM: {int(self.recorder.rolling_wpm())}")
+        self.accuracy_label.config(text=f"Précision: {self.recorder.accuracy():.0f}%")
+
+    def render_progress(self):
+        """Affiche le préfixe correct et signale le premier caractère faux"""
+        correct = self.tracker.correct_length()
+        word = self.current_word
+        if self.tracker.error_index() is not None and correct < len(word):
+            wrong, rest = word[correct], word[correct + 1:]
+        else:
+            wrong, rest = "", word[correct:]
+        self.typed_ok_label.config(text=word[:correct])
+        self.typed_error_label.config(text=wrong)
+        self.word_label.config(text=rest)
         
     def check_word(self):
         """Vérifie le mot saisi"""
         typed_word = self.entry.get().strip()
         self.words_typed += 1
+        correct = self.words_match(typed_word, self.current_word)
+        self.recorder.word_completed(correct)
         
-        if typed_word == self.current_word:
+        if correct:
             # Points basés sur la longueur du mot
             points = len(typed_word)
             self.update_score(points)
@@ -143,11 +525,13 @@ class TyperGame(BaseGame):
             self.feedback_label.config(text="Incorrect ! 😢")
             
         # Mise à jour des statistiques
-        elapsed_time = time.time() - self.start_time
-        wpm = int((self.words_typed / elapsed_time) * 60)
+        wpm = self.get_current_wpm()
         self.wpm_label.config(text=f"WPM: {wpm}")
         
         if self.words_typed >= self.max_words:
+            # Avance d'abord : le texte reprendra après le dernier mot tapé
+            self.next_word()
+            self.end_round()
             self.show_game_over(f"Terminé ! Vitesse moyenne: {wpm} WPM")
         else:
             self.counter_label.config(text=f"Mot {self.words_typed + 1}/{self.max_words}")
@@ -173,18 +557,31 @@ class TyperGame(BaseGame):
             widget.destroy()
         self.init_game(self.parent)
 
+    def cleanup(self):
+        """Conserve le profil d'erreurs et la position du texte à la fermeture de la fenêtre"""
+        self.error_profile.save_profile()
+        self.close_text()
+
     def get_current_wpm(self):
-        """Calcule le WPM actuel"""
-        if self.start_time is None or self.words_typed == 0:
-            return 0
-        elapsed_time = time.time() - self.start_time
-        return int((self.words_typed / elapsed_time) * 60)
+        """Calcule le WPM actuel (caractères justes / 5 par minute)"""
+        return int(self.recorder.wpm())
+
+    def get_score_variant(self):
+        """Classement selon la source des mots (texte, exercice, entraînement, dictionnaire) et le niveau"""
+        if self.text_source:
+            mode = 'text'
+        elif self.drill:
+            mode = 'drill'
+        elif self.training_mode:
+            mode = 'training'
+        else:
+            mode = 'words'
+        return mode, self.current_mode
 
     def save_score(self):
-        """Sauvegarde le score actuel avec ScoreManager centralisé"""
+        """Sauvegarde le score actuel ; la vitesse est dans le résumé de la partie"""
         try:
-            player_name = f"Joueur (WPM: {self.get_current_wpm()})"
-            super().save_score(player_name)
+            super().save_score(details=self.recorder.summary())
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du score : {e}")
             messagebox.showerror(
@@ -729,6 +729,7 @@ class VirtualPetGame(BaseGame):
             self.draw_pet()
 
     def create_game_widgets(self, parent):
+        self.ensure_subscriptions()
         self.parent = parent
         self.frame = ttk.Frame(parent, padding="10")
         self.frame.pack(expand=True, fill="both")
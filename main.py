@@ -1,9 +1,10 @@
 import os
 import sys
 import time
-from utils.gui_manager import ModernGameApp
-from utils.logger import get_logger
-from utils.config_manager import ConfigManager
+from utils.startup_profiler import start_profiler
+
+# Rapport de démarrage par défaut (clé performance.startup_report de la configuration)
+DEFAULT_STARTUP_REPORT = os.path.join('logs', 'startup_profile.json')
 
 def resource_path(relative_path):
     """Obtient le chemin absolu des ressources, fonctionne en dev et en exe"""
@@ -15,14 +16,62 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
-def main():
-    """Fonction principale de l'application"""
+def finish_startup(app, profiler, logger, exit_after_startup=False):
+    """Appelé au premier événement d'inactivité : écrit le rapport de démarrage"""
+    profiler.mark("first_idle")
+    profiler.finish()
+    budgets = app.config_manager.get_performance_setting('startup_budgets_ms', {})
+    report_path = app.config_manager.get_performance_setting('startup_report', DEFAULT_STARTUP_REPORT)
+    report = profiler.write_report(report_path, budgets)
+    logger.log_performance(
+        "first_idle", report["total_ms"] / 1000,
+        over_budget=profiler.over_budget(budgets)
+    )
+    if exit_after_startup:
+        app.destroy()
+
+def score_command(command, path):
+    """Exporte (--export-scores) ou importe (--import-scores) les scores, sans interface"""
+    from utils.services import get_services
+    scores = get_services().scores
+    try:
+        if command == '--export-scores':
+            stats = scores.export_scores(path)
+            if stats is None:
+                return 1
+            print(f"{stats['records']} scores exportés en {stats['seconds']:.2f} s "
+                  f"({stats['records_per_second']:.0f} scores/s)")
+        else:
+            stats = scores.import_scores(path)
+            if stats is None:
+                return 1
+            print(f"{stats['read']} scores lus en {stats['seconds']:.2f} s "
+                  f"({stats['records_per_second']:.0f} scores/s) : {stats['imported']} importés, "
+                  f"{stats['duplicates']} doublons, {stats['invalid']} invalides, "
+                  f"{stats['ignored']} hors classement")
+        return 0
+    finally:
+        scores.close()
+
+def main(exit_after_startup=False):
+    """Fonction principale de l'application
+
+    Avec `exit_after_startup`, l'application se ferme dès le premier
+    événement d'inactivité, une fois le rapport de démarrage écrit.
+    """
     start_time = time.time()
+    profiler = start_profiler()
+    profiler.install_import_hook()
     
     # Initialisation du logger
-    logger = get_logger()
+    with profiler.phase("logger_init"):
+        from utils.logger import get_logger
+        logger = get_logger()
     
     try:
+        with profiler.phase("imports"):
+            from utils.gui_manager import ModernGameApp
+        
         # Configuration des chemins des ressources
         os.environ['GAME_ASSETS'] = resource_path('assets')
         
@@ -35,6 +84,7 @@ def main():
         # Log du temps de démarrage
         startup_time = time.time() - start_time
         logger.log_performance("application_startup", startup_time)
+        app.after_idle(lambda: finish_startup(app, profiler, logger, exit_after_startup))
         
         # Lancement de la boucle principale
         app.mainloop()
@@ -45,8 +95,17 @@ def main():
         sys.exit(1)
     
     finally:
+        profiler.finish()
+        # Écriture des scores encore en attente
+        from utils.services import get_services
+        services = get_services()
+        if services.is_created("scores"):
+            services.scores.close()
         # Log de l'arrêt
         logger.log_shutdown("normal")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] in ('--export-scores', '--import-scores'):
+        sys.exit(score_command(*args))
+    main(exit_after_startup='--startup-profile' in args)
@@ -0,0 +1,66 @@
+import unittest
+import os
+import sys
+from types import SimpleNamespace
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from games.game_manager import GAME_REGISTRY, GameDescriptor, GameManager, dictionary_status
+
+
+class TestGameManager(unittest.TestCase):
+    """Tests pour le registre paresseux des jeux"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.created = []
+
+        def factory():
+            game = object()
+            self.created.append(game)
+            return game
+
+        self.manager = GameManager([
+            GameDescriptor("demo", "Démo", "games.demo", "DemoGame", "Jeu de test", factory=factory),
+            GameDescriptor("absent", "Absent", "games.module_absent", "AbsentGame"),
+        ])
+
+    def test_descriptors_do_not_build_games(self):
+        """Test de l'affichage des métadonnées sans construire de jeu"""
+        names = [descriptor.name for descriptor in self.manager.get_all_descriptors()]
+        self.assertEqual(names, ["Démo", "Absent"])
+        self.assertEqual(self.created, [])
+        self.assertFalse(self.manager.is_loaded("demo"))
+        self.assertIsNone(self.manager.get_loaded_game("demo"))
+
+    def test_game_built_once_on_demand(self):
+        """Test de la construction au premier lancement seulement"""
+        game = self.manager.get_game("demo")
+        self.assertIs(self.manager.get_game("demo"), game)
+        self.assertEqual(len(self.created), 1)
+        self.assertIsNone(self.manager.get_game("inconnu"))
+        with self.assertRaises(ImportError):
+            self.manager.get_game("absent")
+
+    def test_card_status_without_game(self):
+        """Test du statut de carte lu dans les services, sans construire le jeu"""
+        loading = {"words": True}
+        services = SimpleNamespace(words=SimpleNamespace(is_loading=lambda: loading["words"]))
+        descriptor = GameDescriptor("demo", "Démo", "games.demo", "DemoGame", status=dictionary_status)
+        self.assertIn("Chargement", descriptor.get_status_text(services))
+        loading["words"] = False
+        self.assertEqual(descriptor.get_status_text(services), "")
+        self.assertEqual(self.manager.get_descriptor("demo").get_status_text(services), "")
+        self.assertIsNone(descriptor.factory)
+
+    def test_registry(self):
+        """Test du registre par défaut : identifiants uniques, modules non importés"""
+        ids = [descriptor.game_id for descriptor in GAME_REGISTRY]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertIn("typer_game", ids)
+        self.assertEqual(GameManager().get_descriptor("typer_game").class_name, "TyperGame")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
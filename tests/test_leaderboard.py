@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import random
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.leaderboard import Leaderboard, ScoreDistribution
+
+
+def entry(entry_id, score):
+    return {"id": entry_id, "player": f"P{entry_id}", "score": score}
+
+
+class TestLeaderboard(unittest.TestCase):
+    """Tests du classement borné"""
+
+    def test_sorted_and_bounded(self):
+        """Test du tri et de la limite, comparés à un tri complet"""
+        rng = random.Random(3)
+        board = Leaderboard(50)
+        inserted = []
+        for i in range(2000):
+            e = entry(str(i), rng.randrange(500))
+            board.insert(e)
+            inserted.append(e)
+        expected = sorted(inserted, key=lambda e: -e["score"])[:50]
+        self.assertEqual(board.entries, expected)
+
+    def test_ties_keep_oldest_first(self):
+        """Test qu'à score égal le plus ancien reste devant"""
+        board = Leaderboard(2)
+        board.insert(entry("a", 10))
+        board.insert(entry("b", 10))
+        self.assertFalse(board.insert(entry("c", 10)))
+        self.assertEqual([e["id"] for e in board], ["a", "b"])
+
+    def test_cutoff(self):
+        """Test du seuil d'entrée d'un classement plein"""
+        board = Leaderboard(3, [entry(str(i), i) for i in range(3)])
+        self.assertEqual(board.cutoff, 0)
+        self.assertFalse(board.qualifies(0))
+        self.assertTrue(board.qualifies(1))
+        self.assertTrue(board.insert(entry("x", 5)))
+        self.assertEqual(board.cutoff, 1)
+        self.assertIsNone(Leaderboard(3).cutoff)
+
+    def test_duplicate_id(self):
+        """Test qu'un même score n'est pas ajouté deux fois"""
+        board = Leaderboard(3)
+        self.assertTrue(board.insert(entry("a", 10)))
+        self.assertFalse(board.insert(entry("a", 10)))
+        self.assertEqual(len(board), 1)
+        # Un score sorti du classement peut y revenir
+        small = Leaderboard(1, [entry("a", 1)])
+        small.insert(entry("b", 2))
+        self.assertTrue(small.insert(entry("a", 3)))
+
+
+
+class TestScoreDistribution(unittest.TestCase):
+    """Tests de la répartition des scores (rang et centile)"""
+
+    def test_rank_and_percentile(self):
+        """Test du rang et du pourcentage de parties battues"""
+        distribution = ScoreDistribution({10: 2, 30: 1, 20: 1})
+        self.assertEqual(len(distribution), 4)
+        self.assertEqual(distribution.rank(30), 1)
+        self.assertEqual(distribution.rank(10), 3)
+        self.assertEqual(distribution.rank(25), 2)
+        self.assertEqual(distribution.percentile(30), 75.0)
+        self.assertEqual(distribution.percentile(10), 0.0)
+        self.assertEqual(ScoreDistribution().percentile(5), 0.0)
+
+    def test_matches_full_sort(self):
+        """Test que la recherche dichotomique donne le même résultat qu'un tri complet"""
+        rng = random.Random(3)
+        distribution = ScoreDistribution()
+        scores = []
+        for _ in range(300):
+            score = rng.randrange(50)
+            distribution.add(score)
+            scores.append(score)
+        for score in range(-1, 52):
+            self.assertEqual(distribution.below(score), sum(1 for s in scores if s < score))
+            self.assertEqual(distribution.rank(score), 1 + sum(1 for s in scores if s > score))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,6 +2,7 @@ import unittest
 import tempfile
 import os
 import json
+import shutil
 from pathlib import Path
 import sys
 
@@ -77,7 +78,12 @@ class TestThemeManager(unittest.TestCase):
     
     def setUp(self):
         """Configuration initiale pour chaque test"""
-        self.theme_manager = ThemeManager()
+        self.temp_dir = tempfile.mkdtemp()
+        self.theme_manager = ThemeManager(os.path.join(self.temp_dir, "user_preferences.json"))
+    
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.temp_dir)
     
     def test_default_theme(self):
         """Test du thème par défaut"""
@@ -131,9 +137,9 @@ class TestScoreManager(unittest.TestCase):
     
     def tearDown(self):
         """Nettoyage après chaque test"""
-        if os.path.exists(self.scores_file):
-            os.remove(self.scores_file)
-        os.rmdir(self.temp_dir)
+        self.score_manager.close()
+        # Le fichier de verrou des scores reste à côté de scores.json
+        shutil.rmtree(self.temp_dir)
     
     def test_save_and_get_score(self):
         """Test de sauvegarde et récupération de scores"""
@@ -179,6 +185,132 @@ class TestScoreManager(unittest.TestCase):
         self.assertEqual(scores1[0]["score"], 100)
         self.assertEqual(scores2[0]["score"], 200)
 
+    def test_leaderboards(self):
+        """Test des classements de plusieurs jeux lus en une fois"""
+        for i in range(4):
+            self.score_manager.save_score("game1", f"Player{i}", i * 10)
+        self.score_manager.save_score("game2", "Player", 5)
+
+        boards = self.score_manager.get_leaderboards(["game1", "game2", "game3"], top_n=2)
+        self.assertEqual(boards["game1"]["count"], 4)
+        self.assertEqual(boards["game1"]["best"]["score"], 30)
+        self.assertEqual([s["score"] for s in boards["game1"]["top"]], [30, 20])
+        self.assertEqual(boards["game2"]["count"], 1)
+        self.assertEqual(boards["game3"], {"count": 0, "best": None, "top": []})
+        self.assertEqual(sorted(self.score_manager.get_leaderboards()), ["game1", "game2"])
+
+    def test_mode_leaderboards(self):
+        """Test des classements par mode et difficulté"""
+        self.score_manager.save_score("calc", "Joueur", 50, mode="timer")
+        self.score_manager.save_score("calc", "Joueur", 30, mode="lives")
+        self.score_manager.save_score("typer", "Joueur", 40, mode="words", difficulty="hard")
+        self.score_manager.save_score("typer", "Joueur", 60, mode="words", difficulty="easy")
+
+        self.assertEqual([s["score"] for s in self.score_manager.get_scores("calc")], [50, 30])
+        self.assertEqual([s["score"] for s in self.score_manager.get_scores("calc", "lives")], [30])
+        self.assertEqual(self.score_manager.get_high_score("typer", "words", "hard")["score"], 40)
+        self.assertEqual(self.score_manager.get_high_score("typer", "words")["score"], 60)
+        self.assertEqual(self.score_manager.count_scores("typer", "words", "easy"), 1)
+
+        # Relus depuis le disque, les classements sont identiques
+        self.score_manager.close()
+        reader = ScoreManager(self.scores_file)
+        self.assertEqual(reader.get_high_score("calc", "timer")["mode"], "timer")
+        self.assertEqual([s["score"] for s in reader.get_scores("typer", "words", "hard")], [40])
+
+    def test_below_cutoff_not_written(self):
+        """Test qu'un score sous le seuil du classement n'est pas écrit"""
+        for i in range(10):
+            self.score_manager.save_score("test_game", f"Player{i}", 100 + i)
+        self.score_manager.flush()
+        journal = self.score_manager.storage.shard("test_game").journal_file
+        size = os.path.getsize(journal)
+
+        self.score_manager.save_score("test_game", "Faible", 5)
+        self.assertEqual(self.score_manager._pending, [])
+        self.score_manager.flush()
+        self.assertEqual(os.path.getsize(journal), size)
+
+    def test_score_rank(self):
+        """Test du rang d'un score parmi toutes les parties, même hors classement"""
+        self.score_manager.max_scores = 3
+        for score in [10, 20, 30, 40, 50, 5, 5]:
+            self.score_manager.save_score("test_game", "Player", score, mode="timer")
+        rank = self.score_manager.get_score_rank("test_game", 30)
+        self.assertEqual((rank["rank"], rank["total"]), (3, 7))
+        self.assertAlmostEqual(rank["percentile"], 100 * 4 / 7)
+        self.assertEqual(self.score_manager.get_score_rank("test_game", 60, "timer")["rank"], 1)
+        self.assertEqual(self.score_manager.get_score_rank("autre", 10)["total"], 0)
+
+        # Les parties sont relues par un autre gestionnaire, puis complétées
+        self.score_manager.flush()
+        reader = ScoreManager(self.scores_file, flush_delay=0)
+        self.assertEqual(reader.get_score_rank("test_game", 30)["total"], 7)
+        self.score_manager.save_score("test_game", "Player", 1)
+        self.score_manager.flush()
+        self.assertEqual(reader.get_score_rank("test_game", 30)["total"], 8)
+        reader.close()
+
+    def test_window_scores(self):
+        """Test des classements du jour, de la semaine et du mois"""
+        self.score_manager.max_scores = 2
+        self.score_manager.save_score("test_game", "Ancien", 100)
+        self.score_manager.save_score("test_game", "Ancien", 90)
+        # Sous le seuil du classement général, mais dans ceux des périodes en cours
+        self.score_manager.save_score("test_game", "Player", 5, mode="timer")
+        for window in ("day", "week", "month"):
+            scores = self.score_manager.get_window_scores("test_game", window)
+            self.assertEqual([s["score"] for s in scores], [100, 90])
+        self.assertEqual([s["score"] for s in self.score_manager.get_window_scores("test_game", "day", "timer")], [5])
+        self.assertEqual(len(self.score_manager.get_window_scores("test_game", "all")), 2)
+        self.assertEqual(self.score_manager.get_window_scores("autre", "week"), [])
+        with self.assertRaises(ValueError):
+            self.score_manager.get_window_scores("test_game", "year")
+
+        # Le score est écrit, et relu dans les classements des périodes
+        self.score_manager.close()
+        reader = ScoreManager(self.scores_file, max_scores=2)
+        self.assertEqual([s["score"] for s in reader.get_window_scores("test_game", "month", "timer")], [5])
+        reader.close()
+
+    def test_write_behind(self):
+        """Test de l'écriture différée : rien sur disque avant flush()"""
+        self.score_manager.save_score("test_game", "Player1", 100)
+        self.score_manager.save_score("test_game", "Player2", 50)
+        journal = self.score_manager.storage.shard("test_game").journal_file
+        self.assertFalse(os.path.exists(journal))
+
+        # flush() ajoute au journal, relu par un nouveau gestionnaire
+        self.score_manager.flush()
+        reader = ScoreManager(self.scores_file)
+        self.assertEqual([s["score"] for s in reader.get_scores("test_game")], [100, 50])
+
+        # close() replie le journal dans l'instantané
+        self.score_manager.close()
+        self.assertFalse(os.path.exists(journal))
+        with open(self.score_manager.get_scores_file("test_game")) as f:
+            on_disk = json.load(f)
+        self.assertEqual([s["score"] for s in on_disk["test_game"]], [100, 50])
+
+    def test_reload_when_file_changes(self):
+        """Test de l'invalidation du cache quand les fichiers changent"""
+        self.score_manager.check_interval = 0
+        self.assertIsNone(self.score_manager.get_high_score("test_game"))
+
+        # Un autre processus écrit un score
+        other = ScoreManager(self.scores_file, flush_delay=0)
+        other.save_score("test_game", "Other", 300)
+        self.assertEqual(self.score_manager.get_high_score("test_game")["player"], "Other")
+
+        # Les scores en attente sont fusionnés avec ceux des autres processus
+        self.score_manager.save_score("test_game", "Player1", 100)
+        other.save_score("test_game", "Other", 200)
+        other.compact()
+        self.score_manager.close()
+        with open(self.score_manager.get_scores_file("test_game")) as f:
+            on_disk = json.load(f)
+        self.assertEqual([s["score"] for s in on_disk["test_game"]], [300, 200, 100])
+
 class TestStatsManager(unittest.TestCase):
     """Tests pour le gestionnaire de statistiques"""
     
@@ -234,6 +366,22 @@ class TestStatsManager(unittest.TestCase):
         self.assertEqual(first_achievement["id"], "first_game")
         self.assertEqual(first_achievement["name"], "Premier Pas")
         self.assertTrue(first_achievement["unlocked"])
+    
+    def test_charts_not_imported_at_startup(self):
+        """Test de l'import différé des graphiques (matplotlib, numpy)"""
+        import subprocess
+        code = (
+            "import sys, utils.stats_manager as sm; "
+            "print(sorted(m for m in ('matplotlib', 'numpy', 'utils.stats_charts') if m in sys.modules), "
+            "sm.stats_manager)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.join(os.path.dirname(__file__), '..'),
+            capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[] None")
 
 class TestI18nManager(unittest.TestCase):
     """Tests pour le gestionnaire d'internationalisation"""
@@ -259,7 +407,7 @@ class TestI18nManager(unittest.TestCase):
         with open(os.path.join(self.translations_dir, "en.json"), 'w', encoding='utf-8') as f:
             json.dump(test_translations, f)
         
-        self.i18n = I18nManager()
+        self.i18n = I18nManager(translations_dir=self.translations_dir)
         self.i18n.translations = {"en": test_translations}
         self.i18n.current_language = "en"
     
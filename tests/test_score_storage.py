@@ -0,0 +1,527 @@
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.score_stress import run_stress
+from utils.score_manager import ScoreManager
+from utils.score_storage import CHANGED_FULL, CHANGED_TAIL, RunCounter, ScoreJournal, ShardedScoreStore, SqliteScoreStore, insert_score, to_json, build_boards
+from utils.score_storage import current_periods, evict_expired, period_of
+
+
+# Classement général du jeu de test
+GAME = ("game", None, None)
+
+
+def entry(entry_id, score, player="Joueur", **fields):
+    return dict({"id": entry_id, "player": player, "score": score}, **fields)
+
+
+class TestWindowBoards(unittest.TestCase):
+    """Tests des classements du jour, de la semaine et du mois"""
+
+    NOW = datetime(2026, 10, 17, 15, 0)
+
+    def test_periods(self):
+        """Test des périodes de chaque fenêtre"""
+        self.assertEqual(current_periods(self.NOW), {"day": "2026-10-17", "week": "2026-W42", "month": "2026-10"})
+        # Semaine ISO : le 1er janvier 2027 (vendredi) est dans la semaine 53 de 2026
+        self.assertEqual(period_of("week", datetime(2027, 1, 1)), "2026-W53")
+
+    def test_insert_and_evict(self):
+        """Test des classements périodiques tenus à jour à l'insertion puis retirés"""
+        periods = current_periods(self.NOW)
+        scores = {}
+        yesterday = (self.NOW - timedelta(days=1)).isoformat()
+        insert_score(scores, "game", entry("a", 50, date=yesterday), 2, periods)
+        insert_score(scores, "game", entry("b", 10, date=self.NOW.isoformat(), mode="timer"), 2, periods)
+        insert_score(scores, "game", entry("c", 5, date="2025-01-01T00:00:00"), 2, periods)
+        self.assertEqual([e["id"] for e in scores[("game", None, None, "2026-10-17")]], ["b"])
+        self.assertEqual([e["id"] for e in scores[("game", None, None, "2026-W42")]], ["a", "b"])
+        self.assertEqual([e["id"] for e in scores[("game", "timer", None, "2026-10")]], ["b"])
+        # Le score de 2025, hors des classements périodiques, est sorti du classement général
+        self.assertEqual([e["id"] for e in scores[GAME]], ["a", "b"])
+        # Les scores des périodes en cours sont gardés dans l'instantané
+        self.assertEqual(set(e["id"] for e in to_json(scores)["game"]), {"a", "b"})
+
+        next_periods = current_periods(self.NOW + timedelta(days=1))
+        self.assertEqual(evict_expired(scores, next_periods), 2)  # Jour, et jour du mode timer
+        self.assertNotIn(("game", None, None, "2026-10-17"), scores)
+        self.assertIn(("game", None, None, "2026-W42"), scores)
+
+
+class TestScoreJournal(unittest.TestCase):
+    """Tests du journal des scores"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.snapshot = os.path.join(self.test_dir, "scores.json")
+        self.journal = ScoreJournal(self.snapshot)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_insert_score(self):
+        """Test de l'insertion triée, limitée et sans doublon"""
+        scores = {}
+        for i in range(5):
+            insert_score(scores, "game", entry(str(i), i * 10), limit=3)
+        self.assertEqual([e["score"] for e in scores[GAME]], [40, 30, 20])
+        self.assertFalse(insert_score(scores, "game", entry("4", 40), limit=3))
+        self.assertEqual(len(scores[GAME]), 3)
+
+    def test_board_keys(self):
+        """Test des classements par mode et par difficulté"""
+        scores = {}
+        insert_score(scores, "game", entry("a", 10, mode="timer", difficulty="hard"))
+        insert_score(scores, "game", entry("b", 20, mode="timer"))
+        insert_score(scores, "game", entry("c", 30, mode="lives"))
+        self.assertEqual([e["id"] for e in scores[GAME]], ["c", "b", "a"])
+        self.assertEqual([e["id"] for e in scores[("game", "timer", None)]], ["b", "a"])
+        self.assertEqual([e["id"] for e in scores[("game", "timer", "hard")]], ["a"])
+
+        # L'instantané garde de quoi reconstruire chaque classement
+        small = {}
+        for i in range(5):
+            insert_score(small, "game", entry(f"t{i}", 100 + i, mode="timer"), limit=3)
+        insert_score(small, "game", entry("l", 1, mode="lives"), limit=3)
+        rebuilt = build_boards(to_json(small), limit=3)
+        self.assertEqual(set(rebuilt), set(small))
+        self.assertEqual([e["id"] for e in rebuilt[("game", "lives", None)]], ["l"])
+
+    def test_append_and_replay(self):
+        """Test de l'ajout au journal et de sa relecture"""
+        self.journal.append([("game", entry("a", 10)), ("game", entry("b", 30))])
+        scores = ScoreJournal(self.snapshot).load()
+        self.assertEqual([e["id"] for e in scores[GAME]], ["b", "a"])
+
+    def test_torn_last_line(self):
+        """Test d'une dernière ligne tronquée par un arrêt brutal"""
+        self.journal.append([("game", entry("a", 10))])
+        with open(self.journal.journal_file, "ab") as f:
+            f.write(b'{"game": "game", "entry": {"id": "b", "sc')
+
+        reader = ScoreJournal(self.snapshot)
+        self.assertEqual([e["id"] for e in reader.load()[GAME]], ["a"])
+
+        # L'ajout suivant ne se colle pas à la ligne tronquée
+        reader.append([("game", entry("c", 20))])
+        scores = ScoreJournal(self.snapshot).load()
+        self.assertEqual([e["id"] for e in scores[GAME]], ["c", "a"])
+
+    def test_compact(self):
+        """Test du compactage : instantané réécrit, journal supprimé"""
+        self.journal.append([("game", entry("a", 10))])
+        scores = self.journal.load()
+        self.journal.compact(scores)
+
+        self.assertFalse(os.path.exists(self.journal.journal_file))
+        with open(self.snapshot) as f:
+            self.assertEqual(json.load(f), to_json(scores))
+        self.assertEqual(to_json(ScoreJournal(self.snapshot).load()), to_json(scores))
+
+    def test_interrupted_compaction(self):
+        """Test d'un compactage interrompu avant la suppression du journal"""
+        records = [("game", entry(str(i), i)) for i in range(15)]
+        self.journal.append(records)
+        scores = self.journal.load()
+        # Instantané écrit, mais le journal n'a pas été supprimé
+        with open(self.snapshot, "w") as f:
+            json.dump(to_json(scores), f)
+
+        replayed = ScoreJournal(self.snapshot).load()
+        self.assertEqual(to_json(replayed), to_json(scores))
+        self.assertEqual(len(replayed[GAME]), 10)
+
+    def test_changes(self):
+        """Test de la détection des changements"""
+        self.journal.load()
+        self.assertIsNone(self.journal.changes())
+
+        other = ScoreJournal(self.snapshot)
+        other.append([("game", entry("a", 10))])
+        self.assertEqual(self.journal.changes(), CHANGED_TAIL)
+        scores = {}
+        self.assertEqual(self.journal.replay_tail(scores), 1)
+        self.assertIsNone(self.journal.changes())
+
+        other.compact(scores)
+        self.assertEqual(self.journal.changes(), CHANGED_FULL)
+
+
+class TestShardedScoreStore(unittest.TestCase):
+    """Tests des fichiers de scores par jeu et de leur manifeste"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.scores_dir = os.path.join(self.test_dir, "scores")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_migrate_legacy_file(self):
+        """Test de la répartition d'un ancien scores.json dans les fichiers des jeux"""
+        legacy = os.path.join(self.test_dir, "scores.json")
+        with open(legacy, "w") as f:
+            json.dump({"game": [entry("a", 10)], "other": [entry("b", 7)]}, f)
+        journal = ScoreJournal(legacy)
+        journal.append([("game", entry("c", 20))])
+
+        store = ShardedScoreStore(self.scores_dir, legacy_file=legacy)
+        self.assertEqual(set(store.games()), {"game", "other"})
+        self.assertEqual(store.summary()["game"], {"count": 2, "best": entry("c", 20)})
+        self.assertEqual([e["id"] for e in store.load("game")[GAME]], ["c", "a"])
+        self.assertTrue(os.path.exists(store.shard_file("other")))
+        # L'ancien fichier reste en place, mais n'est plus relu
+        self.assertTrue(os.path.exists(legacy))
+        store.append("other", [entry("d", 1)], build_boards({"other": [entry("b", 7), entry("d", 1)]}))
+        self.assertEqual(ShardedScoreStore(self.scores_dir, legacy_file=legacy).summary()["other"]["count"], 2)
+
+    def test_legacy_player_suffixes(self):
+        """Test de l'ancien format où le mode ou la vitesse étaient dans le nom du joueur"""
+        legacy = os.path.join(self.test_dir, "scores.json")
+        with open(legacy, "w") as f:
+            json.dump({
+                "mental_calc": [{"player": "Joueur (timer)", "score": 170}],
+                "typer_game": [{"player": "Joueur (WPM: 35)", "score": 40}],
+                "number_guess": [{"player": "Joueur (timer)", "score": 3}],
+            }, f)
+
+        manager = ScoreManager(legacy, scores_dir=self.scores_dir)
+        self.assertEqual(manager.get_scores("mental_calc", "timer"), [{"player": "Joueur", "score": 170, "mode": "timer"}])
+        self.assertEqual(manager.get_high_score("typer_game"),
+                         {"player": "Joueur", "score": 40, "details": {"wpm": 35.0}})
+        # Les autres jeux ne sont pas concernés
+        self.assertEqual(manager.get_high_score("number_guess")["player"], "Joueur (timer)")
+        manager.close()
+
+    def test_append_touches_only_its_game(self):
+        """Test qu'un score n'écrit que dans les fichiers de son jeu"""
+        store = ShardedScoreStore(self.scores_dir)
+        scores = {}
+        insert_score(scores, "game", entry("a", 10))
+        store.append("game", [entry("a", 10)], scores)
+        self.assertEqual(sorted(name for name in os.listdir(self.scores_dir) if not name.endswith(".lock")),
+                         ["game_scores.journal", "manifest.json"])
+        self.assertEqual(store.summary(), {"game": {"count": 1, "best": entry("a", 10)}})
+
+    def test_manifest_rebuilt(self):
+        """Test de la reconstruction du manifeste à partir des fichiers des jeux"""
+        store = ShardedScoreStore(self.scores_dir)
+        scores = build_boards({"game": [entry("a", 10), entry("b", 30)]})
+        store.compact("game", scores)
+        self.assertEqual(store.summary()["game"]["best"], entry("b", 30))
+        os.remove(store.manifest_file)
+        other = ShardedScoreStore(self.scores_dir)
+        self.assertEqual(other.summary(), {"game": {"count": 2, "best": entry("b", 30)}})
+        self.assertTrue(os.path.exists(other.manifest_file))
+
+    def test_menu_reads_manifest_only(self):
+        """Test que les classements des menus ne chargent aucun jeu"""
+        writer = ScoreManager(os.path.join(self.test_dir, "scores.json"), flush_delay=0)
+        writer.save_score("game", "P", 10)
+        writer.save_score("game", "Q", 40)
+        writer.close()
+
+        reader = ScoreManager(os.path.join(self.test_dir, "scores.json"))
+        boards = reader.get_leaderboards(top_n=0)
+        self.assertEqual(boards["game"]["count"], 2)
+        self.assertEqual(boards["game"]["best"]["player"], "Q")
+        self.assertEqual(reader._scores, {})
+        reader.close()
+
+
+class TestRunCounter(unittest.TestCase):
+    """Tests du comptage des parties, hors classement compris"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.runs_file = os.path.join(self.test_dir, "game_runs.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def runs(self, first, count):
+        return [entry(str(i), i % 7, player=f"P{i}", date=f"2024-01-01T00:00:{i:02d}") for i in range(first, first + count)]
+
+    def test_append_and_compact(self):
+        """Test du journal en ajout seul, replié dans l'instantané et l'index"""
+        counter = RunCounter(self.runs_file, "game")
+        counter.COMPACT_RUNS = 8
+        counter.append(self.runs(0, 5))
+        self.assertFalse(os.path.exists(self.runs_file))
+        self.assertEqual(sum(counter.counts()[GAME].values()), 5)
+        counter.append(self.runs(5, 5))
+        # Compacté : instantané et index, plus de journal
+        self.assertFalse(counter.has_journal())
+        self.assertEqual(os.path.getsize(counter.index_file), 8 * 10)
+        counter.append(self.runs(10, 2))
+
+        reader = RunCounter(self.runs_file, "game")
+        self.assertEqual(sum(reader.counts()[GAME].values()), 12)
+        self.assertEqual(reader.counts()[GAME][0], 2)
+        self.assertEqual(reader.counted(self.runs(8, 6)), [True] * 4 + [False] * 2)
+
+    def test_interrupted_compaction(self):
+        """Test qu'un journal encore présent après le compactage n'est pas recompté"""
+        counter = RunCounter(self.runs_file, "game")
+        counter.append(self.runs(0, 3))
+        with open(counter.journal_file, 'rb') as f:
+            journal = f.read()
+        counter.compact()
+        with open(counter.journal_file, 'wb') as f:
+            f.write(journal)
+        counter.append(self.runs(3, 1))
+        self.assertEqual(sum(RunCounter(self.runs_file, "game").counts()[GAME].values()), 4)
+
+    def test_seeded_from_kept_scores(self):
+        """Test des scores gardés avant l'ajout du comptage des parties"""
+        kept = self.runs(0, 2)
+        counter = RunCounter(self.runs_file, "game", seed=lambda: kept)
+        self.assertEqual(counter.counted(kept + self.runs(2, 1)), [True, True, False])
+        counter.append(self.runs(2, 1))
+        self.assertEqual(sum(RunCounter(self.runs_file, "game").counts()[GAME].values()), 3)
+
+
+class TestSqliteScoreStore(unittest.TestCase):
+    """Tests du stockage SQLite des scores"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.database = os.path.join(self.test_dir, "scores.db")
+        self.store = SqliteScoreStore(self.database, limit=3)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_full_history(self):
+        """Test de l'historique complet et des requêtes indexées"""
+        self.store.append("game", [entry(str(i), i * 10, f"P{i % 2}") for i in range(6)])
+        self.store.append("other", [entry("x", 5)])
+
+        self.assertEqual(self.store.count("game"), 6)
+        self.assertEqual([e["score"] for e in self.store.top("game", limit=10)], [50, 40, 30, 20, 10, 0])
+        self.assertEqual(self.store.best("game", "P0")["score"], 40)
+        self.assertIsNone(self.store.best("game", "Personne"))
+        # Le cache ne reçoit que les `limit` meilleurs de chaque jeu
+        loaded = self.store.load("game")
+        self.assertEqual(set(loaded), {GAME})
+        self.assertEqual(set(self.store.games()), {"game", "other"})
+        self.assertEqual(self.store.summary()["other"], {"count": 1, "best": entry("x", 5)})
+        self.assertEqual([e["score"] for e in loaded[GAME]], [50, 40, 30])
+
+    def test_mode_and_difficulty(self):
+        """Test des classements par mode et difficulté en SQLite"""
+        self.store.append("game", [
+            entry("a", 10, mode="timer", difficulty="hard"),
+            entry("b", 20, "P1", mode="timer", difficulty="easy"),
+            entry("c", 30, "P1", mode="lives"),
+        ])
+        self.assertEqual([e["id"] for e in self.store.top("game", "timer", limit=10)], ["b", "a"])
+        self.assertEqual([e["id"] for e in self.store.top("game", "timer", "hard", limit=10)], ["a"])
+        self.assertEqual(self.store.count("game"), 3)
+        self.assertEqual(self.store.count("game", "timer"), 2)
+        self.assertEqual(self.store.count("game", "timer", "easy"), 1)
+        self.assertEqual(self.store.best("game", "P1", "timer")["id"], "b")
+        loaded = self.store.load("game")
+        self.assertEqual(loaded[("game", "timer", "hard")][0]["difficulty"], "hard")
+        self.assertIn(("game", "lives", None), loaded)
+
+    def test_migrate_version_1(self):
+        """Test de la mise à jour d'une base sans mode ni difficulté"""
+        path = os.path.join(self.test_dir, "v1.db")
+        connection = sqlite3.connect(path)
+        connection.executescript("""
+            CREATE TABLE scores (id TEXT PRIMARY KEY, game_id TEXT NOT NULL, player TEXT NOT NULL,
+                                 score NUMERIC NOT NULL, date TEXT, details TEXT);
+            CREATE TABLE score_counts (game_id TEXT PRIMARY KEY, count INTEGER NOT NULL);
+            INSERT INTO scores VALUES ('a', 'game', 'P', 10, NULL, NULL);
+            INSERT INTO scores VALUES ('m', 'mental_calc', 'Joueur (lives)', 12, NULL, NULL);
+            INSERT INTO scores VALUES ('t', 'typer_game', 'Joueur (WPM: 48)', 30, NULL, NULL);
+            INSERT INTO score_counts VALUES ('game', 1);
+        """)
+        connection.close()
+
+        store = SqliteScoreStore(path)
+        self.assertEqual(store.count("game"), 1)
+        # Le mode ou la vitesse ajoutés au nom des anciens scores en sont retirés
+        self.assertEqual(store.top("mental_calc", "lives")[0]["player"], "Joueur")
+        self.assertEqual(store.count("mental_calc", "lives"), 1)
+        legacy_typing = store.top("typer_game")[0]
+        self.assertEqual((legacy_typing["player"], legacy_typing["details"]), ("Joueur", {"wpm": 48.0}))
+        store.append("game", [entry("b", 5, mode="timer")])
+        self.assertEqual(store.count("game"), 2)
+        self.assertEqual(store.count("game", "timer"), 1)
+        store.close()
+
+    def test_duplicate_ids_ignored(self):
+        """Test qu'un score déjà enregistré n'est pas compté deux fois"""
+        self.store.append("game", [entry("a", 10)])
+        self.store.append("game", [entry("a", 10)])
+        self.assertEqual(self.store.count("game"), 1)
+
+    def test_changes_from_other_connection(self):
+        """Test de la détection des écritures d'une autre connexion"""
+        self.store.load("game")
+        self.assertIsNone(self.store.changes("game"))
+        other = SqliteScoreStore(self.database)
+        other.append("game", [entry("a", 10)])
+        other.close()
+        self.assertEqual(self.store.changes("game"), CHANGED_FULL)
+
+    def test_score_manager_backend(self):
+        """Test du gestionnaire de scores avec le stockage SQLite"""
+        scores_file = os.path.join(self.test_dir, "scores.json")
+        with open(scores_file, "w") as f:
+            json.dump({"game": [{"player": "Ancien", "score": 500}]}, f)
+
+        manager = ScoreManager(scores_file, flush_delay=0, backend="sqlite",
+                               database_file=os.path.join(self.test_dir, "manager.db"))
+        for i in range(12):
+            manager.save_score("game", f"P{i}", i)
+        # Les scores de scores.json sont repris, et rien n'est tronqué à 10
+        self.assertEqual(manager.get_high_score("game")["player"], "Ancien")
+        self.assertEqual(len(manager.get_scores("game")), 10)
+        self.assertEqual(len(manager.get_top_scores("game", 20)), 13)
+        self.assertEqual(manager.count_scores("game"), 13)
+        self.assertEqual(manager.get_personal_best("game", "P3")["score"], 3)
+        # Le rang porte sur tout l'historique de la base
+        rank = manager.get_score_rank("game", 6)
+        self.assertEqual((rank["rank"], rank["total"]), (7, 13))
+        self.assertAlmostEqual(rank["percentile"], 100 * 6 / 13)
+        manager.save_score("game", "P", 100)
+        self.assertEqual(manager.get_score_rank("game", 6)["rank"], 8)
+        manager.close()
+
+    def test_window_scores_sqlite(self):
+        """Test des classements périodiques relus depuis la base"""
+        old = (datetime.now() - timedelta(days=400)).isoformat(timespec='seconds')
+        self.store.append("game", [entry(str(i), 100 + i, date=old) for i in range(3)])
+        self.store.close()
+        manager = ScoreManager(os.path.join(self.test_dir, "scores.json"), flush_delay=0, backend="sqlite",
+                               database_file=self.database, max_scores=3)
+        manager.save_score("game", "Nouveau", 1)
+        manager.close()
+
+        reader = ScoreManager(os.path.join(self.test_dir, "scores.json"), backend="sqlite",
+                              database_file=self.database, max_scores=3)
+        self.assertEqual([e["player"] for e in reader.get_window_scores("game", "day")], ["Nouveau"])
+        self.assertEqual(len(reader.get_window_scores("game", "all")), 3)
+        reader.close()
+        self.store = SqliteScoreStore(self.database)
+
+
+class TestScoreTransfer(unittest.TestCase):
+    """Tests de l'export et de l'import des scores en JSON Lines"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.export_file = os.path.join(self.test_dir, "export.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def open_manager(self, name, backend="sqlite"):
+        return ScoreManager(os.path.join(self.test_dir, name, "scores.json"), flush_delay=0, backend=backend,
+                            database_file=os.path.join(self.test_dir, f"{name}.db"))
+
+    def test_round_trip_sqlite(self):
+        """Test d'un export puis d'un import complet, sans doublons"""
+        source = self.open_manager("source")
+        for i in range(15):
+            source.save_score("game", f"P{i}", i, mode="timer" if i % 2 else None)
+        source.save_score("other", "P", 3, details={"wpm": 40})
+        stats = source.export_scores(self.export_file)
+        self.assertEqual(stats["records"], 16)
+        source.close()
+
+        target = self.open_manager("target")
+        stats = target.import_scores(self.export_file, batch_size=4)
+        self.assertEqual((stats["read"], stats["imported"], stats["duplicates"]), (16, 16, 0))
+        self.assertEqual(target.count_scores("game"), 15)
+        self.assertEqual(target.count_scores("game", "timer"), 7)
+        self.assertEqual(target.get_high_score("other")["details"], {"wpm": 40})
+        # Réimporter le même fichier n'ajoute rien
+        stats = target.import_scores(self.export_file)
+        self.assertEqual((stats["imported"], stats["duplicates"]), (0, 16))
+        self.assertEqual(target.count_scores("game"), 15)
+        target.close()
+
+    def test_reimport_keeps_rank_totals(self):
+        """Test qu'un fichier importé deux fois ne compte pas deux fois ses parties"""
+        with open(self.export_file, "w") as f:
+            for i in range(10):
+                f.write(json.dumps({"game": "game", "player": f"P{i}", "score": 10 - i,
+                                    "date": f"2025-01-{i + 1:02d}T12:00:00"}) + "\n")
+
+        manager = ScoreManager(os.path.join(self.test_dir, "json", "scores.json"), flush_delay=0, max_scores=3)
+        stats = manager.import_scores(self.export_file)
+        self.assertEqual((stats["imported"], stats["ignored"]), (3, 7))
+        self.assertEqual(manager.get_score_rank("game", 5)["total"], 10)
+        stats = manager.import_scores(self.export_file)
+        self.assertEqual((stats["imported"], stats["duplicates"], stats["ignored"]), (0, 10, 0))
+        self.assertEqual(manager.get_score_rank("game", 5)["total"], 10)
+        manager.close()
+
+        # Les parties déjà comptées sont retrouvées par un nouveau gestionnaire
+        manager = ScoreManager(os.path.join(self.test_dir, "json", "scores.json"), flush_delay=0, max_scores=3)
+        self.assertEqual(manager.import_scores(self.export_file)["duplicates"], 10)
+        self.assertEqual(manager.get_score_rank("game", 5)["total"], 10)
+        manager.close()
+
+    def test_invalid_and_duplicate_lines(self):
+        """Test de la validation et du dédoublonnage des lignes importées"""
+        lines = [
+            {"game": "game", "player": "A", "score": 10, "date": "2026-01-02T03:04:05"},
+            {"game": "game", "player": "A", "score": 10, "date": "2026-01-02T03:04:05", "id": "autre"},
+            {"game": "game", "player": "B", "score": "beaucoup"},
+            {"game": "", "player": "C", "score": 1},
+            {"game": "game", "player": "D", "score": 5, "date": "hier"},
+            {"game": "game", "player": "E", "score": 7},
+        ]
+        with open(self.export_file, "w") as f:
+            for line in lines:
+                f.write(json.dumps(line) + "\n")
+            f.write("{pas du json\n")
+
+        manager = self.open_manager("target", backend="json")
+        stats = manager.import_scores(self.export_file)
+        self.assertEqual((stats["read"], stats["imported"], stats["duplicates"], stats["invalid"]), (7, 2, 1, 4))
+        self.assertEqual([s["player"] for s in manager.get_scores("game")], ["A", "E"])
+        self.assertGreater(stats["records_per_second"], 0)
+        manager.close()
+
+
+class TestConcurrentWriters(unittest.TestCase):
+    """Tests d'écritures simultanées par plusieurs processus"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_no_lost_scores_json(self):
+        """Test qu'aucun score n'est perdu avec le journal partagé"""
+        expected, lost, throughput = run_stress(self.test_dir, processes=4, scores=500, batch=10)
+        print(f"\n{expected} scores (json) : {throughput:.0f} scores/s")
+        self.assertEqual(lost, 0)
+
+    def test_no_lost_scores_sqlite(self):
+        """Test qu'aucun score n'est perdu avec la base SQLite partagée"""
+        expected, lost, throughput = run_stress(self.test_dir, processes=4, scores=500, batch=10,
+                                                backend="sqlite")
+        print(f"\n{expected} scores (sqlite) : {throughput:.0f} scores/s")
+        self.assertEqual(lost, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
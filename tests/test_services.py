@@ -0,0 +1,133 @@
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from types import SimpleNamespace
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from games.base_game import BaseGame
+from games.game_manager import GameDescriptor, GameManager
+from utils.config_manager import ConfigManager
+from utils.logger import GameLogger
+from utils.services import ServiceContainer
+from utils.theme_manager import ThemeManager
+
+
+class DemoGame(BaseGame):
+    def init_game(self, game_frame):
+        pass
+
+
+class TestServiceContainer(unittest.TestCase):
+    """Tests pour le conteneur de services partagés"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, "config.json")
+        self.loads = 0
+
+        def make_config():
+            self.loads += 1
+            return ConfigManager(self.config_file)
+
+        def make_theme():
+            return ThemeManager(os.path.join(self.temp_dir, "user_preferences.json"))
+
+        def make_logger():
+            return GameLogger("MiniJeux.tests", log_file=os.path.join(self.temp_dir, "app.log"))
+
+        self.services = ServiceContainer({
+            "config": make_config, "theme": make_theme, "logger": make_logger, "scores": object
+        })
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        if self.services.is_created("logger"):
+            # Le logger est partagé par nom : son fichier suivra le prochain test
+            logger = self.services.logger.logger
+            for handler in list(logger.handlers):
+                handler.close()
+                logger.removeHandler(handler)
+        shutil.rmtree(self.temp_dir)
+
+    def test_services_built_once(self):
+        """Test du partage des gestionnaires entre les jeux"""
+        self.assertFalse(self.services.is_created("config"))
+        first = DemoGame("Démo", "demo", self.services)
+        second = DemoGame("Démo 2", "demo2", self.services)
+        self.assertIs(first.config_manager, second.config_manager)
+        self.assertIs(first.score_manager, second.score_manager)
+        self.assertEqual(self.loads, 1)
+        with self.assertRaises(KeyError):
+            self.services.get("inconnu")
+
+    def test_config_subscriptions(self):
+        """Test de la notification des abonnés d'une clé de configuration"""
+        config = self.services.config
+        received = []
+        config.subscribe('game_settings.typer_game', lambda key, value: received.append((key, value)))
+        config.set_game_setting('typer_game', 'text_prefetch', 8)
+        config.set_theme('dark_purple')
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0], 'game_settings.typer_game.text_prefetch')
+        self.assertEqual(received[0][1]['text_prefetch'], 8)
+
+        config.reset_to_defaults()
+        self.assertEqual(len(received), 2)
+        self.assertIsNone(received[-1][0])
+
+    def test_theme_subscription_updates_games(self):
+        """Test de la mise à jour des couleurs d'un jeu au changement de thème"""
+        game = DemoGame("Démo", "demo", self.services)
+        self.services.theme.set_theme("green_nature")
+        self.assertEqual(game.game_colors['bg_primary'], self.services.theme.get_color('bg_primary'))
+        self.assertEqual(self.services.theme.current_theme, "green_nature")
+
+    def test_reopened_game_follows_theme(self):
+        """Test du réabonnement d'un jeu fermé puis rouvert (même instance)"""
+        manager = GameManager([GameDescriptor("demo", "Démo", "games.demo", "DemoGame",
+                                              factory=lambda: DemoGame("Démo", "demo", self.services))])
+        game = manager.get_game("demo")
+        game._destroy_window()
+        self.services.theme.set_theme("green_nature")
+        self.assertIs(manager.get_game("demo"), game)
+        game.ensure_subscriptions()
+        self.assertEqual(game.game_colors['bg_primary'], self.services.theme.get_color('bg_primary'))
+        self.services.theme.set_theme("dark_purple")
+        self.assertEqual(game.game_colors['bg_primary'], self.services.theme.get_color('bg_primary'))
+        game.ensure_subscriptions()
+        self.assertEqual(len(self.services.theme._subscribers), 1)
+
+    def test_user_data_path(self):
+        """Test du rangement des données utilisateur à côté des scores"""
+        scores_file = os.path.join(self.temp_dir, "scores.json")
+        self.services.register("scores", lambda: SimpleNamespace(scores_file=scores_file))
+        game = DemoGame("Démo", "demo", self.services)
+        self.assertEqual(game.user_data_path("typing_profile.json"),
+                         os.path.join(self.temp_dir, "typing_profile.json"))
+
+    def test_release_subscriptions(self):
+        """Test du désabonnement d'un jeu fermé"""
+        game = DemoGame("Démo", "demo", self.services)
+        other = DemoGame("Démo 2", "demo2", self.services)
+        game.release_subscriptions()
+        self.services.theme.set_theme("green_nature")
+        self.assertNotEqual(game.game_colors['bg_primary'], self.services.theme.get_color('bg_primary'))
+        self.assertEqual(other.game_colors['bg_primary'], self.services.theme.get_color('bg_primary'))
+        self.assertEqual(len(self.services.theme._subscribers), 1)
+
+        config = self.services.config
+        received = []
+        cancel = config.subscribe('game_settings.typer_game', lambda key, value: received.append(key))
+        config.set_game_setting('typer_game', 'text_prefetch', 8)
+        cancel()
+        config.set_game_setting('typer_game', 'text_prefetch', 4)
+        self.assertEqual(len(received), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,119 @@
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+import json
+import importlib
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.startup_profiler import StartupProfiler, get_profiler, start_profiler
+
+
+class FakeClock:
+    """Horloge manuelle : chaque appel à `advance` fait passer le temps"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Tests du chronométrage du démarrage"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.profiler = StartupProfiler(self.clock)
+
+    def tearDown(self):
+        self.profiler.remove_import_hook()
+        shutil.rmtree(self.test_dir)
+
+    def test_phases_and_mark(self):
+        """Test de la mesure des phases et du premier événement d'inactivité"""
+        with self.profiler.phase("tk_init"):
+            self.clock.advance(0.2)
+        self.clock.advance(0.1)
+        with self.profiler.phase("home_screen"):
+            self.clock.advance(0.05)
+        self.profiler.mark("first_idle")
+
+        phases = {p["name"]: p for p in self.profiler.phases}
+        self.assertAlmostEqual(phases["tk_init"]["duration"], 0.2)
+        self.assertAlmostEqual(phases["home_screen"]["start"], 0.3)
+        self.assertAlmostEqual(phases["home_screen"]["duration"], 0.05)
+        self.assertAlmostEqual(phases["first_idle"]["duration"], 0.35)
+
+    def test_finish_stops_recording(self):
+        """Test qu'aucune phase n'est enregistrée après la fin"""
+        self.profiler.finish()
+        with self.profiler.phase("late"):
+            self.clock.advance(1)
+        self.profiler.mark("late_mark")
+        self.assertEqual(self.profiler.phases, [])
+
+    def test_report_and_budgets(self):
+        """Test du rapport et du dépassement des budgets"""
+        with self.profiler.phase("tk_init"):
+            self.clock.advance(0.5)
+        with self.profiler.phase("config_load"):
+            self.clock.advance(0.01)
+        budgets = {"tk_init": 300, "config_load": 50}
+
+        self.assertEqual(self.profiler.over_budget(budgets), ["tk_init"])
+
+        path = os.path.join(self.test_dir, "logs", "startup_profile.json")
+        self.profiler.write_report(path, budgets)
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        phases = {p["name"]: p for p in report["phases"]}
+        self.assertEqual(phases["tk_init"]["duration_ms"], 500.0)
+        self.assertTrue(phases["tk_init"]["over_budget"])
+        self.assertEqual(phases["config_load"]["budget_ms"], 50)
+        self.assertFalse(phases["config_load"]["over_budget"])
+        self.assertEqual(report["total_ms"], 510.0)
+
+    def test_import_hook(self):
+        """Test du chronométrage des imports : temps propre et cumulé"""
+        with open(os.path.join(self.test_dir, "startup_child.py"), "w") as f:
+            f.write("VALUE = 1\n")
+        with open(os.path.join(self.test_dir, "startup_parent.py"), "w") as f:
+            f.write("import startup_child\nVALUE = startup_child.VALUE + 1\n")
+        sys.path.insert(0, self.test_dir)
+        try:
+            self.profiler = StartupProfiler()
+            self.profiler.install_import_hook()
+            module = importlib.import_module("startup_parent")
+            self.profiler.finish()
+        finally:
+            sys.path.remove(self.test_dir)
+            sys.modules.pop("startup_parent", None)
+            sys.modules.pop("startup_child", None)
+
+        self.assertEqual(module.VALUE, 2)
+        # Le module ne garde pas l'enveloppe du chronométrage
+        self.assertNotIn("_TimedLoader", type(module.__loader__).__name__)
+        parent = self.profiler.imports["startup_parent"]
+        child = self.profiler.imports["startup_child"]
+        self.assertGreaterEqual(parent["cumulative"], child["cumulative"])
+        self.assertAlmostEqual(parent["self"], parent["cumulative"] - child["cumulative"])
+        # Le crochet est retiré à la fin
+        self.assertFalse(any(type(f).__name__ == "_ImportTimer" for f in sys.meta_path))
+
+    def test_global_profiler(self):
+        """Test de l'instance globale"""
+        profiler = start_profiler(self.clock)
+        self.assertIs(get_profiler(), profiler)
+        self.assertFalse(profiler.finished)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.text_source import TextProgress, TextStream, iter_tokens
+
+
+class TestTextStream(unittest.TestCase):
+    """Tests pour la lecture paresseuse des textes personnalisés"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.text_file = os.path.join(self.temp_dir, "livre.txt")
+        with open(self.text_file, 'w', encoding='utf-8') as f:
+            f.write("Il était  une\nfois, une forêt\n\ndéjà très ancienne.")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_tokens_across_chunks(self):
+        """Test du découpage avec des morceaux plus petits que les mots"""
+        expected = ["Il", "était", "une", "fois,", "une", "forêt", "déjà", "très", "ancienne."]
+        for chunk_size in (1, 3, 7, 1 << 16):
+            tokens = list(iter_tokens(self.text_file, chunk_size=chunk_size))
+            self.assertEqual([word for word, _, _ in tokens], expected)
+        with open(self.text_file, 'rb') as f:
+            data = f.read()
+        for word, start, end in tokens:
+            self.assertEqual(data[start:end].decode('utf-8'), word)
+
+    def test_oversized_words_skipped(self):
+        """Test de l'abandon des suites d'octets sans espaces trop longues"""
+        with open(self.text_file, 'w', encoding='utf-8') as f:
+            f.write("avant " + "x" * 100 + " milieu " + "y" * 40 + " après")
+        for chunk_size in (1, 7, 16, 1 << 16):
+            tokens = list(iter_tokens(self.text_file, chunk_size=chunk_size, max_word=16))
+            self.assertEqual([word for word, _, _ in tokens], ["avant", "milieu", "après"])
+        with open(self.text_file, 'rb') as f:
+            data = f.read()
+        for word, start, end in tokens:
+            self.assertEqual(data[start:end].decode('utf-8'), word)
+
+    def test_prefetch_and_resume(self):
+        """Test de la lecture d'avance et de la reprise à un offset"""
+        stream = TextStream(self.text_file, prefetch=2, chunk_size=4)
+        self.assertEqual(stream.next_word(), "Il")
+        self.assertEqual(stream.peek(), ["était", "une"])
+        stream.next_word()
+        offset = stream.position
+        stream.close()
+
+        resumed = TextStream(self.text_file, offset)
+        self.assertEqual(resumed.next_word(), "était")
+        while resumed.next_word() is not None:
+            pass
+        resumed.rewind()
+        self.assertEqual(resumed.next_word(), "Il")
+        resumed.close()
+
+    def test_progress_persistence(self):
+        """Test de l'enregistrement de la position entre deux sessions"""
+        progress_file = os.path.join(self.temp_dir, "progress.json")
+        progress = TextProgress(progress_file)
+        stream = progress.open(self.text_file)
+        for _ in range(4):
+            stream.next_word()
+        progress.set_offset(self.text_file, stream.position)
+        progress.save_progress()
+        stream.close()
+
+        stream = TextProgress(progress_file).open(self.text_file)
+        self.assertEqual(stream.next_word(), "fois,")
+        stream.close()
+
+        # Texte modifié : la lecture reprend au début
+        with open(self.text_file, 'a', encoding='utf-8') as f:
+            f.write(" Fin.")
+        self.assertEqual(TextProgress(progress_file).get_offset(self.text_file), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,122 @@
+import unittest
+import tempfile
+import os
+import random
+import sys
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.typing_stats import AdaptiveSampler, AliasTable, ErrorProfile, KeystrokeRecorder
+from utils.word_store import ListWordStore
+
+SECOND = 1_000_000_000
+
+
+class TestKeystrokeRecorder(unittest.TestCase):
+    """Tests pour l'enregistreur de frappes"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.now = 0
+        self.recorder = KeystrokeRecorder(capacity=4, clock=lambda: self.now)
+        self.recorder.start()
+
+    def type_keys(self, keys, correct=True, interval=SECOND // 5):
+        for key in keys:
+            self.now += interval
+            self.recorder.record(key, correct)
+
+    def test_speed_and_accuracy(self):
+        """Test des vitesses brute et nette et de la précision"""
+        self.type_keys("maiso")
+        self.type_keys("x", correct=False)
+        # 6 frappes en 1,2 s, dont 5 justes
+        self.assertAlmostEqual(self.recorder.raw_cpm(), 300.0)
+        self.assertAlmostEqual(self.recorder.net_cpm(), 250.0)
+        self.assertAlmostEqual(self.recorder.wpm(), 50.0)
+        self.assertAlmostEqual(self.recorder.accuracy(), 500 / 6)
+
+    def test_rolling_window(self):
+        """Test de la fenêtre glissante sur les dernières frappes"""
+        self.type_keys("abcd", interval=SECOND)
+        # Fenêtre pleine : 4 frappes justes sur 3 s
+        self.assertAlmostEqual(self.recorder.rolling_wpm(), 16.0)
+        self.type_keys("ef", correct=False, interval=SECOND // 10)
+        # Les deux frappes les plus anciennes sont sorties de la fenêtre
+        self.assertAlmostEqual(self.recorder.rolling_wpm(), 2 * 60 / 1.2 / 5)
+
+    def test_key_latency_and_summary(self):
+        """Test des latences par touche et du résumé de manche"""
+        self.type_keys("a", interval=SECOND // 10)
+        self.type_keys("z", interval=SECOND)
+        self.recorder.word_completed(True)
+        self.assertAlmostEqual(self.recorder.mean_latency_ms("z"), 1000.0)
+        summary = self.recorder.summary()
+        self.assertEqual(summary["keystrokes"], 2)
+        self.assertEqual(summary["errors"], 0)
+        self.assertEqual(summary["words_correct"], 1)
+        self.assertEqual(list(summary["slowest_keys"]), ["z", "a"])
+
+    def test_reset(self):
+        """Test de la remise à zéro"""
+        self.type_keys("abc")
+        self.recorder.reset()
+        self.assertEqual(self.recorder.keystrokes, 0)
+        self.assertEqual(self.recorder.accuracy(), 100.0)
+        self.assertEqual(self.recorder.rolling_wpm(), 0.0)
+
+
+class TestAdaptiveSampling(unittest.TestCase):
+    """Tests pour le profil d'erreurs et le tirage adaptatif"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.profile_file = os.path.join(self.temp_dir, "profile.json")
+        self.profile = ErrorProfile(self.profile_file)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        if os.path.exists(self.profile_file):
+            os.remove(self.profile_file)
+        os.rmdir(self.temp_dir)
+
+    def test_profile_persistence(self):
+        """Test de l'enregistrement et du rechargement du profil"""
+        for _ in range(4):
+            self.profile.record_key("u", "q", False)
+        self.profile.record_key("e", "", True)
+        self.profile.save_profile()
+
+        reloaded = ErrorProfile(self.profile_file)
+        self.assertEqual(reloaded.units["qu"], [4, 4])
+        self.assertEqual(reloaded.units["e"], [1, 0])
+        self.assertEqual(list(reloaded.weak_units()), ["u", "qu"])
+
+    def test_alias_table(self):
+        """Test de la distribution du tirage par alias"""
+        table = AliasTable(["a", "b", "c"], [1, 3, 0])
+        rng = random.Random(7)
+        draws = [table.sample(rng) for _ in range(4000)]
+        self.assertNotIn("c", draws)
+        self.assertAlmostEqual(draws.count("b") / len(draws), 0.75, delta=0.03)
+
+    def test_adaptive_sampler_targets_weak_units(self):
+        """Test de l'orientation des tirages vers les unités fautives"""
+        words = ["quai", "chat", "table", "pomme", "arbre", "fleur", "route", "livre"]
+        store = ListWordStore(words)
+        for _ in range(10):
+            self.profile.record_key("q", "", False)
+        sampler = AdaptiveSampler(store, store.sampler(), self.profile, exploration=0.0)
+        rng = random.Random(3)
+        draws = [sampler.random_word(rng) for _ in range(200)]
+        self.assertGreater(draws.count("quai"), 150)
+
+        # Sans unité fautive, le tirage redevient uniforme
+        empty = AdaptiveSampler(store, store.sampler(), ErrorProfile(self.profile_file + ".absent"))
+        self.assertIsNone(empty.table)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,345 @@
+import unittest
+import tempfile
+import os
+import random
+import sys
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.word_store import (
+    BinaryWordStore, ListWordStore, MmapWordStore, WordStoreLoader, bucket_key,
+    compile_dictionary, compiled_path, fold_word, open_word_store, word_tiers
+)
+from utils.word_trie import PrefixTracker, PrefixTrie
+from utils.ngram_index import NgramIndex, load_or_build_ngram_index
+
+
+class TestMmapWordStore(unittest.TestCase):
+    """Tests pour le dictionnaire projeté en mémoire"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.dico_file = os.path.join(self.temp_dir, "dico.txt")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        if os.path.exists(self.dico_file):
+            os.remove(self.dico_file)
+        os.rmdir(self.temp_dir)
+
+    def write_dico(self, content):
+        with open(self.dico_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+
+    def test_index_lines(self):
+        """Test de l'indexation d'un fichier une ligne par mot"""
+        self.write_dico("a\nabaissa\nécran\nzythum")
+        store = MmapWordStore(self.dico_file)
+        try:
+            self.assertEqual(len(store), 4)
+            self.assertEqual(list(store), ["a", "abaissa", "écran", "zythum"])
+            self.assertEqual(store[-1], "zythum")
+        finally:
+            store.close()
+
+    def test_blank_lines_and_crlf(self):
+        """Test des lignes vides et des fins de ligne Windows"""
+        self.write_dico("chat\r\n\r\n  chien \r\n\noiseau\r\n")
+        store = MmapWordStore(self.dico_file)
+        try:
+            self.assertEqual(list(store), ["chat", "chien", "oiseau"])
+        finally:
+            store.close()
+
+    def test_random_word(self):
+        """Test du tirage aléatoire"""
+        self.write_dico("un\ndeux\ntrois\n")
+        store = MmapWordStore(self.dico_file)
+        try:
+            rng = random.Random(42)
+            for _ in range(20):
+                self.assertIn(store.random_word(rng), ["un", "deux", "trois"])
+            self.assertIn(random.choice(store), ["un", "deux", "trois"])
+        finally:
+            store.close()
+
+    def test_list_store(self):
+        """Test de la source de secours en mémoire"""
+        store = ListWordStore(["python", "clavier"])
+        self.assertEqual(len(store), 2)
+        self.assertIn(store.random_word(), ["python", "clavier"])
+
+
+class TestBinaryWordStore(unittest.TestCase):
+    """Tests pour le dictionnaire compilé"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.dico_file = os.path.join(self.temp_dir, "dico.txt")
+        with open(self.dico_file, 'w', encoding='utf-8') as f:
+            f.write("a\na\nécran\nabaissa\nbu\nchat\n")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_compile_and_load(self):
+        """Test de la compilation : dédoublonnage et tri par longueur"""
+        info = compile_dictionary(self.dico_file)
+        self.assertEqual(info["words"], 5)
+
+        store = BinaryWordStore(compiled_path(self.dico_file))
+        try:
+            self.assertTrue(store.verify())
+            self.assertEqual(list(store), ["a", "bu", "chat", "écran", "abaissa"])
+            self.assertEqual(store.length_range(5), (3, 1))
+            self.assertEqual(store.length_range(12), (0, 0))
+            self.assertFalse(store.is_stale(self.dico_file))
+            # L'ordre normalisé enregistré est celui que l'on recalculerait
+            self.assertEqual(list(store.folded_order()),
+                             list(ListWordStore(list(store)).folded_order()))
+        finally:
+            store.close()
+
+    def test_stale_artifact_falls_back_to_text(self):
+        """Test du repli sur le texte quand le fichier compilé est obsolète"""
+        compile_dictionary(self.dico_file)
+        store = open_word_store(self.dico_file)
+        self.assertIsInstance(store, BinaryWordStore)
+        store.close()
+
+        with open(self.dico_file, 'a', encoding='utf-8') as f:
+            f.write("nouveau\n")
+        store = open_word_store(self.dico_file)
+        try:
+            self.assertIsInstance(store, MmapWordStore)
+            self.assertEqual(store[-1], "nouveau")
+        finally:
+            store.close()
+
+    def test_corrupted_artifact(self):
+        """Test du repli sur le texte quand le fichier compilé est illisible"""
+        with open(compiled_path(self.dico_file), 'wb') as f:
+            f.write(b"pas un dictionnaire")
+        store = open_word_store(self.dico_file)
+        try:
+            self.assertIsInstance(store, MmapWordStore)
+        finally:
+            store.close()
+
+
+class TestDifficultyBuckets(unittest.TestCase):
+    """Tests pour l'index des mots par difficulté"""
+
+    WORDS = ["a", "bu", "chat", "kiwi", "écran", "zézayé", "abaissa", "anticonstitutionnellement"]
+    EASY = {"min_length": 2, "max_length": 6, "max_accents": 0, "max_rarity": 0}
+
+    def test_word_tiers(self):
+        """Test du calcul des niveaux d'accents et de rareté"""
+        self.assertEqual(word_tiers("chat"), (0, 0))
+        self.assertEqual(word_tiers("kiwi"), (0, 2))
+        self.assertEqual(word_tiers("zézayé"), (2, 2))
+        self.assertEqual(bucket_key("Écran"), (5, 1, 0))
+
+    def test_level_sampling(self):
+        """Test du tirage limité à un niveau"""
+        sampler = ListWordStore(self.WORDS).sampler(self.EASY)
+        self.assertEqual(len(sampler), 2)
+        for _ in range(20):
+            self.assertIn(sampler.random_word(), ["bu", "chat"])
+
+    def test_compiled_buckets_match_scan(self):
+        """Test de l'équivalence entre tranches compilées et calculées"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            dico_file = os.path.join(temp_dir, "dico.txt")
+            with open(dico_file, 'w', encoding='utf-8') as f:
+                f.write("\n".join(self.WORDS))
+            compile_dictionary(dico_file)
+            store = BinaryWordStore(compiled_path(dico_file))
+            try:
+                compiled = {key: sorted(store[i] for i in ids) for key, ids in store.bucket_index().items()}
+                scanned = {key: sorted(self.WORDS[i] for i in ids)
+                           for key, ids in ListWordStore(self.WORDS).bucket_index().items()}
+                self.assertEqual(compiled, scanned)
+                self.assertEqual(len(store.sampler(self.EASY)), 2)
+            finally:
+                store.close()
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+    def test_empty_level_uses_whole_store(self):
+        """Test du repli sur tout le dictionnaire pour un niveau vide"""
+        sampler = ListWordStore(self.WORDS).sampler({"min_length": 40})
+        self.assertEqual(len(sampler), len(self.WORDS))
+
+
+class TestPrefixTrie(unittest.TestCase):
+    """Tests pour l'arbre des préfixes et le suivi de saisie"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.store = ListWordStore(["maison", "mais", "a", "maire", "chat", "mai"])
+        self.trie = PrefixTrie.from_store(self.store)
+
+    def test_walk(self):
+        """Test de la descente le long d'un préfixe"""
+        node = self.trie.walk("mai")
+        self.assertEqual(self.trie.count(node), 4)
+        self.assertTrue(self.trie.is_word(node))
+        self.assertFalse(self.trie.is_word(self.trie.walk("mais" + "o")))
+        self.assertTrue(self.trie.is_word(self.trie.walk("maison")))
+        self.assertIsNone(self.trie.walk("mz"))
+        self.assertEqual(self.trie.count(self.trie.walk("")), 6)
+
+    def test_tracker_feedback(self):
+        """Test du retour frappe par frappe, effacements compris"""
+        tracker = PrefixTracker(self.trie)
+        tracker.set_target("maison")
+
+        tracker.update("mai")
+        self.assertEqual(tracker.correct_length(), 3)
+        self.assertIsNone(tracker.error_index())
+        self.assertTrue(tracker.is_known_word())
+
+        tracker.update("mair")
+        self.assertEqual(tracker.error_index(), 3)
+        self.assertTrue(tracker.is_known_prefix())
+
+        tracker.update("mairx")
+        self.assertFalse(tracker.is_known_prefix())
+
+        tracker.update("mais")
+        self.assertEqual(tracker.correct_length(), 4)
+        self.assertTrue(tracker.is_known_prefix())
+
+    def test_folded_forms(self):
+        """Test de la normalisation des accents et de la casse"""
+        self.assertEqual(fold_word("Élève"), "eleve")
+        self.assertEqual(fold_word("cœur"), "cœur")
+        store = ListWordStore(["étal", "Abri", "ete", "eta", "zèbre"])
+        self.assertEqual([store.folded(i) for i in store.folded_order()],
+                         ["abri", "eta", "etal", "ete", "zebre"])
+
+    def test_accent_insensitive_tracker(self):
+        """Test du suivi de saisie sans accents ni majuscules"""
+        store = ListWordStore(["Élève", "élan", "mère"])
+        tracker = PrefixTracker(PrefixTrie.from_store(store, folded=True), fold_word)
+        tracker.set_target("Élève")
+        tracker.update("elev")
+        self.assertEqual(tracker.correct_length(), 4)
+        self.assertTrue(tracker.is_known_prefix())
+        tracker.update("eleve")
+        self.assertTrue(tracker.is_known_word())
+        tracker.update("ela")
+        self.assertEqual(tracker.error_index(), 2)
+
+    def test_tracker_without_trie(self):
+        """Test du suivi de saisie sans dictionnaire"""
+        tracker = PrefixTracker()
+        tracker.set_target("chat")
+        tracker.update("chien")
+        self.assertEqual(tracker.error_index(), 2)
+        self.assertTrue(tracker.is_known_prefix())
+
+
+class TestWordStoreLoader(unittest.TestCase):
+    """Tests pour le chargement du dictionnaire en arrière-plan"""
+
+    def test_background_load(self):
+        """Test de la remise de la source prête via la file"""
+        import threading
+        release = threading.Event()
+
+        def opener():
+            release.wait(5)
+            return ListWordStore(["chat", "chien"])
+
+        loader = WordStoreLoader(opener)
+        loader.start()
+        self.assertTrue(loader.is_loading())
+        self.assertIsNone(loader.poll())
+
+        release.set()
+        store = loader.wait(5)
+        self.assertEqual(list(store), ["chat", "chien"])
+        self.assertFalse(loader.is_loading())
+        # Les index sont préparés par le thread de travail
+        self.assertIsNotNone(getattr(store, '_sorted_order', None))
+        self.assertIsNotNone(getattr(store, '_folded_order', None))
+
+    def test_background_error(self):
+        """Test d'une erreur de chargement"""
+        def opener():
+            raise OSError("dictionnaire absent")
+
+        loader = WordStoreLoader(opener)
+        self.assertIsNone(loader.wait(5))
+        self.assertIsInstance(loader.error, OSError)
+        self.assertFalse(loader.is_loading())
+
+
+
+class TestNgramIndex(unittest.TestCase):
+    """Tests pour l'index inversé des n-grammes"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "dico.ngrams")
+        self.store = ListWordStore(["quatre", "question", "chaque", "action", "nation", "arbre"])
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        if os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
+        os.rmdir(self.temp_dir)
+
+    def words(self, ids):
+        return [self.store[i] for i in ids]
+
+    def test_query(self):
+        """Test des requêtes simples, longues et combinées"""
+        index = NgramIndex.build(self.store)
+        self.assertEqual(self.words(index.query(["qu"])), ["quatre", "question", "chaque"])
+        self.assertEqual(self.words(index.query(["tion"])), ["question", "action", "nation"])
+        self.assertEqual(self.words(index.query(["qu", "tion"])), ["question"])
+        self.assertEqual(index.query(["zz"]), [])
+        with self.assertRaises(ValueError):
+            index.query(["q"])
+
+    def test_accent_insensitive_query(self):
+        """Test des motifs comparés aux formes normalisées"""
+        index = NgramIndex.build(ListWordStore(["Élève", "lever"]))
+        self.assertEqual(index.query(["élè"]), [0])
+        self.assertEqual(index.query(["elev"]), [0])
+        self.assertEqual(index.query(["LEV"]), [0, 1])
+
+    def test_disk_cache(self):
+        """Test de l'écriture, de la relecture et de l'invalidation du cache"""
+        index = load_or_build_ngram_index(self.store, self.cache_file)
+        try:
+            self.assertIsNotNone(index._mm)
+            self.assertEqual(self.words(index.query(["ti", "on"])), ["question", "action", "nation"])
+        finally:
+            index.close()
+
+        with self.assertRaises(ValueError):
+            NgramIndex.load(self.cache_file, self.store.fingerprint() + 1)
+
+        # Un dictionnaire différent reconstruit l'index
+        self.store = ListWordStore(["tion"])
+        index = load_or_build_ngram_index(self.store, self.cache_file)
+        try:
+            self.assertEqual(index.query(["tion"]), [0])
+        finally:
+            index.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,6 +1,7 @@
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 class ConfigManager:
@@ -38,7 +39,22 @@ class ConfigManager:
                 "typer_game": {
                     "words_per_round": 20,
                     "timer_mode_duration": 60,
-                    "lives_mode_lives": 3
+                    "lives_mode_lives": 3,
+                    "accent_insensitive": False,
+                    "text_prefetch": 32,
+                    "word_difficulty": {
+                        "easy": {"min_length": 2, "max_length": 6, "max_accents": 0, "max_rarity": 0},
+                        "normal": {"min_length": 4, "max_length": 9, "max_accents": 1, "max_rarity": 1},
+                        "hard": {"min_length": 8, "max_length": 25, "max_accents": 2, "max_rarity": 2}
+                    },
+                    "drills": {
+                        "qu": ["qu"],
+                        "ch": ["ch"],
+                        "gn": ["gn"],
+                        "ill": ["ill"],
+                        "tion": ["tion"],
+                        "oi + re": ["oi", "re"]
+                    }
                 },
                 "virtual_pet": {
                     "auto_save_interval": 30,
@@ -55,11 +71,56 @@ class ConfigManager:
                 "enable_logging": True,
                 "log_level": "INFO",
                 "memory_optimization": True,
-                "cache_enabled": True
+                "cache_enabled": True,
+                "score_backend": "json",
+                "score_database": "scores.db",
+                "leaderboard_size": 10,
+                "startup_report": os.path.join("logs", "startup_profile.json"),
+                "startup_budgets_ms": {
+                    "logger_init": 50,
+                    "imports": 400,
+                    "tk_init": 300,
+                    "config_load": 50,
+                    "scores_load": 50,
+                    "game_manager": 20,
+                    "theme_setup": 200,
+                    "home_screen": 300,
+                    "first_idle": 1500
+                }
             }
         }
+        # (clé surveillée, fonction appelée avec (clé modifiée, nouvelle valeur))
+        self._subscribers: List[Tuple[str, Callable[[Optional[str], Any], None]]] = []
         self.config = self.load_config()
     
+    def subscribe(self, key: str, callback: Callable[[Optional[str], Any], None]) -> Callable[[], None]:
+        """Abonne une fonction aux changements d'une clé (et de ses sous-clés)
+
+        La fonction reçoit la clé modifiée (None pour un rechargement complet)
+        et la valeur actuelle de la clé surveillée. Retourne une fonction
+        qui annule cet abonnement.
+        """
+        subscription = (key, callback)
+        self._subscribers.append(subscription)
+
+        def cancel():
+            self._subscribers = [sub for sub in self._subscribers if sub is not subscription]
+        return cancel
+    
+    def unsubscribe(self, callback: Callable[[Optional[str], Any], None]):
+        """Retire tous les abonnements d'une fonction"""
+        self._subscribers = [(key, cb) for key, cb in self._subscribers if cb != callback]
+    
+    def _notify(self, changed: Optional[str]):
+        """Prévient les abonnés concernés par une modification"""
+        for key, callback in list(self._subscribers):
+            if (changed is None or not key or changed == key
+                    or changed.startswith(key + '.') or key.startswith(changed + '.')):
+                try:
+                    callback(changed, self.get(key) if key else self.config)
+                except Exception as e:
+                    print(f"Erreur lors de la notification d'un changement de configuration : {e}")
+    
     def load_config(self) -> Dict[str, Any]:
         """Charge la configuration depuis le fichier"""
         try:
@@ -71,10 +132,10 @@ class ConfigManager:
             else:
                 # Créer le fichier avec la configuration par défaut
                 self.save_config(self.default_config)
-                return self.default_config
+                return copy.deepcopy(self.default_config)
         except Exception as e:
             print(f"Erreur lors du chargement de la configuration : {e}")
-            return self.default_config
+            return copy.deepcopy(self.default_config)
     
     def save_config(self, config: Optional[Dict[str, Any]] = None):
         """Sauvegarde la configuration dans le fichier"""
@@ -87,7 +148,7 @@ class ConfigManager:
     
     def merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
         """Fusionne la configuration par défaut avec celle de l'utilisateur"""
-        result = default.copy()
+        result = copy.deepcopy(default)
         
         def merge_dicts(base: Dict[str, Any], override: Dict[str, Any]):
             for key, value in override.items():
@@ -125,6 +186,7 @@ class ConfigManager:
         # Définir la valeur
         config[keys[-1]] = value
         self.save_config()
+        self._notify(key)
     
     def get_theme(self) -> str:
         """Récupère le thème actuel"""
@@ -209,8 +271,9 @@ class ConfigManager:
     
     def reset_to_defaults(self):
         """Réinitialise la configuration aux valeurs par défaut"""
-        self.config = self.default_config.copy()
+        self.config = copy.deepcopy(self.default_config)
         self.save_config()
+        self._notify(None)
     
     def export_config(self, filepath: str):
         """Exporte la configuration vers un fichier"""
@@ -227,6 +290,7 @@ class ConfigManager:
                 imported_config = json.load(f)
                 self.config = self.merge_configs(self.default_config, imported_config)
                 self.save_config()
+                self._notify(None)
         except Exception as e:
             print(f"Erreur lors de l'import de la configuration : {e}")
     
@@ -2,39 +2,49 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import time
 from games.game_manager import GameManager
-from utils.theme_manager import ThemeManager
-from utils.animation_manager import AnimationManager
-from utils.config_manager import ConfigManager
-from utils.logger import get_logger
+from utils.services import get_services
+from utils.startup_profiler import get_profiler
 
 class ModernGameApp(tk.Tk):
     """Application de jeux moderne avec thèmes et animations"""
     
     def __init__(self):
-        super().__init__()
-        
-        # Initialisation des gestionnaires
-        self.config_manager = ConfigManager()
-        self.theme_manager = ThemeManager()
-        self.animation_manager = AnimationManager()
-        self.game_manager = GameManager()
-        self.logger = get_logger()
+        # Phases chronométrées si le démarrage est profilé (main.py)
+        profiler = get_profiler()
+        with profiler.phase("tk_init"):
+            super().__init__()
+        
+        # Gestionnaires partagés avec les jeux (chaque fichier n'est lu qu'une fois)
+        self.services = get_services()
+        self.logger = self.services.logger
+        with profiler.phase("config_load"):
+            self.config_manager = self.services.config
+        with profiler.phase("scores_load"):
+            self.score_manager = self.services.scores
+        with profiler.phase("game_manager"):
+            self.game_manager = GameManager()  # Jeux construits seulement au lancement
         
         # État de l'application (doit être défini avant setup_window)
         self.current_screen = "home"
         self.fullscreen = self.config_manager.is_fullscreen()
         
-        # Configuration de la fenêtre
-        self.setup_window()
-        
-        # Configuration des styles
-        self.setup_styles()
+        with profiler.phase("theme_setup"):
+            self.theme_manager = self.services.theme
+            self.animation_manager = self.services.animations
+            
+            # Configuration de la fenêtre
+            self.setup_window()
+            
+            # Configuration des styles
+            self.setup_styles()
         
         # Log du démarrage
         self.logger.log_startup("2.0.0", self.config_manager.config)
         
         # Création de l'interface
-        self.create_home_screen()
+        with profiler.phase("home_screen"):
+            self.create_home_screen()
+            self.update_idletasks()  # Premier rendu de l'écran d'accueil
         
         # Gestionnaire d'événements
         self.bind('<Escape>', self.handle_escape)
@@ -263,13 +273,14 @@ class ModernGameApp(tk.Tk):
         """Récupère les statistiques de base"""
         try:
             # Compter les jeux disponibles
-            game_count = len(self.game_manager.games)
+            descriptors = self.game_manager.get_all_descriptors()
+            game_count = len(descriptors)
             
-            # Compter les scores sauvegardés
-            total_scores = 0
-            for game_id in self.game_manager.games.keys():
-                scores = self.game_manager.games[game_id].score_manager.get_all_scores(game_id)
-                total_scores += len(scores)
+            # Compter les scores sauvegardés (une seule lecture pour tous les jeux)
+            leaderboards = self.score_manager.get_leaderboards(
+                [descriptor.game_id for descriptor in descriptors], top_n=0
+            )
+            total_scores = sum(board["count"] for board in leaderboards.values())
             
             return {
                 "Jeux disponibles": game_count,
@@ -303,14 +314,20 @@ class ModernGameApp(tk.Tk):
         games_frame.pack(expand=True, fill='both')
         
         # Organiser les jeux en grille responsive
-        games = list(self.game_manager.games.items())
-        cols = 2 if len(games) <= 4 else 3
+        descriptors = self.game_manager.get_all_descriptors()
+        cols = 2 if len(descriptors) <= 4 else 3
+        # Meilleurs scores de tous les jeux, lus en une fois
+        leaderboards = self.score_manager.get_leaderboards(
+            [descriptor.game_id for descriptor in descriptors], top_n=0
+        )
         
-        for i, (game_id, game) in enumerate(games):
+        for i, descriptor in enumerate(descriptors):
             row = i // cols
             col = i % cols
             
-            game_card = self.create_game_card(games_frame, game, row, col)
+            game_card = self.create_game_card(
+                games_frame, descriptor, row, col, leaderboards.get(descriptor.game_id)
+            )
             
         # Configuration de la grille
         for i in range(cols):
@@ -329,25 +346,38 @@ class ModernGameApp(tk.Tk):
         if self.config_manager.are_animations_enabled():
             self.animation_manager.fade_in(main_frame, duration=0.6)
             
-    def create_game_card(self, parent, game, row, col):
-        """Crée une carte pour un jeu"""
+    def create_game_card(self, parent, descriptor, row, col, leaderboard=None):
+        """Crée une carte pour un jeu à partir de sa description (sans le construire)
+
+        `leaderboard` : classement du jeu issu de `ScoreManager.get_leaderboards`.
+        """
         card_frame = ttk.Frame(parent, style='GameCard.TFrame')
         card_frame.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
         
         # Configuration de la grille
-        card_frame.grid_rowconfigure(1, weight=1)
+        card_frame.grid_rowconfigure(2, weight=1)
         card_frame.grid_columnconfigure(0, weight=1)
         
         # Titre du jeu
         title_label = ttk.Label(
             card_frame,
-            text=game.name,
+            text=descriptor.name,
             style='Heading.TLabel'
         )
-        title_label.grid(row=0, column=0, pady=(15, 10))
+        title_label.grid(row=0, column=0, pady=(15, 5))
+        
+        # Description
+        if descriptor.description:
+            ttk.Label(
+                card_frame,
+                text=descriptor.description,
+                style='Theme.TLabel'
+            ).grid(row=1, column=0, padx=10)
         
         # Meilleur score
-        high_score = game.score_manager.get_high_score(game.game_id)
+        if leaderboard is None:
+            leaderboard = self.score_manager.get_leaderboards([descriptor.game_id], top_n=0).get(descriptor.game_id, {})
+        high_score = leaderboard.get("best")
         if high_score:
             score_text = f"Meilleur: {high_score['score']}"
             if 'player' in high_score:
@@ -360,16 +390,27 @@ class ModernGameApp(tk.Tk):
             text=score_text,
             style='Score.TLabel'
         )
-        score_label.grid(row=1, column=0, pady=10)
+        score_label.grid(row=2, column=0, pady=10)
+        
+        # Statut du jeu, sans le construire (ex. dictionnaire en cours de chargement)
+        status_text = descriptor.get_status_text(self.services)
+        if status_text:
+            status_label = ttk.Label(
+                card_frame,
+                text=status_text,
+                style='Theme.TLabel'
+            )
+            status_label.grid(row=4, column=0, pady=(0, 10))
+            self.refresh_game_status(descriptor, status_label)
         
         # Bouton jouer
         play_button = ttk.Button(
             card_frame,
             text="Jouer",
             style='Primary.TButton',
-            command=lambda: self.launch_game(game)
+            command=lambda: self.launch_game(descriptor)
         )
-        play_button.grid(row=2, column=0, pady=(0, 15))
+        play_button.grid(row=3, column=0, pady=(0, 15))
         
         # Animation au survol
         if self.config_manager.are_animations_enabled():
@@ -377,6 +418,18 @@ class ModernGameApp(tk.Tk):
             
         return card_frame
         
+    def refresh_game_status(self, descriptor, status_label):
+        """Rafraîchit le statut d'une carte jusqu'à ce que le jeu soit prêt"""
+        try:
+            status_text = descriptor.get_status_text(self.services)
+            if status_text:
+                status_label.config(text=status_text)
+                self.after(200, lambda: self.refresh_game_status(descriptor, status_label))
+            else:
+                status_label.grid_remove()
+        except tk.TclError:
+            pass  # Carte détruite (changement d'écran)
+        
     def show_settings(self):
         """Affiche l'écran des paramètres"""
         self.clear_screen()
@@ -523,9 +576,11 @@ class ModernGameApp(tk.Tk):
             self.create_home_screen()
             self.logger.log_user_action("reset_settings")
             
-    def launch_game(self, game):
-        """Lance un jeu dans une nouvelle fenêtre"""
+    def launch_game(self, descriptor):
+        """Construit le jeu si besoin puis le lance dans une nouvelle fenêtre"""
         try:
+            game = self.game_manager.get_game(descriptor.game_id)
+            
             # Créer une nouvelle fenêtre pour le jeu
             game_window = tk.Toplevel(self)
             game_window.title(f"{game.name} - Mini-Jeux")
@@ -546,6 +601,8 @@ class ModernGameApp(tk.Tk):
             
             # Créer les widgets du jeu
             game.create_game_widgets(game_window)
+            # Le bouton de fermeture passe aussi par le nettoyage du jeu (profil, abonnements)
+            game_window.protocol("WM_DELETE_WINDOW", game._destroy_window)
             
             # Configurer la fenêtre pour être modale
             game_window.transient(self)
@@ -558,8 +615,8 @@ class ModernGameApp(tk.Tk):
             self.wait_window(game_window)
             
         except Exception as e:
-            self.logger.log_error_with_context(e, f"launch_game_{game.name}")
-            messagebox.showerror("Erreur", f"Impossible de lancer {game.name}: {str(e)}")
+            self.logger.log_error_with_context(e, f"launch_game_{descriptor.name}")
+            messagebox.showerror("Erreur", f"Impossible de lancer {descriptor.name}: {str(e)}")
 
 # Alias pour la compatibilité
 GameApp = ModernGameApp
@@ -6,7 +6,8 @@ from pathlib import Path
 class I18nManager:
     """Gestionnaire d'internationalisation pour l'application"""
     
-    def __init__(self, default_language: str = "fr"):
+    def __init__(self, default_language: str = "fr", translations_dir: str = "translations"):
+        self.translations_dir = Path(translations_dir)
         self.default_language = default_language
         self.current_language = default_language
         self.translations = {}
@@ -14,7 +15,7 @@ class I18nManager:
     
     def load_translations(self):
         """Charge toutes les traductions disponibles"""
-        translations_dir = Path("translations")
+        translations_dir = self.translations_dir
         
         if not translations_dir.exists():
             # Créer le dossier et les fichiers de traduction par défaut
@@ -31,7 +32,7 @@ class I18nManager:
     
     def create_default_translations(self):
         """Crée les fichiers de traduction par défaut"""
-        translations_dir = Path("translations")
+        translations_dir = self.translations_dir
         translations_dir.mkdir(exist_ok=True)
         
         # Traductions françaises (par défaut)
@@ -337,9 +338,12 @@ class I18nManager:
         languages = self.get_available_languages()
         return languages.get(language_code, language_code)
 
-# Instance globale
-i18n = I18nManager()
+# Instance globale, créée au premier appel (pas de dossier créé à l'import)
+i18n = None
 
 def get_i18n() -> I18nManager:
     """Retourne l'instance globale du gestionnaire d'internationalisation"""
+    global i18n
+    if i18n is None:
+        i18n = I18nManager()
     return i18n
@@ -195,9 +195,12 @@ class GameLogger:
         self.log_level = new_level
         self.info(f"Niveau de log changé vers: {level}")
 
-# Instance globale du logger
-game_logger = GameLogger()
+# Instance globale du logger, créée au premier appel (pas de dossier créé à l'import)
+game_logger: Optional[GameLogger] = None
 
 def get_logger() -> GameLogger:
     """Retourne l'instance globale du logger"""
+    global game_logger
+    if game_logger is None:
+        game_logger = GameLogger()
     return game_logger
@@ -0,0 +1,185 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from utils.word_store import fold_word
+
+# Format du cache disque (petit-boutiste) :
+#   en-tête | table des clés (longueur, n-gramme UTF-8, offset, nombre) | identifiants uint32
+NGRAM_MAGIC = b'MJNGRAM\x00'
+NGRAM_VERSION = 2
+_HEADER = struct.Struct('<8sHBBIII')
+_KEY_SIZE = struct.Struct('<B')
+_KEY_RANGE = struct.Struct('<II')
+
+
+class NgramIndex:
+    """Index inversé n-gramme -> identifiants des mots qui le contiennent
+
+    Les n-grammes sont pris sur les formes normalisées des mots (sans accents
+    ni majuscules), comme les motifs recherchés. Les listes d'identifiants
+    sont triées et sans doublon ; une requête portant sur plusieurs motifs se
+    résout par intersection d'ensembles en partant de la liste la plus courte.
+    """
+
+    def __init__(self, postings: Dict[str, Sequence[int]], sizes: Tuple[int, int], store=None):
+        self.postings = postings
+        self.min_n, self.max_n = sizes
+        self.store = store
+        self._mm = None
+        self._views = []
+
+    @classmethod
+    def build(cls, store, sizes: Tuple[int, int] = (2, 3)) -> 'NgramIndex':
+        """Construit l'index en un seul passage sur le dictionnaire
+
+        Les mots sont lus un par un depuis la source : seules les listes
+        d'identifiants sont gardées en mémoire, jamais une copie des mots.
+        """
+        min_n, max_n = sizes
+        postings: Dict[str, array] = {}
+        for word_id in range(len(store)):
+            word = store.folded(word_id)
+            grams = {
+                word[i:i + n]
+                for n in range(min_n, max_n + 1)
+                for i in range(len(word) - n + 1)
+            }
+            for gram in grams:
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array('I')
+                ids.append(word_id)
+        return cls(postings, sizes, store)
+
+    def save(self, path: str, fingerprint: int):
+        """Écrit l'index sur disque (fichier temporaire puis renommage)"""
+        keys = sorted(self.postings)
+        table = bytearray()
+        offset = 0
+        for key in keys:
+            encoded = key.encode('utf-8')
+            table += _KEY_SIZE.pack(len(encoded)) + encoded
+            table += _KEY_RANGE.pack(offset, len(self.postings[key]))
+            offset += len(self.postings[key])
+        padding = b'\x00' * ((-(_HEADER.size + len(table))) % 4)
+
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(NGRAM_MAGIC, NGRAM_VERSION, self.min_n, self.max_n,
+                                 fingerprint, len(keys), offset))
+            f.write(table)
+            f.write(padding)
+            for key in keys:
+                ids = array('I', self.postings[key])
+                if sys.byteorder != 'little':
+                    ids.byteswap()
+                f.write(ids.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: int, store=None) -> 'NgramIndex':
+        """Ouvre un index sur disque ; ValueError s'il ne correspond pas au dictionnaire"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, min_n, max_n, stored_fingerprint, key_count, total = _HEADER.unpack_from(mm, 0)
+            if magic != NGRAM_MAGIC or version != NGRAM_VERSION:
+                raise ValueError(f"Index n-grammes invalide: {path}")
+            if stored_fingerprint != fingerprint:
+                raise ValueError(f"Index n-grammes obsolète: {path}")
+
+            ranges = {}
+            position = _HEADER.size
+            for _ in range(key_count):
+                (size,) = _KEY_SIZE.unpack_from(mm, position)
+                position += _KEY_SIZE.size
+                key = mm[position:position + size].decode('utf-8')
+                position += size
+                ranges[key] = _KEY_RANGE.unpack_from(mm, position)
+                position += _KEY_RANGE.size
+            position += (-position) % 4
+            if position + total * 4 != len(mm):
+                raise ValueError(f"Index n-grammes tronqué: {path}")
+
+            raw = memoryview(mm)[position:]
+            if sys.byteorder == 'little':
+                table = raw.cast('I')
+                views = [raw, table]
+            else:
+                table = array('I', raw.tobytes())
+                table.byteswap()
+                views = [raw]
+            postings = {key: table[start:start + count] for key, (start, count) in ranges.items()}
+        except Exception:
+            mm.close()
+            raise
+        index = cls(postings, (min_n, max_n), store)
+        index._mm = mm
+        index._views = views
+        return index
+
+    def ids_for(self, pattern: str) -> Sequence[int]:
+        """Identifiants des mots contenant un motif (n-gramme ou motif plus long)"""
+        pattern = fold_word(pattern)
+        if len(pattern) < self.min_n:
+            raise ValueError(f"Motif trop court (minimum {self.min_n} caractères): {pattern}")
+        if len(pattern) <= self.max_n:
+            return self.postings.get(pattern, ())
+        # Motif long : intersection de ses n-grammes, puis vérification
+        grams = {pattern[i:i + self.max_n] for i in range(len(pattern) - self.max_n + 1)}
+        candidates = self._intersect(self.postings.get(gram, ()) for gram in grams)
+        if self.store is None:
+            return candidates
+        return [word_id for word_id in candidates if pattern in self.store.folded(word_id)]
+
+    def query(self, patterns: Iterable[str]) -> List[int]:
+        """Identifiants (triés) des mots contenant tous les motifs demandés"""
+        return self._intersect(self.ids_for(pattern) for pattern in patterns)
+
+    @staticmethod
+    def _intersect(lists: Iterable[Sequence[int]]) -> List[int]:
+        lists = sorted(lists, key=len)
+        if not lists:
+            return []
+        result = set(lists[0])
+        for ids in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(ids)
+        return sorted(result)
+
+    def close(self):
+        self.postings = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+def ngram_cache_path(source_path: str) -> str:
+    """Chemin du cache de l'index, à côté du dictionnaire texte"""
+    return os.path.splitext(source_path)[0] + '.ngrams'
+
+
+def load_or_build_ngram_index(store, cache_path: str) -> NgramIndex:
+    """Ouvre l'index en cache, ou le construit puis l'écrit sur disque"""
+    fingerprint = store.fingerprint()
+    try:
+        return NgramIndex.load(cache_path, fingerprint, store)
+    except (OSError, ValueError, struct.error):
+        pass
+    index = NgramIndex.build(store)
+    try:
+        index.save(cache_path, fingerprint)
+    except OSError as e:
+        # Dossier en lecture seule (exécutable empaqueté) : index gardé en mémoire
+        print(f"Impossible d'écrire le cache n-grammes {cache_path}: {e}")
+        return index
+    # La version projetée en mémoire remplace les listes construites
+    return NgramIndex.load(cache_path, fingerprint, store)
@@ -1,83 +1,582 @@
+import atexit
 import json
+import math
 import os
+import threading
+import time
+import uuid
+from datetime import datetime
 from pathlib import Path
 
+from utils.leaderboard import ScoreDistribution
+from utils.score_storage import (CHANGED_FULL, WINDOWS, ShardedScoreStore, SqliteScoreStore, board_keys,
+                                 current_periods, evict_expired, insert_score, to_json)
+
+# Nombre de scores gardés par jeu, par défaut
+MAX_SCORES = 10
+
+# Scores écrits ensemble lors d'un import
+IMPORT_BATCH_SIZE = 5000
+
+
+def _record_key(game_id, entry):
+    """Clé de dédoublonnage d'un score importé"""
+    return game_id, entry['player'], entry['score'], entry.get('date')
+
+
+def _parse_record(record):
+    """Valide une ligne d'import ; retourne (jeu, entrée) ou lève ValueError"""
+    if not isinstance(record, dict):
+        raise ValueError("objet JSON attendu")
+    game_id = record.get('game')
+    player = record.get('player')
+    score = record.get('score')
+    if not isinstance(game_id, str) or not game_id:
+        raise ValueError("jeu manquant")
+    if not isinstance(player, str) or not player:
+        raise ValueError("joueur manquant")
+    if isinstance(score, bool) or not isinstance(score, (int, float)) or not math.isfinite(score):
+        raise ValueError(f"score invalide : {score!r}")
+    entry = {'id': record.get('id') or uuid.uuid4().hex, 'player': player, 'score': score}
+    date = record.get('date')
+    if date is not None:
+        # Même format que les scores enregistrés par save_score
+        entry['date'] = datetime.fromisoformat(date).isoformat(timespec='seconds')
+    for field in ('mode', 'difficulty'):
+        if record.get(field) is not None:
+            if not isinstance(record[field], str):
+                raise ValueError(f"{field} invalide : {record[field]!r}")
+            entry[field] = record[field]
+    if record.get('details'):
+        if not isinstance(record['details'], dict):
+            raise ValueError("details invalides")
+        entry['details'] = record['details']
+    return game_id, entry
+
+
 class ScoreManager:
-    def __init__(self):
-        self.scores_file = "scores.json"
-        self._ensure_scores_file_exists()
+    """Scores des jeux, gardés en mémoire et écrits en différé
+
+    Chaque jeu a son propre fichier de scores dans `scores_dir`, complété
+    par un journal en ajout seul (voir `ShardedScoreStore`). Les scores
+    d'un jeu ne sont lus qu'au premier accès à ce jeu, puis relus seulement
+    si ses fichiers changent (autre processus) : seule la fin du journal
+    est rejouée quand l'instantané n'a pas bougé. Les menus n'ouvrent que
+    le manifeste, qui résume tous les jeux. Chaque écriture se fait sous le
+    verrou du jeu, après avoir relu ce que les autres processus ont écrit.
 
-    def _ensure_scores_file_exists(self):
-        if not os.path.exists(self.scores_file):
-            with open(self.scores_file, 'w') as f:
-                json.dump({}, f)
+    Les nouveaux scores sont ajoutés au cache et écrits ensemble dans le
+    journal de leur jeu `flush_delay` secondes après le premier d'entre
+    eux, ou à la fermeture : le chemin chaud (meilleur score à chaque point
+    marqué) ne touche pas au disque. Un journal est replié dans son
+    instantané quand il dépasse `compact_threshold` lignes, et à la
+    fermeture. Un ancien `scores.json` unique est réparti dans les fichiers
+    des jeux au premier lancement.
 
-    def save_score(self, game_id, player_name, score):
+    Avec `backend="sqlite"`, les scores sont stockés dans `database_file`
+    (voir `SqliteScoreStore`) qui garde tout l'historique ; le cache ne
+    contient toujours que les `max_scores` meilleurs scores de chaque
+    classement (voir `Leaderboard`), de tous les temps et du jour, de la
+    semaine et du mois en cours. Avec le stockage JSON, un score qui
+    n'entre dans aucun classement n'est pas écrit dans le journal : il est
+    seulement compté dans la répartition des scores qui sert à
+    `get_score_rank`.
+    """
+
+    def __init__(self, scores_file="scores.json", flush_delay=2.0, check_interval=1.0,
+                 compact_threshold=100, backend="json", database_file="scores.db",
+                 max_scores=MAX_SCORES, scores_dir=None):
+        self.scores_file = scores_file
+        self.scores_dir = scores_dir or os.path.join(os.path.dirname(scores_file), "scores")
+        self.flush_delay = flush_delay
+        # Délai minimal entre deux vérifications des fichiers d'un jeu (os.stat)
+        self.check_interval = check_interval
+        self.compact_threshold = compact_threshold
+        self.max_scores = max_scores
+        if backend == "sqlite":
+            self.storage = SqliteScoreStore(database_file, limit=max_scores)
+            if self.storage.created and (os.path.isdir(self.scores_dir) or os.path.exists(scores_file)):
+                # Les scores JSON existants sont repris à la création de la base
+                previous = ShardedScoreStore(self.scores_dir, limit=max_scores, legacy_file=scores_file)
+                self.storage.import_scores(previous.export_scores())
+        else:
+            self.storage = ShardedScoreStore(self.scores_dir, limit=max_scores, legacy_file=scores_file)
+        self._lock = threading.RLock()
+        self._scores = {}  # jeu -> classements du jeu, chargés au premier accès
+        self._checked_at = {}  # jeu -> dernière vérification de ses fichiers
+        self._pending = []  # (jeu, entrée) pas encore écrits
+        self._pending_runs = []  # (jeu, entrée) de toutes les parties pas encore comptées
+        self._ranks = {}  # jeu -> (état du stockage, {classement: ScoreDistribution})
+        self._periods = current_periods()  # Jour, semaine et mois en cours
+        self._timer = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def _load(self, game_id):
+        """Retourne les classements d'un jeu, mis à jour si ses fichiers ont changé"""
+        now = time.monotonic()
+        scores = self._scores.get(game_id)
+        if scores is not None and now - self._checked_at.get(game_id, 0.0) < self.check_interval:
+            return scores
+        self._checked_at[game_id] = now
+        self._evict_expired()
+        changes = self.storage.changes(game_id) if scores is not None else CHANGED_FULL
+        if changes == CHANGED_FULL:
+            scores = self.storage.load(game_id)
+            # Les scores pas encore écrits restent visibles
+            for pending_game, entry in self._pending:
+                if pending_game == game_id:
+                    insert_score(scores, game_id, entry, self.max_scores)
+            self._scores[game_id] = scores
+        elif changes is not None:
+            self.storage.replay_tail(game_id, scores)
+        return scores
+
+    def _evict_expired(self):
+        """Retire des jeux chargés les classements des périodes terminées"""
+        periods = current_periods()
+        if periods != self._periods:
+            for scores in self._scores.values():
+                evict_expired(scores, periods)
+            self._periods = periods
+        return periods
+
+    def save_score(self, game_id, player_name, score, details=None, mode=None, difficulty=None):
+        """Enregistre un score
+
+        `mode` et `difficulty` (optionnels) rangent aussi le score dans le
+        classement de son mode et dans celui de son mode à sa difficulté.
+        """
         try:
-            with open(self.scores_file, 'r') as f:
-                scores = json.load(f)
-            
-            if game_id not in scores:
-                scores[game_id] = []
-            
-            scores[game_id].append({
+            entry = {
+                'id': uuid.uuid4().hex,
                 'player': player_name,
-                'score': score
-            })
-            
-            # Trier les scores par ordre décroissant
-            scores[game_id] = sorted(
-                scores[game_id],
-                key=lambda x: x['score'],
-                reverse=True
-            )
-            
-            # Garder uniquement les 10 meilleurs scores
-            scores[game_id] = scores[game_id][:10]
-            
-            with open(self.scores_file, 'w') as f:
-                json.dump(scores, f)
-                
+                'score': score,
+                'date': datetime.now().isoformat(timespec='seconds')
+            }
+            if details:
+                # Résumé de la partie (vitesse, précision...) fourni par le jeu
+                entry['details'] = details
+            if mode is not None:
+                entry['mode'] = mode
+            if difficulty is not None:
+                entry['difficulty'] = difficulty
+            with self._lock:
+                if insert_score(self._load(game_id), game_id, entry, self.max_scores) \
+                        or self.storage.keeps_history:
+                    self._pending.append((game_id, entry))
+                # Sous le seuil du classement, la partie est seulement comptée
+                self._pending_runs.append((game_id, entry))
+                if game_id in self._ranks:
+                    self._add_run(self._ranks[game_id][1], game_id, entry)
+                self._schedule_flush()
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du score : {e}")
 
-    def get_high_score(self, game_id):
+    def _schedule_flush(self):
+        if self.flush_delay <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Ajoute les scores en attente au journal de leur jeu, en un lot par jeu
+
+        Toutes les parties, même hors classement, sont d'abord comptées.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            try:
+                for game_id in dict.fromkeys(game_id for game_id, _ in self._pending_runs):
+                    with self.storage.locked(game_id):
+                        runs = [entry for pending_game, entry in self._pending_runs if pending_game == game_id]
+                        self._write_runs(game_id, runs)
+                        self._pending_runs = [item for item in self._pending_runs if item[0] != game_id]
+                        entries = [entry for pending_game, entry in self._pending if pending_game == game_id]
+                        if not entries:
+                            continue
+                        # Relit sous le verrou ce que d'autres processus ont écrit
+                        self._checked_at[game_id] = 0.0
+                        scores = self._load(game_id)
+                        self.storage.append(game_id, entries, scores)
+                        self._pending = [item for item in self._pending if item[0] != game_id]
+                        if self.storage.journal_length(game_id) >= self.compact_threshold:
+                            self.storage.compact(game_id, scores)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde des scores : {e}")
+
+    def _write_runs(self, game_id, runs):
+        """Compte des parties dans le stockage, en gardant la répartition en mémoire à jour"""
+        before = self.storage.runs_state(game_id)
+        self.storage.append_runs(game_id, runs)
+        cached = self._ranks.get(game_id)
+        if cached is not None:
+            if cached[0] == before:
+                # Personne d'autre n'a écrit : la répartition contient déjà ces parties
+                self._ranks[game_id] = (self.storage.runs_state(game_id), cached[1])
+            else:
+                del self._ranks[game_id]
+
+    @staticmethod
+    def _add_run(distributions, game_id, entry):
+        for key in board_keys(game_id, entry):
+            distributions.setdefault(key, ScoreDistribution()).add(entry['score'])
+
+    def _distributions(self, game_id):
+        """Répartition des scores de chaque classement d'un jeu, relue si le stockage a changé"""
+        state = self.storage.runs_state(game_id)
+        cached = self._ranks.get(game_id)
+        if cached is None or cached[0] != state:
+            distributions = {
+                key: ScoreDistribution(counts) for key, counts in self.storage.score_counts(game_id).items()
+            }
+            # Les parties pas encore écrites sont comptées
+            for pending_game, entry in self._pending_runs:
+                if pending_game == game_id:
+                    self._add_run(distributions, game_id, entry)
+            cached = self._ranks[game_id] = (state, distributions)
+        return cached[1]
+
+    def compact(self):
+        """Replie dans leur instantané les journaux des jeux chargés"""
+        with self._lock:
+            self.flush()
+            for game_id in list(self._scores):
+                if not self.storage.has_journal(game_id):
+                    continue
+                try:
+                    with self.storage.locked(game_id):
+                        if not self.storage.has_journal(game_id):
+                            continue  # Déjà replié par un autre processus
+                        self._checked_at[game_id] = 0.0
+                        self.storage.compact(game_id, self._load(game_id))
+                except Exception as e:
+                    print(f"Erreur lors du compactage des scores : {e}")
+
+    def close(self):
+        """Écrit les scores en attente ; appelé à la fermeture de l'application"""
+        with self._lock:
+            if self._closed:
+                return
+            self.compact()
+            if isinstance(self.storage, SqliteScoreStore):
+                self.storage.close()
+                self._closed = True
+
+    def get_high_score(self, game_id, mode=None, difficulty=None):
         try:
-            with open(self.scores_file, 'r') as f:
-                scores = json.load(f)
-            
-            if game_id in scores and scores[game_id]:
-                return scores[game_id][0]  # Retourne le meilleur score
+            with self._lock:
+                scores = self._load(game_id).get((game_id, mode, difficulty))
+                if scores:
+                    return dict(scores[0])  # Retourne le meilleur score
             return None
-            
+
         except Exception as e:
             print(f"Erreur lors de la lecture du meilleur score : {e}")
             return None
 
-    def get_all_scores(self, game_id):
+    def get_all_scores(self, game_id, mode=None, difficulty=None):
+        try:
+            with self._lock:
+                return [dict(entry) for entry in self._load(game_id).get((game_id, mode, difficulty), [])]
+        except Exception as e:
+            print(f"Erreur lors de la lecture des scores : {e}")
+            return []
+
+    def get_scores(self, game_id, mode=None, difficulty=None):
+        """Retourne les meilleurs scores d'un classement, du meilleur au moins bon
+
+        Sans `mode` ni `difficulty`, le classement général du jeu ; avec
+        `mode`, celui de ce mode ; avec les deux, celui du mode à cette
+        difficulté.
+        """
+        return self.get_all_scores(game_id, mode, difficulty)
+
+    def get_window_scores(self, game_id, window="day", mode=None, difficulty=None):
+        """Meilleurs scores du jour, de la semaine ou du mois en cours
+
+        `window` vaut "day", "week", "month" ou "all" (tous les temps). Les
+        classements des périodes en cours sont tenus à jour à chaque score
+        enregistré : les ouvrir n'est qu'une lecture dans le cache. Ceux des
+        périodes terminées sont retirés dès que la période change.
+        """
+        if window == "all":
+            return self.get_all_scores(game_id, mode, difficulty)
+        if window not in WINDOWS:
+            raise ValueError(f"Fenêtre inconnue : {window}")
         try:
-            with open(self.scores_file, 'r') as f:
-                scores = json.load(f)
-            return scores.get(game_id, [])
+            with self._lock:
+                scores = self._load(game_id)
+                period = self._evict_expired()[window]
+                return [dict(entry) for entry in scores.get((game_id, mode, difficulty, period), [])]
         except Exception as e:
             print(f"Erreur lors de la lecture des scores : {e}")
             return []
 
+    def get_top_scores(self, game_id, limit=None, mode=None, difficulty=None):
+        """Retourne les `limit` meilleurs scores d'un classement
+
+        Au-delà des scores gardés en cache, seul le stockage SQLite, qui
+        garde tout l'historique, peut en retourner davantage.
+        """
+        limit = self.max_scores if limit is None else limit
+        if limit <= self.max_scores or not self.storage.keeps_history:
+            return self.get_all_scores(game_id, mode, difficulty)[:limit]
+        try:
+            with self._lock:
+                self.flush()
+                return self.storage.top(game_id, mode, difficulty, limit=limit)
+        except Exception as e:
+            print(f"Erreur lors de la lecture des scores : {e}")
+            return []
+
+    def get_personal_best(self, game_id, player_name, mode=None, difficulty=None):
+        """Retourne le meilleur score d'un joueur (None s'il n'en a pas)"""
+        try:
+            with self._lock:
+                if self.storage.keeps_history:
+                    self.flush()
+                    return self.storage.best(game_id, player_name, mode, difficulty)
+                for entry in self._load(game_id).get((game_id, mode, difficulty), []):
+                    if entry['player'] == player_name:
+                        return dict(entry)
+            return None
+        except Exception as e:
+            print(f"Erreur lors de la lecture du record personnel : {e}")
+            return None
+
+    def count_scores(self, game_id, mode=None, difficulty=None):
+        """Retourne le nombre de scores enregistrés dans un classement"""
+        try:
+            with self._lock:
+                if self.storage.keeps_history:
+                    self.flush()
+                    return self.storage.count(game_id, mode, difficulty)
+                return len(self._load(game_id).get((game_id, mode, difficulty), []))
+        except Exception as e:
+            print(f"Erreur lors du comptage des scores : {e}")
+            return 0
+
+    def get_score_rank(self, game_id, score, mode=None, difficulty=None):
+        """Situe un score parmi toutes les parties d'un classement
+
+        Retourne {"rank": place (1 pour le meilleur), "total": nombre de
+        parties, "percentile": pourcentage des parties battues}. Les parties
+        hors classement sont comptées aussi ; la répartition est gardée en
+        mémoire, et chaque question ne coûte qu'une recherche dichotomique.
+        """
+        try:
+            with self._lock:
+                distribution = self._distributions(game_id).get((game_id, mode, difficulty))
+                if distribution is None:
+                    return {"rank": 1, "total": 0, "percentile": 0.0}
+                return {
+                    "rank": distribution.rank(score),
+                    "total": len(distribution),
+                    "percentile": distribution.percentile(score),
+                }
+        except Exception as e:
+            print(f"Erreur lors du calcul du rang : {e}")
+            return None
+
+    def get_leaderboards(self, game_ids=None, top_n=3, mode=None, difficulty=None):
+        """Classements de plusieurs jeux, lus en une fois
+
+        Retourne {jeu: {"count": nombre de scores, "best": meilleur score ou
+        None, "top": les `top_n` meilleurs}} pour les jeux demandés (tous les
+        jeux ayant des scores par défaut) : les menus s'affichent à partir
+        de ce seul instantané au lieu d'interroger chaque jeu. Avec
+        `top_n=0`, les jeux pas encore chargés ne sont lus que dans le
+        manifeste. `mode` et `difficulty` choisissent le même
+        sous-classement pour chaque jeu.
+        """
+        try:
+            with self._lock:
+                if self.storage.keeps_history:
+                    self.flush()
+                summary = self.storage.summary()
+                if game_ids is None:
+                    loaded = [game_id for game_id, scores in self._scores.items() if scores.get((game_id, None, None))]
+                    game_ids = list(dict.fromkeys(list(summary) + loaded))
+                counts = None
+                if self.storage.keeps_history and mode is None and difficulty is None:
+                    counts = {game_id: info["count"] for game_id, info in summary.items()}
+                leaderboards = {}
+                for game_id in game_ids:
+                    if top_n == 0 and mode is None and difficulty is None and game_id not in self._scores:
+                        info = summary.get(game_id, {})
+                        best = info.get("best")
+                        leaderboards[game_id] = {
+                            "count": info.get("count", 0),
+                            "best": dict(best) if best else None,
+                            "top": [],
+                        }
+                        continue
+                    cached = self._load(game_id).get((game_id, mode, difficulty), [])
+                    if top_n > self.max_scores and self.storage.keeps_history:
+                        top = self.storage.top(game_id, mode, difficulty, limit=top_n)
+                    else:
+                        top = [dict(entry) for entry in cached[:top_n]]
+                    if counts is not None:
+                        count = counts.get(game_id, 0)
+                    elif self.storage.keeps_history:
+                        count = self.storage.count(game_id, mode, difficulty)
+                    else:
+                        count = len(cached)
+                    leaderboards[game_id] = {
+                        "count": count,
+                        "best": dict(cached[0]) if cached else None,
+                        "top": top,
+                    }
+                return leaderboards
+        except Exception as e:
+            print(f"Erreur lors de la lecture des classements : {e}")
+            return {}
+
+    def export_scores(self, path, game_ids=None):
+        """Écrit les scores au format JSON Lines, un score par ligne
+
+        Les jeux sont lus l'un après l'autre et chaque score est écrit dès
+        sa lecture : avec SQLite, tout l'historique est exporté sans être
+        chargé en mémoire. Retourne {"records", "seconds",
+        "records_per_second"}, ou None en cas d'erreur.
+        """
+        start = time.perf_counter()
+        records = 0
+        try:
+            with self._lock:
+                self.flush()
+                tmp_file = f"{path}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    for game_id in (self.storage.games() if game_ids is None else game_ids):
+                        if self.storage.keeps_history:
+                            entries = self.storage.history(game_id)
+                        else:
+                            entries = to_json(self._load(game_id)).get(game_id, [])
+                        for entry in entries:
+                            f.write(json.dumps(dict({'game': game_id}, **entry), ensure_ascii=False) + "\n")
+                            records += 1
+                os.replace(tmp_file, path)
+        except Exception as e:
+            print(f"Erreur lors de l'export des scores : {e}")
+            return None
+        seconds = time.perf_counter() - start
+        return {"records": records, "seconds": seconds,
+                "records_per_second": records / seconds if seconds > 0 else 0.0}
+
+    def import_scores(self, path, batch_size=IMPORT_BATCH_SIZE):
+        """Importe des scores au format JSON Lines (voir `export_scores`)
+
+        Le fichier est lu ligne à ligne et les scores sont écrits par lots
+        de `batch_size` : la mémoire utilisée ne dépend pas de la taille du
+        fichier. Les lignes invalides sont ignorées, comme les scores déjà
+        enregistrés (même jeu, joueur, score et date). Avec le stockage
+        JSON, seuls les scores qui entrent dans un classement sont gardés ;
+        les autres sont seulement comptés (voir `get_score_rank`).
+        Retourne {"read", "imported", "duplicates", "invalid", "ignored",
+        "seconds", "records_per_second"}, ou None en cas d'erreur.
+        """
+        start = time.perf_counter()
+        stats = {"read": 0, "imported": 0, "duplicates": 0, "invalid": 0, "ignored": 0}
+        try:
+            with self._lock:
+                self.flush()
+                batch = []
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line_number, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        stats["read"] += 1
+                        try:
+                            batch.append(_parse_record(json.loads(line)))
+                        except (ValueError, TypeError) as e:
+                            stats["invalid"] += 1
+                            print(f"Ligne {line_number} ignorée : {e}")
+                            continue
+                        if len(batch) >= batch_size:
+                            self._import_batch(batch, stats)
+                            batch = []
+                self._import_batch(batch, stats)
+        except Exception as e:
+            print(f"Erreur lors de l'import des scores : {e}")
+            return None
+        seconds = time.perf_counter() - start
+        stats["seconds"] = seconds
+        stats["records_per_second"] = stats["read"] / seconds if seconds > 0 else 0.0
+        return stats
+
+    def _import_batch(self, batch, stats):
+        """Écrit un lot de scores importés, jeu par jeu, sans les doublons
+
+        Avec SQLite, un doublon est cherché dans la base ; avec le stockage
+        JSON, dans l'index des parties déjà comptées, y compris celles hors
+        classement (voir `RunCounter`).
+        """
+        seen = set()  # Doublons à l'intérieur du lot
+        for game_id in dict.fromkeys(game_id for game_id, _ in batch):
+            with self.storage.locked(game_id):
+                self._checked_at[game_id] = 0.0
+                scores = self._load(game_id)
+                entries = [entry for batch_game, entry in batch if batch_game == game_id]
+                if self.storage.keeps_history:
+                    known = [self.storage.contains(game_id, entry) for entry in entries]
+                else:
+                    known = self.storage.counted_runs(game_id, entries)
+                runs = []
+                fresh = []
+                for entry, duplicate in zip(entries, known):
+                    key = _record_key(game_id, entry)
+                    if duplicate or key in seen:
+                        stats["duplicates"] += 1
+                        continue
+                    seen.add(key)
+                    runs.append(entry)
+                    if not insert_score(scores, game_id, entry, self.max_scores) \
+                            and not self.storage.keeps_history:
+                        stats["ignored"] += 1  # Sous le seuil du classement : seulement compté
+                        continue
+                    fresh.append(entry)
+                if runs:
+                    self.storage.append_runs(game_id, runs)
+                    self._ranks.pop(game_id, None)
+                if fresh:
+                    self.storage.append(game_id, fresh, scores)
+                    stats["imported"] += len(fresh)
+                    if self.storage.journal_length(game_id) >= self.compact_threshold:
+                        self.storage.compact(game_id, scores)
+
     def get_scores_file(self, game_id):
         """Retourne le chemin du fichier de scores pour un jeu donné"""
-        return self.scores_dir / f"{game_id}_scores.json"
-        
+        return Path(self.scores_dir) / f"{game_id}_scores.json"
+
     def format_scores_for_display(self, game_id):
         """Formate les scores pour l'affichage"""
         try:
             scores = self.get_scores(game_id)
             if not scores:
                 return "Aucun score enregistré"
-                
+
             formatted = "🏆 Meilleurs Scores 🏆\n\n"
             for i, score in enumerate(scores, 1):
                 formatted += f"{i}. {score['player']}: {score['score']}\n"
             return formatted
         except Exception as e:
             print(f"Erreur lors du formatage des scores : {e}")
-            return "Erreur lors de l'affichage des scores" 
\ No newline at end of file
+            return "Erreur lors de l'affichage des scores"
+
+
+def create_score_manager(config):
+    """Crée le gestionnaire de scores selon la configuration
+
+    Clés `performance.score_backend` ("json" ou "sqlite"),
+    `performance.score_database` et `performance.leaderboard_size`.
+    """
+    return ScoreManager(
+        backend=config.get_performance_setting('score_backend', 'json'),
+        database_file=config.get_performance_setting('score_database', 'scores.db'),
+        max_scores=config.get_performance_setting('leaderboard_size', MAX_SCORES)
+    )
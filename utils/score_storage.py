@@ -0,0 +1,1111 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import uuid
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from heapq import merge
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from utils.leaderboard import Leaderboard
+
+# (jeu, mode, difficulté) : None désigne tous les modes ou toutes les difficultés
+BoardKey = Tuple[str, Optional[str], Optional[str]]
+# (jeu, mode, difficulté, période) : classement d'un jour, d'une semaine ou d'un mois
+WindowKey = Tuple[str, Optional[str], Optional[str], str]
+# classement -> meilleurs scores, du meilleur au moins bon
+Scores = Dict[Any, Leaderboard]
+
+# Fenêtres de temps des classements périodiques
+WINDOWS = ("day", "week", "month")
+
+# Résultats de ScoreJournal.changes()
+CHANGED_TAIL = "tail"
+CHANGED_FULL = "full"
+
+
+def board_keys(game_id: str, entry: Dict[str, Any]) -> List[BoardKey]:
+    """Classements auxquels appartient un score
+
+    Le classement général du jeu, celui de son mode et celui de son mode à
+    sa difficulté : chacun est ensuite lu directement, sans filtrer.
+    """
+    mode = entry.get('mode')
+    difficulty = entry.get('difficulty')
+    keys = [(game_id, None, None)]
+    if mode is not None:
+        keys.append((game_id, mode, None))
+    if difficulty is not None:
+        keys.append((game_id, mode, difficulty))
+    return keys
+
+
+def period_of(window: str, moment: datetime) -> str:
+    """Période d'une fenêtre contenant un instant, ex. 2026-10-17, 2026-W42 ou 2026-10"""
+    if window == "day":
+        return f"{moment.year:04d}-{moment.month:02d}-{moment.day:02d}"
+    if window == "week":
+        year, week, _ = moment.isocalendar()
+        return f"{year}-W{week:02d}"
+    if window == "month":
+        return f"{moment.year:04d}-{moment.month:02d}"
+    raise ValueError(f"Fenêtre inconnue : {window}")
+
+
+def current_periods(now: Optional[datetime] = None) -> Dict[str, str]:
+    """Période en cours de chaque fenêtre"""
+    now = now or datetime.now()
+    return {window: period_of(window, now) for window in WINDOWS}
+
+
+def period_bounds(window: str, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Début (inclus) et fin (exclue) de la période en cours d'une fenêtre"""
+    today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    if window == "day":
+        return today, today + timedelta(days=1)
+    if window == "week":
+        start = today - timedelta(days=today.weekday())
+        return start, start + timedelta(days=7)
+    if window == "month":
+        start = today.replace(day=1)
+        return start, (start + timedelta(days=32)).replace(day=1)
+    raise ValueError(f"Fenêtre inconnue : {window}")
+
+
+def window_keys(game_id: str, entry: Dict[str, Any], periods: Optional[Dict[str, str]] = None) -> List[WindowKey]:
+    """Classements des périodes en cours auxquels appartient un score daté"""
+    date = entry.get('date')
+    if not date:
+        return []
+    periods = periods or current_periods()
+    moment = datetime.fromisoformat(date)
+    return [
+        key + (period,)
+        for window, period in periods.items() if period_of(window, moment) == period
+        for key in board_keys(game_id, entry)
+    ]
+
+
+def evict_expired(scores: Scores, periods: Dict[str, str]) -> int:
+    """Retire les classements des périodes terminées ; retourne leur nombre"""
+    current = set(periods.values())
+    expired = [key for key in scores if len(key) == 4 and key[3] not in current]
+    for key in expired:
+        del scores[key]
+    return len(expired)
+
+
+def insert_score(scores: Scores, game_id: str, entry: Dict[str, Any], limit: int = 10,
+                 periods: Optional[Dict[str, str]] = None) -> bool:
+    """Ajoute un score aux classements dont il relève
+
+    Classements de tous les temps, et ceux du jour, de la semaine et du
+    mois en cours si le score en est daté. Un score déjà présent (même
+    `id`) est ignoré : rejouer deux fois le même journal ne duplique rien.
+    Retourne False si le score n'est entré dans aucun classement.
+    """
+    inserted = False
+    for key in board_keys(game_id, entry) + window_keys(game_id, entry, periods):
+        board = scores.get(key)
+        if board is None:
+            board = scores[key] = Leaderboard(limit)
+        inserted = board.insert(entry) or inserted
+    return inserted
+
+
+# Anciens scores : le mode (calcul mental) ou la vitesse (frappe) étaient ajoutés au nom du joueur
+_LEGACY_MODE = re.compile(r"^(.*) \((timer|lives)\)$")
+_LEGACY_WPM = re.compile(r"^(.*) \(WPM: (\d+(?:\.\d+)?)\)$")
+
+
+def upgrade_legacy_entry(game_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Range un ancien score dans son mode et retire du nom ce qui n'en fait pas partie
+
+    "Joueur (timer)" du calcul mental devient le joueur "Joueur" du mode
+    timer ; "Joueur (WPM: 42)" du jeu de frappe devient "Joueur", la vitesse
+    passant dans le résumé de la partie. Les autres scores sont retournés
+    tels quels.
+    """
+    player = entry.get('player')
+    if not isinstance(player, str) or not player.endswith(')'):
+        return entry
+    if game_id == "mental_calc" and entry.get('mode') is None:
+        match = _LEGACY_MODE.match(player)
+        if match:
+            return dict(entry, player=match.group(1), mode=match.group(2))
+    if game_id == "typer_game":
+        match = _LEGACY_WPM.match(player)
+        if match:
+            upgraded = dict(entry, player=match.group(1))
+            if not upgraded.get('details'):
+                upgraded['details'] = {'wpm': float(match.group(2))}
+            return upgraded
+    return entry
+
+
+def build_boards(data: Dict[str, List[Dict[str, Any]]], limit: int = 10,
+                 periods: Optional[Dict[str, str]] = None) -> Scores:
+    """Classements construits à partir des scores enregistrés par jeu
+
+    Les anciens scores sont mis au format actuel (voir `upgrade_legacy_entry`).
+    """
+    periods = periods or current_periods()
+    grouped: Dict[Any, List[Dict[str, Any]]] = {}
+    for game_id, entries in data.items():
+        for entry in entries:
+            entry = upgrade_legacy_entry(game_id, entry)
+            for key in board_keys(game_id, entry) + window_keys(game_id, entry, periods):
+                grouped.setdefault(key, []).append(entry)
+    return {key: Leaderboard(limit, entries) for key, entries in grouped.items()}
+
+
+def to_json(scores: Scores) -> Dict[str, List[Dict[str, Any]]]:
+    """Classements sous la forme enregistrée dans scores.json
+
+    Chaque jeu garde l'union de ses classements, périodes en cours
+    comprises : relue par `build_boards`, elle redonne les mêmes classements.
+    """
+    data: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    for key, board in scores.items():
+        game_entries = data.setdefault(key[0], {})
+        for entry in board:
+            game_entries[id(entry)] = entry
+    return {
+        game_id: sorted(entries.values(), key=lambda e: -e['score'])
+        for game_id, entries in data.items()
+    }
+
+
+def count_runs(counts: Dict[BoardKey, Dict[float, int]], game_id: str, entry: Dict[str, Any], runs: int = 1):
+    """Compte une partie (ou `runs` parties au même score) dans la répartition de ses classements"""
+    for key in board_keys(game_id, entry):
+        board = counts.setdefault(key, {})
+        board[entry['score']] = board.get(entry['score'], 0) + runs
+
+
+def run_hash(entry: Dict[str, Any]) -> int:
+    """Empreinte sur 8 octets du (joueur, score, date) d'une partie"""
+    key = json.dumps([entry['player'], float(entry['score']), entry.get('date')], ensure_ascii=False)
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class FileLock:
+    """Verrou consultatif entre processus, posé sur un fichier dédié
+
+    `fcntl.flock` sous Unix, `msvcrt.locking` sous Windows. Le verrou est
+    réentrant dans un même objet : seul le dernier `release` le libère.
+    Le fichier de verrou n'est jamais supprimé (le supprimer permettrait à
+    deux processus de verrouiller deux fichiers différents).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    def acquire(self):
+        if self._depth == 0:
+            f = open(self.path, 'a+b')
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                else:
+                    f.seek(0)
+                    while True:
+                        try:
+                            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            time.sleep(0.01)  # LK_LOCK abandonne après 10 essais
+            except BaseException:
+                f.close()
+                raise
+            self._file = f
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            f, self._file = self._file, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                f.close()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def _fsync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class ScoreJournal:
+    """Stockage des scores : instantané JSON + journal en ajout seul
+
+    Chaque score est ajouté au journal sur une ligne JSON, et chaque lot
+    est synchronisé sur disque (fsync) : un arrêt brutal ne perd au pire
+    que la dernière ligne, incomplète, ignorée à la relecture. Le compactage
+    réécrit l'instantané (fichier temporaire puis renommage atomique) et
+    supprime le journal ; s'il est interrompu entre les deux, le journal est
+    rejoué une seconde fois sans effet grâce aux identifiants des scores.
+
+    Plusieurs processus peuvent partager les mêmes fichiers : chaque
+    écriture se fait sous `locked()`, après avoir relu ce que les autres
+    ont écrit depuis (voir `ScoreManager.flush`).
+    """
+
+    # Ne garde que les `limit` meilleurs scores de chaque jeu
+    keeps_history = False
+
+    def __init__(self, snapshot_file: str, journal_file: Optional[str] = None, limit: int = 10):
+        self.snapshot_file = snapshot_file
+        self.journal_file = journal_file or os.path.splitext(snapshot_file)[0] + ".journal"
+        self.limit = limit
+        self.journal_records = 0  # Lignes du journal depuis le dernier compactage
+        self._snapshot_state = None  # (inode, mtime_ns, taille) de l'instantané lu
+        self._journal_offset = 0  # Octets du journal déjà rejoués
+        self._lock = FileLock(f"{snapshot_file}.lock")
+
+    def locked(self):
+        """Verrou exclusif entre processus, à tenir pendant une lecture suivie d'une écriture"""
+        return self._lock
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+            return stat.st_ino, stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _journal_size(self) -> int:
+        state = self._stat(self.journal_file)
+        return state[2] if state else 0
+
+    def load(self) -> Scores:
+        """Lit l'instantané puis rejoue tout le journal"""
+        self._snapshot_state = self._stat(self.snapshot_file)
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        scores = build_boards(data if isinstance(data, dict) else {}, self.limit)
+        self._journal_offset = 0
+        self.journal_records = 0
+        self.replay_tail(scores)
+        return scores
+
+    def changes(self) -> Optional[str]:
+        """Indique si les fichiers ont changé depuis la dernière lecture
+
+        CHANGED_TAIL : seules de nouvelles lignes ont été ajoutées au journal ;
+        CHANGED_FULL : l'instantané a été réécrit, il faut tout relire.
+        """
+        journal_size = self._journal_size()
+        if self._stat(self.snapshot_file) != self._snapshot_state or journal_size < self._journal_offset:
+            return CHANGED_FULL
+        if journal_size > self._journal_offset:
+            return CHANGED_TAIL
+        return None
+
+    def replay_tail(self, scores: Scores) -> int:
+        """Rejoue les lignes du journal pas encore lues ; retourne leur nombre"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        # Une dernière ligne sans fin de ligne est en cours d'écriture (ou tronquée)
+        end = data.rfind(b'\n') + 1
+        replayed = 0
+        periods = current_periods()
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                insert_score(scores, record['game'], record['entry'], self.limit, periods)
+                replayed += 1
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Ligne du journal des scores ignorée : {e}")
+        self._journal_offset += end
+        self.journal_records += replayed
+        return replayed
+
+    def append(self, records: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Ajoute un lot de scores au journal, synchronisé sur disque
+
+        À appeler sous `locked()`, une fois le journal relu jusqu'au bout.
+        """
+        lines = [
+            json.dumps({"game": game_id, "entry": entry}, ensure_ascii=False) + "\n"
+            for game_id, entry in records
+        ]
+        if not lines:
+            return
+        with open(self.journal_file, 'ab') as f:
+            # Une ligne tronquée par un arrêt brutal ne doit pas absorber la suivante
+            if f.tell() > 0 and self._last_byte() != b'\n':
+                f.write(b'\n')
+            f.write("".join(lines).encode('utf-8'))
+            _fsync(f)
+            self._journal_offset = f.tell()
+        self.journal_records += len(lines)
+
+    def _last_byte(self) -> bytes:
+        with open(self.journal_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1)
+
+    def compact(self, scores: Scores):
+        """Réécrit l'instantané avec les scores actuels et vide le journal
+
+        À appeler sous `locked()`, une fois le journal relu jusqu'au bout.
+        """
+        tmp_file = f"{self.snapshot_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            # json.dumps passe par l'encodeur C, bien plus rapide que json.dump sur un fichier
+            f.write(json.dumps(to_json(scores), ensure_ascii=False))
+            _fsync(f)
+        os.replace(tmp_file, self.snapshot_file)
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+        self._snapshot_state = self._stat(self.snapshot_file)
+        self._journal_offset = 0
+        self.journal_records = 0
+
+    def has_journal(self) -> bool:
+        return os.path.exists(self.journal_file)
+
+
+class RunCounter:
+    """Nombre de parties par score d'un jeu, y compris hors classement
+
+    L'instantané `{jeu}_runs.json` garde les compteurs de chaque classement
+    ({score: nombre}), dont la taille dépend du nombre de scores distincts
+    et non du nombre de parties. Chaque lot de parties ajoute une ligne au
+    journal `{jeu}_runs.journal` : ses compteurs et les empreintes de ses
+    parties (voir `run_hash`). Au compactage, les compteurs sont repliés
+    dans l'instantané et les empreintes fusionnées dans `{jeu}_runs.idx`,
+    un tableau trié d'entiers de 8 octets : une partie y est cherchée par
+    dichotomie, sans charger l'index en mémoire. L'instantané retient les
+    lots qu'il contient déjà, pour qu'un compactage interrompu ne les
+    compte pas deux fois.
+
+    Le journal n'est pas synchronisé sur disque (fsync) : un arrêt brutal
+    peut au pire oublier les dernières parties comptées. Les classements,
+    eux, ne sont pas touchés par une partie hors classement.
+    """
+
+    # Empreintes gardées dans le journal (et en mémoire) avant un compactage
+    COMPACT_RUNS = 10000
+    # Empreintes lues ou écrites à la fois lors de la fusion de l'index
+    CHUNK = 1 << 16
+
+    def __init__(self, snapshot_file: str, game_id: str, seed: Optional[Callable[[], List[Dict[str, Any]]]] = None):
+        self.snapshot_file = snapshot_file
+        base = os.path.splitext(snapshot_file)[0]
+        self.journal_file = base + ".journal"
+        self.index_file = base + ".idx"
+        self.game_id = game_id
+        # Parties connues avant le premier comptage (scores gardés dans les classements)
+        self.seed = seed
+        self._snapshot_state = None
+        self._journal_offset = 0
+        self._counts: Dict[BoardKey, Dict[float, int]] = {}
+        self._recent: set = set()  # Empreintes du journal, pas encore dans l'index
+        self._folded: set = set()  # Lots du journal déjà repliés dans l'instantané
+        self._seeded = False
+
+    def state(self):
+        """Change quand des parties sont comptées ou que le compteur est compacté"""
+        return ScoreJournal._stat(self.snapshot_file), ScoreJournal._stat(self.journal_file)
+
+    def _sync(self):
+        """Relit l'instantané s'il a changé, puis les lignes du journal pas encore lues"""
+        snapshot_state = ScoreJournal._stat(self.snapshot_file)
+        journal_state = ScoreJournal._stat(self.journal_file)
+        journal_size = journal_state[2] if journal_state else 0
+        if self._snapshot_state is None or snapshot_state != self._snapshot_state[0] \
+                or journal_size < self._journal_offset or (self._seeded and journal_state):
+            self._load_snapshot(snapshot_state, journal_state is None)
+        if journal_size > self._journal_offset:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+            end = data.rfind(b'\n') + 1
+            for line in data[:end].splitlines():
+                try:
+                    self._apply(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Ligne du journal des parties ignorée : {e}")
+            self._journal_offset += end
+
+    def _load_snapshot(self, snapshot_state, no_journal: bool):
+        self._snapshot_state = (snapshot_state,)
+        self._journal_offset = 0
+        self._counts = {}
+        self._recent = set()
+        self._folded = set()
+        self._seeded = False
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            if no_journal and self.seed:
+                # Scores enregistrés avant le comptage des parties
+                for entry in self.seed():
+                    count_runs(self._counts, self.game_id, entry)
+                    self._recent.add(run_hash(entry))
+                self._seeded = True
+            return
+        self._folded = set(data.get('batches', []))
+        for board in data.get('boards', []):
+            self._counts[(self.game_id, board.get('mode'), board.get('difficulty'))] = {
+                score: count for score, count in board['counts']
+            }
+
+    def _apply(self, record: Dict[str, Any]):
+        if record['batch'] in self._folded:
+            return  # Déjà dans l'instantané (compactage interrompu)
+        for mode, difficulty, score, runs in record['counts']:
+            count_runs(self._counts, self.game_id, {'score': score, 'mode': mode, 'difficulty': difficulty}, runs)
+        self._recent.update(record['keys'])
+
+    def counts(self) -> Dict[BoardKey, Dict[float, int]]:
+        """{classement: {score: nombre de parties}}"""
+        self._sync()
+        return {key: dict(board) for key, board in self._counts.items()}
+
+    def counted(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """Indique, pour chaque partie, si elle est déjà comptée"""
+        self._sync()
+        hashes = [run_hash(entry) for entry in entries]
+        found = [value in self._recent for value in hashes]
+        missing = [i for i, value in enumerate(found) if not value]
+        if missing and os.path.exists(self.index_file):
+            with open(self.index_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size // 8
+                for i in missing:
+                    found[i] = self._search(f, size, hashes[i])
+        return found
+
+    @staticmethod
+    def _search(f, size: int, value: int) -> bool:
+        """Recherche dichotomique dans l'index trié, sans le charger"""
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            f.seek(middle * 8)
+            current = int.from_bytes(f.read(8), 'little')
+            if current == value:
+                return True
+            if current < value:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """Compte un lot de parties ; à appeler sous le verrou des fichiers du jeu"""
+        self._sync()
+        # Premier comptage : les scores déjà gardés sont aussi des parties connues
+        counted = self.seed() if self._seeded else []
+        self._seeded = False
+        runs: Dict[Tuple[Optional[str], Optional[str], float], int] = {}
+        for entry in list(counted) + list(entries):
+            key = (entry.get('mode'), entry.get('difficulty'), entry['score'])
+            runs[key] = runs.get(key, 0) + 1
+        record = {
+            "batch": uuid.uuid4().hex,
+            "counts": [[mode, difficulty, score, count] for (mode, difficulty, score), count in runs.items()],
+            "keys": [run_hash(entry) for entry in list(counted) + list(entries)],
+        }
+        with open(self.journal_file, 'ab') as f:
+            if f.tell() > 0 and f.tell() != self._journal_offset:
+                f.write(b'\n')  # Ligne tronquée par un arrêt brutal
+            f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+        if counted:
+            # Les scores gardés, comptés en mémoire, sont maintenant dans le journal
+            self._counts, self._recent = {}, set()
+        self._sync()
+        if len(self._recent) >= self.COMPACT_RUNS:
+            self.compact()
+
+    def compact(self):
+        """Replie le journal dans l'instantané et l'index ; sous le verrou des fichiers du jeu"""
+        self._sync()
+        if not os.path.exists(self.journal_file):
+            return
+        batches = []
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    batches.append(json.loads(line)['batch'])
+                except (ValueError, KeyError, TypeError):
+                    pass
+        self._merge_index(sorted(self._recent))
+        data = {
+            "boards": [
+                {"mode": mode, "difficulty": difficulty, "counts": sorted(board.items())}
+                for (_, mode, difficulty), board in self._counts.items()
+            ],
+            "batches": batches,
+        }
+        tmp_file = f"{self.snapshot_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False))
+            _fsync(f)
+        os.replace(tmp_file, self.snapshot_file)
+        os.remove(self.journal_file)
+        self._snapshot_state = (ScoreJournal._stat(self.snapshot_file),)
+        self._journal_offset = 0
+        self._recent = set()
+        self._folded = set(batches)
+
+    def _merge_index(self, hashes: List[int]):
+        """Fusionne des empreintes triées dans l'index, morceau par morceau"""
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'wb') as out:
+            chunk = array('Q')
+            last = None
+            for value in merge(self._read_index(), hashes):
+                if value == last:
+                    continue
+                last = value
+                chunk.append(value)
+                if len(chunk) >= self.CHUNK:
+                    self._write_chunk(out, chunk)
+                    chunk = array('Q')
+            self._write_chunk(out, chunk)
+            _fsync(out)
+        os.replace(tmp_file, self.index_file)
+
+    def _read_index(self) -> Iterator[int]:
+        try:
+            with open(self.index_file, 'rb') as f:
+                while True:
+                    data = f.read(8 * self.CHUNK)
+                    if not data:
+                        return
+                    chunk = array('Q', data)
+                    if sys.byteorder == 'big':
+                        chunk.byteswap()
+                    yield from chunk
+        except FileNotFoundError:
+            return
+
+    @staticmethod
+    def _write_chunk(f, chunk: 'array'):
+        if sys.byteorder == 'big':
+            chunk.byteswap()
+        f.write(chunk.tobytes())
+
+    def has_journal(self) -> bool:
+        return os.path.exists(self.journal_file)
+
+
+class ShardedScoreStore:
+    """Scores répartis en un fichier par jeu, avec un manifeste
+
+    Chaque jeu a son instantané `{jeu}_scores.json`, son journal et son
+    verrou (voir `ScoreJournal`) dans `scores_dir` : enregistrer un score
+    ne touche que les fichiers de son jeu. `{jeu}_runs.json` compte les
+    parties par score, y compris celles hors classement, pour situer un
+    score parmi toutes les parties (voir `RunCounter`). `manifest.json` résume chaque
+    jeu (nombre de scores, meilleur score) ; les menus le lisent seul, sans
+    ouvrir les fichiers des jeux. Le manifeste se reconstruit à partir des
+    fichiers des jeux s'il disparaît. Un ancien `scores.json` unique
+    (`legacy_file`) est réparti dans les fichiers des jeux au premier
+    lancement.
+    """
+
+    keeps_history = False
+    SHARD_SUFFIX = "_scores.json"
+    RUNS_SUFFIX = "_runs.json"
+
+    def __init__(self, scores_dir: str, limit: int = 10, legacy_file: Optional[str] = None):
+        self.scores_dir = scores_dir
+        self.limit = limit
+        self.manifest_file = os.path.join(scores_dir, "manifest.json")
+        os.makedirs(scores_dir, exist_ok=True)
+        self._shards: Dict[str, ScoreJournal] = {}
+        self._runs: Dict[str, RunCounter] = {}
+        self._manifest_lock = FileLock(f"{self.manifest_file}.lock")
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._manifest_state = None
+        if legacy_file and os.path.exists(legacy_file) and not os.path.exists(self.manifest_file):
+            self._migrate(legacy_file)
+
+    def shard_file(self, game_id: str) -> str:
+        """Instantané des scores d'un jeu"""
+        return os.path.join(self.scores_dir, f"{game_id}{self.SHARD_SUFFIX}")
+
+    def shard(self, game_id: str) -> ScoreJournal:
+        if game_id not in self._shards:
+            self._shards[game_id] = ScoreJournal(self.shard_file(game_id), limit=self.limit)
+        return self._shards[game_id]
+
+    def _migrate(self, legacy_file: str):
+        """Répartit un ancien scores.json (et son journal) dans les fichiers des jeux"""
+        with self._manifest_lock:
+            if os.path.exists(self.manifest_file):
+                return  # Déjà fait par un autre processus
+            by_game: Dict[str, Scores] = {}
+            for key, board in ScoreJournal(legacy_file, limit=self.limit).load().items():
+                by_game.setdefault(key[0], {})[key] = board
+            for game_id, scores in by_game.items():
+                shard = self.shard(game_id)
+                with shard.locked():
+                    shard.compact(scores)
+            self._write_manifest({game_id: self._summarize(game_id, scores) for game_id, scores in by_game.items()})
+
+    @staticmethod
+    def _summarize(game_id: str, scores: Scores) -> Dict[str, Any]:
+        board = scores.get((game_id, None, None))
+        return {"count": len(board) if board else 0, "best": board[0] if board else None}
+
+    def _write_manifest(self, games: Dict[str, Dict[str, Any]]):
+        # Le manifeste se reconstruit à partir des jeux : pas de fsync
+        tmp_file = f"{self.manifest_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"games": games}, ensure_ascii=False))
+        os.replace(tmp_file, self.manifest_file)
+        self._manifest = games
+        self._manifest_state = ScoreJournal._stat(self.manifest_file)
+
+    def _rebuild_manifest(self):
+        """Reconstruit le manifeste à partir des fichiers des jeux"""
+        with self._manifest_lock:
+            games = {}
+            for name in os.listdir(self.scores_dir):
+                if name.endswith(self.SHARD_SUFFIX):
+                    game_id = name[:-len(self.SHARD_SUFFIX)]
+                    games[game_id] = self._summarize(game_id, self.shard(game_id).load())
+            self._write_manifest(games)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """{jeu: {"count": nombre de scores, "best": meilleur score}}, lu dans le manifeste"""
+        state = ScoreJournal._stat(self.manifest_file)
+        if state is None:
+            if any(name.endswith(self.SHARD_SUFFIX) for name in os.listdir(self.scores_dir)):
+                self._rebuild_manifest()
+            return self._manifest
+        if state != self._manifest_state:
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f).get("games", {})
+            except (OSError, ValueError) as e:
+                print(f"Manifeste des scores illisible, reconstruit : {e}")
+                self._rebuild_manifest()
+                return self._manifest
+            self._manifest_state = state
+        return self._manifest
+
+    def games(self) -> List[str]:
+        """Jeux ayant des scores"""
+        return list(self.summary())
+
+    def export_scores(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Scores de tous les jeux, sous la forme de scores.json"""
+        data = {}
+        for game_id in self.games():
+            data.update(to_json(self.load(game_id)))
+        return data
+
+    def load(self, game_id: str) -> Scores:
+        return self.shard(game_id).load()
+
+    def changes(self, game_id: str) -> Optional[str]:
+        return self.shard(game_id).changes()
+
+    def replay_tail(self, game_id: str, scores: Scores) -> int:
+        return self.shard(game_id).replay_tail(scores)
+
+    def append(self, game_id: str, entries: List[Dict[str, Any]], scores: Scores):
+        """Ajoute des scores au journal du jeu et met son résumé à jour
+
+        À appeler sous `locked(game_id)`, avec les classements du jeu à jour.
+        """
+        self.shard(game_id).append((game_id, entry) for entry in entries)
+        with self._manifest_lock:
+            self._manifest_state = None
+            games = dict(self.summary())
+            games[game_id] = self._summarize(game_id, scores)
+            self._write_manifest(games)
+
+    def compact(self, game_id: str, scores: Scores):
+        self.shard(game_id).compact(scores)
+
+    def runs_file(self, game_id: str) -> str:
+        """Nombre de parties par score d'un jeu"""
+        return os.path.join(self.scores_dir, f"{game_id}{self.RUNS_SUFFIX}")
+
+    def runs(self, game_id: str) -> RunCounter:
+        if game_id not in self._runs:
+            self._runs[game_id] = RunCounter(self.runs_file(game_id), game_id,
+                                             seed=lambda: self._kept_entries(game_id))
+        return self._runs[game_id]
+
+    def runs_state(self, game_id: str):
+        """Change quand des parties du jeu sont enregistrées"""
+        return self.runs(game_id).state()
+
+    def score_counts(self, game_id: str) -> Dict[BoardKey, Dict[float, int]]:
+        """{classement: {score: nombre de parties}} d'un jeu
+
+        Sans fichier de parties (scores enregistrés avant son ajout), seuls
+        les scores gardés dans les classements sont comptés.
+        """
+        return self.runs(game_id).counts()
+
+    def _kept_entries(self, game_id: str) -> List[Dict[str, Any]]:
+        """Scores gardés dans les fichiers du jeu, lus sans toucher à l'état du cache"""
+        return to_json(ScoreJournal(self.shard_file(game_id), limit=self.limit).load()).get(game_id, [])
+
+    def counted_runs(self, game_id: str, entries: List[Dict[str, Any]]) -> List[bool]:
+        """Indique, pour chaque partie, si elle est déjà comptée (doublons à l'import)"""
+        return self.runs(game_id).counted(entries)
+
+    def append_runs(self, game_id: str, entries: List[Dict[str, Any]]):
+        """Compte des parties d'un jeu, qu'elles entrent ou non dans un classement
+
+        À appeler sous `locked(game_id)`, avant d'ajouter les mêmes scores au journal.
+        """
+        self.runs(game_id).append(entries)
+
+    def journal_length(self, game_id: str) -> int:
+        """Lignes du journal du jeu depuis son dernier compactage"""
+        return self.shard(game_id).journal_records
+
+    def has_journal(self, game_id: str) -> bool:
+        return self.shard(game_id).has_journal()
+
+    def locked(self, game_id: str):
+        """Verrou des fichiers d'un jeu"""
+        return self.shard(game_id).locked()
+
+    def close(self):
+        pass
+
+
+_SCORE_COLUMNS = "id, player, score, date, details, mode, difficulty"
+# Filtre de chaque sorte de classement, servi par son propre index
+_BOARD_FILTERS = {
+    "game": "game_id = ?",
+    "mode": "game_id = ? AND mode = ?",
+    "board": "game_id = ? AND mode = ? AND difficulty = ?",
+}
+
+
+class SqliteScoreStore:
+    """Stockage des scores dans une base SQLite, historique complet
+
+    Mode WAL (lectures concurrentes pendant une écriture), requêtes à
+    paramètres (préparées une fois et gardées en cache par sqlite3). Chaque
+    classement (jeu ; jeu et mode ; jeu, mode et difficulté) a son index
+    trié par score, l'index (jeu, joueur, score) sert les records
+    personnels et celui sur (jeu, date) les périodes. Le nombre de scores
+    de chaque classement est tenu à jour par des déclencheurs : aucune
+    requête ne parcourt toute la table. Mode et difficulté absents sont
+    enregistrés comme chaînes vides.
+    """
+
+    keeps_history = True
+    SCHEMA_VERSION = 2
+
+    TABLE = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id TEXT PRIMARY KEY,
+            game_id TEXT NOT NULL,
+            player TEXT NOT NULL,
+            score NUMERIC NOT NULL,
+            date TEXT,
+            details TEXT,
+            mode TEXT NOT NULL DEFAULT '',
+            difficulty TEXT NOT NULL DEFAULT ''
+        );
+    """
+
+    SCHEMA = """
+        CREATE INDEX IF NOT EXISTS idx_scores_game_score ON scores (game_id, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_scores_game_mode_score ON scores (game_id, mode, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_scores_board_score ON scores (game_id, mode, difficulty, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_scores_game_player ON scores (game_id, player, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_scores_game_date ON scores (game_id, date);
+        CREATE TABLE IF NOT EXISTS score_boards (
+            game_id TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (game_id, mode, difficulty)
+        );
+        CREATE TRIGGER IF NOT EXISTS scores_board_insert AFTER INSERT ON scores BEGIN
+            INSERT INTO score_boards (game_id, mode, difficulty, count)
+            VALUES (NEW.game_id, NEW.mode, NEW.difficulty, 1)
+            ON CONFLICT (game_id, mode, difficulty) DO UPDATE SET count = count + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS scores_board_delete AFTER DELETE ON scores BEGIN
+            UPDATE score_boards SET count = count - 1
+            WHERE game_id = OLD.game_id AND mode = OLD.mode AND difficulty = OLD.difficulty;
+        END;
+    """
+
+    # Version 1 : ni mode ni difficulté, un seul compteur par jeu
+    MIGRATE_V1 = """
+        ALTER TABLE scores ADD COLUMN mode TEXT NOT NULL DEFAULT '';
+        ALTER TABLE scores ADD COLUMN difficulty TEXT NOT NULL DEFAULT '';
+        DROP TRIGGER IF EXISTS scores_count_insert;
+        DROP TRIGGER IF EXISTS scores_count_delete;
+        DROP TABLE IF EXISTS score_counts;
+    """
+
+    _INSERT = ("INSERT OR IGNORE INTO scores (id, game_id, player, score, date, details, mode, difficulty) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+    _TOP = {
+        kind: f"SELECT {_SCORE_COLUMNS} FROM scores WHERE {where} ORDER BY score DESC, rowid LIMIT ?"
+        for kind, where in _BOARD_FILTERS.items()
+    }
+    _BEST = {
+        kind: f"SELECT {_SCORE_COLUMNS} FROM scores WHERE {where} AND player = ? ORDER BY score DESC, rowid LIMIT 1"
+        for kind, where in _BOARD_FILTERS.items()
+    }
+    _COUNT = {
+        kind: f"SELECT COALESCE(SUM(count), 0) FROM score_boards WHERE {where}"
+        for kind, where in _BOARD_FILTERS.items()
+    }
+    _COUNTS = "SELECT game_id, SUM(count) FROM score_boards GROUP BY game_id HAVING SUM(count) > 0"
+    _BOARDS = "SELECT mode, difficulty FROM score_boards WHERE game_id = ? AND count > 0"
+    _GAMES = "SELECT DISTINCT game_id FROM score_boards WHERE count > 0"
+    _HISTORY = f"SELECT {_SCORE_COLUMNS} FROM scores WHERE game_id = ? ORDER BY rowid"
+    _WINDOW_TOP = {
+        kind: f"SELECT {_SCORE_COLUMNS} FROM scores WHERE {where} AND date >= ? AND date < ? "
+              "ORDER BY score DESC, rowid LIMIT ?"
+        for kind, where in _BOARD_FILTERS.items()
+    }
+    _SCORE_COUNTS = ("SELECT mode, difficulty, score, COUNT(*) FROM scores WHERE game_id = ? "
+                     "GROUP BY mode, difficulty, score")
+    _CONTAINS = "SELECT 1 FROM scores WHERE game_id = ? AND player = ? AND score = ? AND date IS ? LIMIT 1"
+
+    def __init__(self, database_file: str, limit: int = 10):
+        self.database_file = database_file
+        self.limit = limit
+        # Base créée à l'ouverture : l'appelant peut y reprendre des scores existants
+        self.created = not os.path.exists(database_file)
+        # Utilisée depuis le minuteur d'écriture différée : protégée par le verrou du ScoreManager
+        self.connection = sqlite3.connect(database_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._data_versions: Dict[str, int] = {}
+
+    def _create_schema(self):
+        """Crée les tables, ou met à jour une base d'une version précédente"""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        with self.connection:
+            self.connection.executescript(self.TABLE)
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(scores)")}
+            migrate = 'mode' not in columns
+            if migrate:
+                self.connection.executescript(self.MIGRATE_V1)
+                self._upgrade_legacy_rows()
+            self.connection.executescript(self.SCHEMA)
+            if migrate:
+                self.connection.execute(
+                    "INSERT INTO score_boards (game_id, mode, difficulty, count) "
+                    "SELECT game_id, mode, difficulty, COUNT(*) FROM scores GROUP BY game_id, mode, difficulty"
+                )
+            if version < self.SCHEMA_VERSION:
+                self.connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _upgrade_legacy_rows(self):
+        """Range les anciens scores dans leur mode (voir `upgrade_legacy_entry`)"""
+        rows = self.connection.execute(
+            "SELECT id, game_id, player, details FROM scores "
+            "WHERE game_id IN ('mental_calc', 'typer_game') AND player LIKE '%)'"
+        ).fetchall()
+        for entry_id, game_id, player, details in rows:
+            entry = {'player': player, 'details': json.loads(details) if details else None}
+            upgraded = upgrade_legacy_entry(game_id, entry)
+            if upgraded is entry:
+                continue
+            self.connection.execute(
+                "UPDATE scores SET player = ?, mode = ?, details = ? WHERE id = ?",
+                (upgraded['player'], upgraded.get('mode') or '',
+                 json.dumps(upgraded['details'], ensure_ascii=False) if upgraded.get('details') else None,
+                 entry_id)
+            )
+
+    def import_scores(self, data: Dict[str, List[Dict[str, Any]]]):
+        """Reprend des scores existants, sous la forme de scores.json"""
+        with self.connection:
+            for game_id, entries in data.items():
+                self._insert(game_id, [dict(entry, id=entry.get('id') or uuid.uuid4().hex) for entry in entries])
+
+    @staticmethod
+    def _entry(row) -> Dict[str, Any]:
+        entry_id, player, score, date, details, mode, difficulty = row
+        entry = {'id': entry_id, 'player': player, 'score': score}
+        if date:
+            entry['date'] = date
+        if details:
+            entry['details'] = json.loads(details)
+        if mode:
+            entry['mode'] = mode
+        if difficulty:
+            entry['difficulty'] = difficulty
+        return entry
+
+    @staticmethod
+    def _board(game_id: str, mode: Optional[str], difficulty: Optional[str]) -> Tuple[str, tuple]:
+        """Sorte de classement et paramètres de sa requête"""
+        if difficulty is not None:
+            return "board", (game_id, mode or '', difficulty)
+        if mode is not None:
+            return "mode", (game_id, mode)
+        return "game", (game_id,)
+
+    def _version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def games(self) -> List[str]:
+        """Jeux ayant des scores"""
+        return [row[0] for row in self.connection.execute(self._GAMES)]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """{jeu: {"count": nombre de scores, "best": meilleur score}}"""
+        return {
+            game_id: {"count": count, "best": next(iter(self.top(game_id, limit=1)), None)}
+            for game_id, count in self.counts().items()
+        }
+
+    def load(self, game_id: str) -> Scores:
+        """Meilleurs scores de chaque classement d'un jeu"""
+        self._data_versions[game_id] = self._version()
+        keys = set()
+        for mode, difficulty in self.connection.execute(self._BOARDS, (game_id,)):
+            keys.update(board_keys(game_id, {'mode': mode or None, 'difficulty': difficulty or None}))
+        scores = {key: Leaderboard(self.limit, self.top(*key, limit=self.limit)) for key in keys}
+        # Meilleurs scores des périodes en cours : une requête bornée par classement et par période
+        now = datetime.now()
+        for window in WINDOWS:
+            period = period_of(window, now)
+            start, end = (bound.isoformat(timespec='seconds') for bound in period_bounds(window, now))
+            for key in keys:
+                kind, params = self._board(*key)
+                entries = [self._entry(row) for row in self.connection.execute(
+                    self._WINDOW_TOP[kind], params + (start, end, self.limit))]
+                if entries:
+                    scores[key + (period,)] = Leaderboard(self.limit, entries)
+        return scores
+
+    def changes(self, game_id: str) -> Optional[str]:
+        """CHANGED_FULL si une autre connexion a écrit depuis la dernière lecture du jeu"""
+        return CHANGED_FULL if self._version() != self._data_versions.get(game_id) else None
+
+    def replay_tail(self, game_id: str, scores: Scores) -> int:
+        return 0
+
+    def _insert(self, game_id: str, entries: List[Dict[str, Any]]):
+        self.connection.executemany(self._INSERT, [
+            (entry['id'], game_id, entry['player'], entry['score'], entry.get('date'),
+             json.dumps(entry['details'], ensure_ascii=False) if entry.get('details') else None,
+             entry.get('mode') or '', entry.get('difficulty') or '')
+            for entry in entries
+        ])
+
+    def append(self, game_id: str, entries: List[Dict[str, Any]], scores: Optional[Scores] = None):
+        """Ajoute des scores d'un jeu en une transaction"""
+        with self.connection:
+            self._insert(game_id, entries)
+
+    def compact(self, game_id: str, scores: Scores):
+        """Reporte le WAL dans la base"""
+        self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def runs_state(self, game_id: str):
+        """Change quand une autre connexion a écrit dans la base"""
+        return self._version()
+
+    def score_counts(self, game_id: str) -> Dict[BoardKey, Dict[float, int]]:
+        """{classement: {score: nombre de parties}} d'un jeu, sur tout l'historique"""
+        counts: Dict[BoardKey, Dict[float, int]] = {}
+        for mode, difficulty, score, count in self.connection.execute(self._SCORE_COUNTS, (game_id,)):
+            for key in board_keys(game_id, {'mode': mode or None, 'difficulty': difficulty or None}):
+                board = counts.setdefault(key, {})
+                board[score] = board.get(score, 0) + count
+        return counts
+
+    def append_runs(self, game_id: str, entries: List[Dict[str, Any]]):
+        """Chaque score enregistré est déjà une partie de l'historique"""
+
+    def journal_length(self, game_id: str) -> int:
+        return 0
+
+    def has_journal(self, game_id: str) -> bool:
+        return False
+
+    @contextmanager
+    def locked(self, game_id: str):
+        """SQLite verrouille lui-même la base pendant chaque transaction"""
+        yield self
+
+    def top(self, game_id: str, mode: Optional[str] = None, difficulty: Optional[str] = None,
+            limit: int = 10) -> List[Dict[str, Any]]:
+        """Les `limit` meilleurs scores d'un classement"""
+        kind, params = self._board(game_id, mode, difficulty)
+        return [self._entry(row) for row in self.connection.execute(self._TOP[kind], params + (limit,))]
+
+    def best(self, game_id: str, player: str, mode: Optional[str] = None,
+             difficulty: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Meilleur score d'un joueur dans un classement"""
+        kind, params = self._board(game_id, mode, difficulty)
+        row = self.connection.execute(self._BEST[kind], params + (player,)).fetchone()
+        return self._entry(row) if row else None
+
+    def count(self, game_id: str, mode: Optional[str] = None, difficulty: Optional[str] = None) -> int:
+        """Nombre de scores d'un classement"""
+        kind, params = self._board(game_id, mode, difficulty)
+        return self.connection.execute(self._COUNT[kind], params).fetchone()[0]
+
+    def history(self, game_id: str) -> Iterator[Dict[str, Any]]:
+        """Tous les scores d'un jeu, dans l'ordre d'enregistrement, lus au fil de l'eau"""
+        for row in self.connection.execute(self._HISTORY, (game_id,)):
+            yield self._entry(row)
+
+    def contains(self, game_id: str, entry: Dict[str, Any]) -> bool:
+        """Indique si un score identique (joueur, score, date) est déjà enregistré"""
+        params = (game_id, entry['player'], entry['score'], entry.get('date'))
+        return self.connection.execute(self._CONTAINS, params).fetchone() is not None
+
+    def counts(self) -> Dict[str, int]:
+        """Nombre de scores de chaque jeu, en une requête"""
+        return dict(self.connection.execute(self._COUNTS))
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, Optional
+
+from utils.animation_manager import AnimationManager
+from utils.config_manager import ConfigManager
+from utils.logger import get_logger
+from utils.score_manager import ScoreManager, create_score_manager
+from utils.theme_manager import ThemeManager
+from utils.word_store import WordStoreLoader, create_word_loader
+
+# Fabriques par défaut, appelées au premier accès à chaque service
+DEFAULT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "config": ConfigManager,
+    "theme": ThemeManager,
+    "animations": AnimationManager,
+    "logger": get_logger,
+    "words": create_word_loader,
+}
+
+
+class ServiceContainer:
+    """Gestionnaires partagés par l'application et tous les jeux
+
+    Chaque service est construit au premier accès puis réutilisé : un
+    fichier de configuration ou de préférences n'est lu qu'une fois par
+    processus. Les consommateurs s'abonnent aux changements (`subscribe` du
+    gestionnaire de configuration ou de thèmes) au lieu d'en garder une copie.
+    """
+
+    def __init__(self, factories: Optional[Dict[str, Callable[[], Any]]] = None):
+        self._factories = dict(DEFAULT_FACTORIES)
+        # Le stockage des scores dépend de la configuration du conteneur
+        self._factories["scores"] = lambda: create_score_manager(self.config)
+        self._factories.update(factories or {})
+        self._services: Dict[str, Any] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Déclare (ou remplace) la fabrique d'un service"""
+        self._factories[name] = factory
+        self._services.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Retourne le service, construit au premier appel"""
+        if name not in self._services:
+            if name not in self._factories:
+                raise KeyError(f"Service inconnu: {name}")
+            self._services[name] = self._factories[name]()
+        return self._services[name]
+
+    def is_created(self, name: str) -> bool:
+        """Indique si le service a déjà été construit"""
+        return name in self._services
+
+    @property
+    def config(self) -> ConfigManager:
+        return self.get("config")
+
+    @property
+    def theme(self) -> ThemeManager:
+        return self.get("theme")
+
+    @property
+    def scores(self) -> ScoreManager:
+        return self.get("scores")
+
+    @property
+    def animations(self) -> AnimationManager:
+        return self.get("animations")
+
+    @property
+    def logger(self):
+        return self.get("logger")
+
+    @property
+    def words(self) -> WordStoreLoader:
+        return self.get("words")
+
+
+# Instance globale, créée au premier appel
+_services: Optional[ServiceContainer] = None
+
+
+def get_services() -> ServiceContainer:
+    """Retourne le conteneur de services de l'application"""
+    global _services
+    if _services is None:
+        _services = ServiceContainer()
+    return _services
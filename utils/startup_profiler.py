@@ -0,0 +1,188 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Any, Callable, Dict, List, Optional
+
+
+class _TimedLoader:
+    """Enveloppe un chargeur de module pour chronométrer son exécution"""
+
+    def __init__(self, loader, finder: '_ImportTimer', name: str):
+        self.loader = loader
+        self.finder = finder
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Le module ne garde pas trace de l'enveloppe
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        self.finder.enter()
+        start = self.finder.clock()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.finder.leave(self.name, self.finder.clock() - start)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Chercheur de modules placé en tête de `sys.meta_path`
+
+    Il délègue la recherche aux autres chercheurs et ne fait qu'envelopper le
+    chargeur trouvé ; le temps propre de chaque module exclut celui des
+    modules qu'il importe lui-même.
+    """
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self.profiler = profiler
+        self.clock = profiler.clock
+        self._children: List[float] = []
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def enter(self):
+        self._children.append(0.0)
+
+    def leave(self, name: str, elapsed: float):
+        children = self._children.pop()
+        if self._children:
+            self._children[-1] += elapsed
+        self.profiler.imports[name] = {"cumulative": elapsed, "self": elapsed - children}
+
+
+class StartupProfiler:
+    """Chronométrage des phases du démarrage de l'application
+
+    Chaque phase est mesurée par `with profiler.phase(nom):` ; les imports
+    sont chronométrés module par module tant que le crochet est installé.
+    Le rapport JSON compare chaque phase au budget configuré.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.origin = clock()
+        self.phases: List[Dict[str, float]] = []
+        # module -> {"cumulative": s, "self": s}
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self.finished = False
+        self._hook: Optional[_ImportTimer] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Mesure la durée d'une phase du démarrage"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            if not self.finished:
+                self.phases.append({"name": name, "start": start - self.origin, "duration": self.clock() - start})
+
+    def mark(self, name: str):
+        """Enregistre un instant (durée depuis le lancement), ex. premier événement d'inactivité"""
+        if not self.finished:
+            elapsed = self.clock() - self.origin
+            self.phases.append({"name": name, "start": 0.0, "duration": elapsed})
+
+    def install_import_hook(self):
+        """Chronomètre les imports suivants"""
+        if self._hook is None:
+            self._hook = _ImportTimer(self)
+            sys.meta_path.insert(0, self._hook)
+
+    def remove_import_hook(self):
+        if self._hook is not None:
+            if self._hook in sys.meta_path:
+                sys.meta_path.remove(self._hook)
+            self._hook = None
+
+    def finish(self):
+        """Termine la mesure : les phases suivantes ne sont plus enregistrées"""
+        self.remove_import_hook()
+        self.finished = True
+
+    def over_budget(self, budgets_ms: Dict[str, float]) -> List[str]:
+        """Phases dont la durée dépasse leur budget"""
+        return [
+            phase["name"] for phase in self.phases
+            if phase["name"] in budgets_ms and phase["duration"] * 1000 > budgets_ms[phase["name"]]
+        ]
+
+    def report(self, budgets_ms: Optional[Dict[str, float]] = None, top_imports: int = 20) -> Dict[str, Any]:
+        """Rapport des phases et des imports les plus coûteux"""
+        budgets_ms = budgets_ms or {}
+        slowest = sorted(self.imports.items(), key=lambda item: item[1]["self"], reverse=True)
+        return {
+            "total_ms": round((self.clock() - self.origin) * 1000, 2),
+            "phases": [
+                {
+                    "name": phase["name"],
+                    "start_ms": round(phase["start"] * 1000, 2),
+                    "duration_ms": round(phase["duration"] * 1000, 2),
+                    "budget_ms": budgets_ms.get(phase["name"]),
+                    "over_budget": phase["name"] in budgets_ms
+                    and phase["duration"] * 1000 > budgets_ms[phase["name"]],
+                }
+                for phase in self.phases
+            ],
+            "imports": {
+                "count": len(self.imports),
+                "slowest": [
+                    {
+                        "module": name,
+                        "self_ms": round(timing["self"] * 1000, 2),
+                        "cumulative_ms": round(timing["cumulative"] * 1000, 2),
+                    }
+                    for name, timing in slowest[:top_imports]
+                ],
+            },
+        }
+
+    def write_report(self, path: str, budgets_ms: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Écrit le rapport JSON et le retourne"""
+        report = self.report(budgets_ms)
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Erreur lors de l'écriture du rapport de démarrage : {e}")
+        return report
+
+
+# Instance globale, créée au lancement de main()
+_profiler: Optional[StartupProfiler] = None
+
+
+def start_profiler(clock: Callable[[], float] = time.perf_counter) -> StartupProfiler:
+    """Crée le chronométrage du démarrage (remplace le précédent)"""
+    global _profiler
+    _profiler = StartupProfiler(clock)
+    return _profiler
+
+
+def get_profiler() -> StartupProfiler:
+    """Retourne le chronométrage du démarrage en cours (inactif s'il n'a pas été lancé)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.finished = True
+    return _profiler
@@ -0,0 +1,122 @@
+"""Graphiques des statistiques (matplotlib)
+
+Module importé seulement au premier graphique demandé : matplotlib est
+coûteux à charger et inutile au démarrage de l'application.
+"""
+from typing import Any, Dict, List
+
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+def create_empty_chart(title: str, parent_widget) -> FigureCanvasTkAgg:
+    """Crée un graphique vide avec un message"""
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.text(0.5, 0.5, 'Aucune donnée disponible',
+           ha='center', va='center', transform=ax.transAxes)
+    ax.set_title(title)
+    canvas = FigureCanvasTkAgg(fig, parent_widget)
+    return canvas
+
+
+def create_score_chart(progression: List[Dict[str, Any]], parent_widget) -> FigureCanvasTkAgg:
+    """Crée un graphique de progression des scores"""
+    if not progression:
+        return create_empty_chart('Progression des Scores', parent_widget)
+
+    # Préparer les données
+    dates = [p["date"] for p in progression]
+    scores = [p["score"] for p in progression]
+
+    # Créer le graphique
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    # Graphique des scores
+    ax.plot(dates, scores, 'o-', linewidth=2, markersize=6, color='#e94560')
+    ax.fill_between(dates, scores, alpha=0.3, color='#e94560')
+
+    # Configuration du graphique
+    ax.set_title('Progression des Scores', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Score')
+    ax.grid(True, alpha=0.3)
+
+    # Formatage des dates
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
+    ax.xaxis.set_major_locator(mdates.DayLocator(interval=7))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+    # Ajuster la mise en page
+    plt.tight_layout()
+
+    # Créer le canvas
+    canvas = FigureCanvasTkAgg(fig, parent_widget)
+    return canvas
+
+
+def create_playtime_chart(progression: List[Dict[str, Any]], parent_widget) -> FigureCanvasTkAgg:
+    """Crée un graphique du temps de jeu"""
+    if not progression:
+        return create_empty_chart('Temps de Jeu', parent_widget)
+
+    # Préparer les données
+    dates = [p["date"] for p in progression]
+    playtimes = [p["duration"] for p in progression]
+
+    # Créer le graphique
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    # Graphique du temps de jeu
+    ax.bar(dates, playtimes, color='#10b981', alpha=0.7)
+
+    # Configuration du graphique
+    ax.set_title('Temps de Jeu par Session', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Temps (secondes)')
+    ax.grid(True, alpha=0.3)
+
+    # Formatage des dates
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
+    ax.xaxis.set_major_locator(mdates.DayLocator(interval=7))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+    # Ajuster la mise en page
+    plt.tight_layout()
+
+    # Créer le canvas
+    canvas = FigureCanvasTkAgg(fig, parent_widget)
+    return canvas
+
+
+def create_global_stats_chart(games_stats: Dict[str, Dict[str, Any]], parent_widget) -> FigureCanvasTkAgg:
+    """Crée un graphique des statistiques globales"""
+    games = list(games_stats.keys())
+    total_scores = [games_stats[game]["total_score"] for game in games]
+    game_names = [games_stats[game]["name"] for game in games]
+
+    if not games:
+        return create_empty_chart('Scores Totaux par Jeu', parent_widget)
+
+    # Créer le graphique
+    fig, ax = plt.subplots(figsize=(8, 4))
+
+    # Graphique en barres
+    colors = ['#e94560', '#a855f7', '#10b981', '#fbbf24', '#f97316']
+    bars = ax.bar(game_names, total_scores, color=colors[:len(games)])
+
+    # Configuration du graphique
+    ax.set_title('Scores Totaux par Jeu', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Jeux')
+    ax.set_ylabel('Score Total')
+    ax.grid(True, alpha=0.3)
+
+    # Rotation des labels
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+    # Ajuster la mise en page
+    plt.tight_layout()
+
+    # Créer le canvas
+    canvas = FigureCanvasTkAgg(fig, parent_widget)
+    return canvas
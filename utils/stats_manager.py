@@ -1,16 +1,31 @@
+import importlib
 import json
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
-from tkinter import ttk
-import numpy as np
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Module des graphiques (et matplotlib), chargé au premier graphique demandé
+_charts_module = None
+# Durée de ce premier chargement, en secondes
+charts_import_time: Optional[float] = None
+
+
+def load_charts():
+    """Importe le module des graphiques et mesure le coût de cet import"""
+    global _charts_module, charts_import_time
+    if _charts_module is None:
+        start = time.perf_counter()
+        _charts_module = importlib.import_module('utils.stats_charts')
+        charts_import_time = time.perf_counter() - start
+        get_logger().log_performance("import_stats_charts", charts_import_time)
+    return _charts_module
+
 
 class StatsManager:
     """Gestionnaire de statistiques détaillées pour l'application"""
@@ -149,126 +164,21 @@ class StatsManager:
         
         return sorted(progression, key=lambda x: x["date"])
     
-    def create_score_chart(self, game_id: str, parent_widget) -> FigureCanvasTkAgg:
+    def _charts(self):
+        """Module des graphiques, importé (avec matplotlib) au premier graphique"""
+        return load_charts()
+    
+    def create_score_chart(self, game_id: str, parent_widget) -> 'FigureCanvasTkAgg':
         """Crée un graphique de progression des scores"""
-        progression = self.get_score_progression(game_id)
-        
-        if not progression:
-            # Créer un graphique vide
-            fig, ax = plt.subplots(figsize=(8, 4))
-            ax.text(0.5, 0.5, 'Aucune donnée disponible', 
-                   ha='center', va='center', transform=ax.transAxes)
-            ax.set_title('Progression des Scores')
-            canvas = FigureCanvasTkAgg(fig, parent_widget)
-            return canvas
-        
-        # Préparer les données
-        dates = [p["date"] for p in progression]
-        scores = [p["score"] for p in progression]
-        
-        # Créer le graphique
-        fig, ax = plt.subplots(figsize=(8, 4))
-        
-        # Graphique des scores
-        ax.plot(dates, scores, 'o-', linewidth=2, markersize=6, color='#e94560')
-        ax.fill_between(dates, scores, alpha=0.3, color='#e94560')
-        
-        # Configuration du graphique
-        ax.set_title('Progression des Scores', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Score')
-        ax.grid(True, alpha=0.3)
-        
-        # Formatage des dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
-        ax.xaxis.set_major_locator(mdates.DayLocator(interval=7))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        # Ajuster la mise en page
-        plt.tight_layout()
-        
-        # Créer le canvas
-        canvas = FigureCanvasTkAgg(fig, parent_widget)
-        return canvas
+        return self._charts().create_score_chart(self.get_score_progression(game_id), parent_widget)
     
-    def create_playtime_chart(self, game_id: str, parent_widget) -> FigureCanvasTkAgg:
+    def create_playtime_chart(self, game_id: str, parent_widget) -> 'FigureCanvasTkAgg':
         """Crée un graphique du temps de jeu"""
-        progression = self.get_score_progression(game_id)
-        
-        if not progression:
-            # Créer un graphique vide
-            fig, ax = plt.subplots(figsize=(8, 4))
-            ax.text(0.5, 0.5, 'Aucune donnée disponible', 
-                   ha='center', va='center', transform=ax.transAxes)
-            ax.set_title('Temps de Jeu')
-            canvas = FigureCanvasTkAgg(fig, parent_widget)
-            return canvas
-        
-        # Préparer les données
-        dates = [p["date"] for p in progression]
-        playtimes = [p["duration"] for p in progression]
-        
-        # Créer le graphique
-        fig, ax = plt.subplots(figsize=(8, 4))
-        
-        # Graphique du temps de jeu
-        ax.bar(dates, playtimes, color='#10b981', alpha=0.7)
-        
-        # Configuration du graphique
-        ax.set_title('Temps de Jeu par Session', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Temps (secondes)')
-        ax.grid(True, alpha=0.3)
-        
-        # Formatage des dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
-        ax.xaxis.set_major_locator(mdates.DayLocator(interval=7))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        # Ajuster la mise en page
-        plt.tight_layout()
-        
-        # Créer le canvas
-        canvas = FigureCanvasTkAgg(fig, parent_widget)
-        return canvas
+        return self._charts().create_playtime_chart(self.get_score_progression(game_id), parent_widget)
     
-    def create_global_stats_chart(self, parent_widget) -> FigureCanvasTkAgg:
+    def create_global_stats_chart(self, parent_widget) -> 'FigureCanvasTkAgg':
         """Crée un graphique des statistiques globales"""
-        games = list(self.stats["games"].keys())
-        total_scores = [self.stats["games"][game]["total_score"] for game in games]
-        game_names = [self.stats["games"][game]["name"] for game in games]
-        
-        if not games:
-            # Créer un graphique vide
-            fig, ax = plt.subplots(figsize=(8, 4))
-            ax.text(0.5, 0.5, 'Aucune donnée disponible', 
-                   ha='center', va='center', transform=ax.transAxes)
-            ax.set_title('Scores Totaux par Jeu')
-            canvas = FigureCanvasTkAgg(fig, parent_widget)
-            return canvas
-        
-        # Créer le graphique
-        fig, ax = plt.subplots(figsize=(8, 4))
-        
-        # Graphique en barres
-        colors = ['#e94560', '#a855f7', '#10b981', '#fbbf24', '#f97316']
-        bars = ax.bar(game_names, total_scores, color=colors[:len(games)])
-        
-        # Configuration du graphique
-        ax.set_title('Scores Totaux par Jeu', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Jeux')
-        ax.set_ylabel('Score Total')
-        ax.grid(True, alpha=0.3)
-        
-        # Rotation des labels
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        # Ajuster la mise en page
-        plt.tight_layout()
-        
-        # Créer le canvas
-        canvas = FigureCanvasTkAgg(fig, parent_widget)
-        return canvas
+        return self._charts().create_global_stats_chart(self.stats["games"], parent_widget)
     
     def get_achievements(self) -> List[Dict[str, Any]]:
         """Récupère les achievements débloqués"""
@@ -357,9 +267,12 @@ class StatsManager:
         )
         return best_performing[0]
 
-# Instance globale
-stats_manager = StatsManager()
+# Instance globale, créée au premier appel (lecture de stats.json)
+stats_manager: Optional[StatsManager] = None
 
 def get_stats_manager() -> StatsManager:
     """Retourne l'instance globale du gestionnaire de statistiques"""
+    global stats_manager
+    if stats_manager is None:
+        stats_manager = StatsManager()
     return stats_manager
@@ -0,0 +1,160 @@
+import json
+import os
+import re
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(rb'\S+')
+# Taille maximale d'un mot en octets ; au-delà, il n'est pas proposé au joueur
+MAX_WORD_BYTES = 256
+
+# (mot, offset de début, offset de fin) en octets dans le fichier
+Token = Tuple[str, int, int]
+
+
+def iter_tokens(path: str, offset: int = 0, chunk_size: int = 1 << 16,
+                max_word: int = MAX_WORD_BYTES) -> Iterator[Token]:
+    """Découpe un fichier texte en mots, morceau par morceau
+
+    Seul le morceau courant est en mémoire ; un mot coupé en fin de morceau
+    est reporté au suivant. Le découpage se fait sur les octets d'espacement
+    ASCII, qui n'apparaissent jamais à l'intérieur d'un caractère UTF-8.
+    Les mots de plus de `max_word` octets (données sans espaces) sont
+    écartés : le report ne dépasse jamais cette taille.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        position = offset  # Offset du début de `pending` dans le fichier
+        pending = b''
+        oversized = False  # Le morceau commence par la suite d'un mot écarté
+        while True:
+            chunk = f.read(chunk_size)
+            data = pending + chunk
+            pending = b''
+            consumed = len(data)
+            skip_head, oversized = oversized, False
+            for match in _TOKEN_RE.finditer(data):
+                if skip_head and match.start() == 0:
+                    oversized = bool(chunk) and match.end() == len(data)
+                    continue
+                if chunk and match.end() == len(data):
+                    if match.end() - match.start() > max_word:
+                        oversized = True
+                        break
+                    # Mot peut-être incomplet : on attend le morceau suivant
+                    consumed = match.start()
+                    pending = data[consumed:]
+                    break
+                if match.end() - match.start() > max_word:
+                    continue
+                word = match.group().decode('utf-8', errors='replace')
+                if position == 0 and match.start() == 0:
+                    word = word.lstrip('\ufeff')
+                if word:
+                    yield word, position + match.start(), position + match.end()
+            position += consumed
+            if not chunk:
+                return
+
+
+class TextStream:
+    """Source de mots lue au fil d'un texte arbitrairement long
+
+    Les `prefetch` mots suivants sont lus d'avance pour être affichés au
+    joueur ; `position` est l'offset du mot courant, qui permet de reprendre
+    le texte au même endroit lors d'une session suivante.
+    """
+
+    def __init__(self, path: str, offset: int = 0, prefetch: int = 32, chunk_size: int = 1 << 16):
+        self.path = path
+        self.prefetch = max(1, prefetch)
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self.position = offset
+        self._ahead: Deque[Token] = deque()
+        self._tokens = iter_tokens(path, offset, chunk_size)
+        self._fill()
+
+    def _fill(self):
+        while len(self._ahead) < self.prefetch:
+            token = next(self._tokens, None)
+            if token is None:
+                break
+            self._ahead.append(token)
+
+    def next_word(self) -> Optional[str]:
+        """Passe au mot suivant ; None à la fin du texte"""
+        if not self._ahead:
+            return None
+        word, start, _ = self._ahead.popleft()
+        self.position = start
+        self._fill()
+        return word
+
+    def peek(self, count: int = 5) -> List[str]:
+        """Mots à venir, déjà lus d'avance"""
+        return [word for word, _, _ in list(self._ahead)[:count]]
+
+    def progress(self) -> float:
+        """Part du texte déjà parcourue (0 à 1)"""
+        return self.position / self.size if self.size else 1.0
+
+    def rewind(self):
+        """Reprend le texte depuis le début"""
+        self.close()
+        self.position = 0
+        self._ahead.clear()
+        self._tokens = iter_tokens(self.path, 0, self.chunk_size)
+        self._fill()
+
+    def close(self):
+        self._tokens.close()
+
+
+class TextProgress:
+    """Position de lecture de chaque texte, gardée entre les sessions"""
+
+    def __init__(self, progress_file: str = "text_progress.json"):
+        self.progress_file = progress_file
+        # chemin absolu -> {"offset": ..., "size": ...}
+        self.texts: Dict[str, Dict[str, int]] = self.load_progress()
+
+    def load_progress(self) -> Dict[str, Dict[str, int]]:
+        """Charge les positions depuis le fichier"""
+        try:
+            if os.path.exists(self.progress_file):
+                with open(self.progress_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get("texts", {})
+        except Exception as e:
+            print(f"Erreur lors du chargement de la progression des textes: {e}")
+        return {}
+
+    def save_progress(self):
+        """Sauvegarde les positions dans le fichier"""
+        try:
+            with open(self.progress_file, 'w', encoding='utf-8') as f:
+                json.dump({"texts": self.texts}, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde de la progression des textes: {e}")
+
+    def get_offset(self, path: str) -> int:
+        """Offset de reprise d'un texte ; 0 s'il a changé depuis"""
+        entry = self.texts.get(os.path.abspath(path))
+        try:
+            if entry and entry.get("size") == os.path.getsize(path):
+                return entry.get("offset", 0)
+        except OSError:
+            pass
+        return 0
+
+    def set_offset(self, path: str, offset: int):
+        """Mémorise l'offset de reprise d'un texte"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        self.texts[os.path.abspath(path)] = {"offset": offset, "size": size}
+
+    def open(self, path: str, prefetch: int = 32) -> TextStream:
+        """Ouvre un texte à sa dernière position connue"""
+        return TextStream(path, self.get_offset(path), prefetch)
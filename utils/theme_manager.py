@@ -2,13 +2,15 @@ import tkinter as tk
 from tkinter import ttk
 import json
 import os
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List
 
 class ThemeManager:
     """Gestionnaire de thèmes pour l'application"""
     
-    def __init__(self):
+    def __init__(self, preferences_file: str = "user_preferences.json"):
+        self.preferences_file = preferences_file
         self.current_theme = "modern_blue"
+        self._subscribers: List[Callable[[str], None]] = []
         self.themes = {
             "modern_blue": {
                 "name": "Bleu Moderne",
@@ -171,6 +173,26 @@ class ThemeManager:
         if theme_name in self.themes:
             self.current_theme = theme_name
             self.save_user_preferences()
+            for callback in list(self._subscribers):
+                try:
+                    callback(theme_name)
+                except Exception as e:
+                    print(f"Erreur lors de la notification du changement de thème : {e}")
+    
+    def subscribe(self, callback: Callable[[str], None]) -> Callable[[], None]:
+        """Abonne une fonction aux changements de thème (reçoit l'identifiant du thème)
+
+        Retourne une fonction qui annule cet abonnement.
+        """
+        self._subscribers.append(callback)
+
+        def cancel():
+            self._subscribers = [cb for cb in self._subscribers if cb is not callback]
+        return cancel
+    
+    def unsubscribe(self, callback: Callable[[str], None]):
+        """Retire l'abonnement d'une fonction"""
+        self._subscribers = [cb for cb in self._subscribers if cb != callback]
     
     def get_available_themes(self) -> Dict[str, str]:
         """Retourne la liste des thèmes disponibles avec leurs noms"""
@@ -179,8 +201,8 @@ class ThemeManager:
     def load_user_preferences(self):
         """Charge les préférences utilisateur depuis un fichier"""
         try:
-            if os.path.exists("user_preferences.json"):
-                with open("user_preferences.json", "r", encoding="utf-8") as f:
+            if os.path.exists(self.preferences_file):
+                with open(self.preferences_file, "r", encoding="utf-8") as f:
                     preferences = json.load(f)
                     if "theme" in preferences:
                         self.current_theme = preferences["theme"]
@@ -193,7 +215,7 @@ class ThemeManager:
             preferences = {
                 "theme": self.current_theme
             }
-            with open("user_preferences.json", "w", encoding="utf-8") as f:
+            with open(self.preferences_file, "w", encoding="utf-8") as f:
                 json.dump(preferences, f, ensure_ascii=False, indent=2)
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des préférences : {e}")
@@ -0,0 +1,285 @@
+import json
+import os
+import random
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+NS_PER_MINUTE = 60 * 1_000_000_000
+# Convention usuelle : un « mot » vaut cinq caractères
+CHARS_PER_WORD = 5
+
+
+class KeystrokeRecorder:
+    """Enregistreur de frappes et statistiques de vitesse incrémentales
+
+    Les dernières frappes sont gardées dans un tampon circulaire de taille
+    fixe : chaque événement met à jour les compteurs globaux, la fenêtre
+    glissante et la latence de la touche en temps constant.
+    """
+
+    def __init__(self, capacity: int = 64, clock=time.perf_counter_ns):
+        self.capacity = capacity
+        self.clock = clock
+        self._times = array('q', bytes(8 * capacity))
+        self._correct = bytearray(capacity)
+        self.reset()
+
+    def reset(self):
+        """Remet l'enregistreur à zéro pour une nouvelle manche"""
+        self._head = 0
+        self._size = 0
+        self._window_correct = 0
+        self.started_ns: Optional[int] = None
+        self.last_ns: Optional[int] = None
+        self.keystrokes = 0
+        self.correct_keystrokes = 0
+        self.words_completed = 0
+        self.words_correct = 0
+        # touche -> [nombre de frappes, latence cumulée en ns]
+        self.key_latency: Dict[str, list] = {}
+
+    def start(self, timestamp_ns: Optional[int] = None):
+        """Démarre le chronomètre de la manche"""
+        self.started_ns = self.clock() if timestamp_ns is None else timestamp_ns
+        self.last_ns = self.started_ns
+
+    def record(self, key: str, correct: bool, timestamp_ns: Optional[int] = None):
+        """Enregistre une frappe et sa justesse"""
+        now = self.clock() if timestamp_ns is None else timestamp_ns
+        if self.started_ns is None:
+            self.start(now)
+
+        latency = self.key_latency.setdefault(key, [0, 0])
+        latency[0] += 1
+        latency[1] += now - self.last_ns
+        self.last_ns = now
+
+        self.keystrokes += 1
+        self.correct_keystrokes += bool(correct)
+
+        # Fenêtre glissante : la frappe la plus ancienne sort du tampon
+        if self._size == self.capacity:
+            self._window_correct -= self._correct[self._head]
+        else:
+            self._size += 1
+        self._times[self._head] = now
+        self._correct[self._head] = bool(correct)
+        self._window_correct += bool(correct)
+        self._head = (self._head + 1) % self.capacity
+
+    def word_completed(self, correct: bool):
+        """Enregistre la validation d'un mot"""
+        self.words_completed += 1
+        self.words_correct += bool(correct)
+
+    def elapsed_ns(self, now: Optional[int] = None) -> int:
+        if self.started_ns is None:
+            return 0
+        return (self.clock() if now is None else now) - self.started_ns
+
+    def _per_minute(self, count: int, duration_ns: int) -> float:
+        return count * NS_PER_MINUTE / duration_ns if duration_ns > 0 else 0.0
+
+    def raw_cpm(self, now: Optional[int] = None) -> float:
+        """Caractères par minute, toutes frappes confondues"""
+        return self._per_minute(self.keystrokes, self.elapsed_ns(now))
+
+    def net_cpm(self, now: Optional[int] = None) -> float:
+        """Caractères justes par minute"""
+        return self._per_minute(self.correct_keystrokes, self.elapsed_ns(now))
+
+    def wpm(self, now: Optional[int] = None) -> float:
+        """Mots par minute sur toute la manche (cinq caractères justes par mot)"""
+        return self.net_cpm(now) / CHARS_PER_WORD
+
+    def rolling_wpm(self) -> float:
+        """Mots par minute sur les dernières frappes du tampon"""
+        if self._size < 2:
+            return 0.0
+        oldest = self._times[(self._head - self._size) % self.capacity]
+        newest = self._times[(self._head - 1) % self.capacity]
+        return self._per_minute(self._window_correct, newest - oldest) / CHARS_PER_WORD
+
+    def accuracy(self) -> float:
+        """Pourcentage de frappes justes"""
+        if not self.keystrokes:
+            return 100.0
+        return 100.0 * self.correct_keystrokes / self.keystrokes
+
+    def mean_latency_ms(self, key: str) -> float:
+        """Latence moyenne (ms) avant la frappe d'une touche"""
+        count, total = self.key_latency.get(key, (0, 0))
+        return total / count / 1_000_000 if count else 0.0
+
+    def slowest_keys(self, limit: int = 3) -> Dict[str, float]:
+        """Touches les plus lentes, avec leur latence moyenne en ms"""
+        keys = sorted(self.key_latency, key=self.mean_latency_ms, reverse=True)
+        return {key: round(self.mean_latency_ms(key), 1) for key in keys[:limit]}
+
+    def summary(self) -> Dict[str, Any]:
+        """Résumé de la manche, enregistré avec le score"""
+        now = self.clock()
+        return {
+            "wpm": round(self.wpm(now), 1),
+            "raw_cpm": round(self.raw_cpm(now), 1),
+            "net_cpm": round(self.net_cpm(now), 1),
+            "accuracy": round(self.accuracy(), 1),
+            "keystrokes": self.keystrokes,
+            "errors": self.keystrokes - self.correct_keystrokes,
+            "words": self.words_completed,
+            "words_correct": self.words_correct,
+            "duration_s": round(self.elapsed_ns(now) / 1_000_000_000, 2),
+            "slowest_keys": self.slowest_keys(),
+        }
+
+
+class ErrorProfile:
+    """Statistiques d'erreurs par caractère et par bigramme, gardées entre les sessions
+
+    Chaque unité (un caractère ou deux caractères consécutifs du mot cible)
+    compte ses tentatives et ses erreurs ; la mise à jour est en O(1).
+    """
+
+    def __init__(self, profile_file: str = "typing_profile.json"):
+        self.profile_file = profile_file
+        # unité -> [tentatives, erreurs]
+        self.units: Dict[str, List[int]] = self.load_profile()
+        self.version = 0
+
+    def load_profile(self) -> Dict[str, List[int]]:
+        """Charge le profil depuis le fichier"""
+        try:
+            if os.path.exists(self.profile_file):
+                with open(self.profile_file, 'r', encoding='utf-8') as f:
+                    return {unit: list(counts) for unit, counts in json.load(f).get("units", {}).items()}
+        except Exception as e:
+            print(f"Erreur lors du chargement du profil de frappe: {e}")
+        return {}
+
+    def save_profile(self):
+        """Sauvegarde le profil dans le fichier"""
+        try:
+            with open(self.profile_file, 'w', encoding='utf-8') as f:
+                json.dump({"units": self.units}, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde du profil de frappe: {e}")
+
+    def record_key(self, expected: str, previous: str, correct: bool):
+        """Enregistre la frappe d'un caractère attendu (et du bigramme qu'il termine)"""
+        for unit in (expected, previous + expected if previous else None):
+            if unit:
+                counts = self.units.setdefault(unit, [0, 0])
+                counts[0] += 1
+                counts[1] += not correct
+        self.version += 1
+
+    def error_rate(self, unit: str, prior_attempts: int = 5) -> float:
+        """Taux d'erreur lissé : une unité peu vue n'est pas jugée sur un accident"""
+        attempts, errors = self.units.get(unit, (0, 0))
+        return errors / (attempts + prior_attempts)
+
+    def weak_units(self, limit: int = 16, min_errors: int = 2) -> Dict[str, float]:
+        """Unités les plus fautives avec leur taux d'erreur lissé"""
+        candidates = [unit for unit, (_, errors) in self.units.items() if errors >= min_errors]
+        candidates.sort(key=self.error_rate, reverse=True)
+        return {unit: self.error_rate(unit) for unit in candidates[:limit]}
+
+
+class AliasTable:
+    """Tirage pondéré en O(1) par la méthode des alias (Vose)"""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        count = len(items)
+        total = float(sum(weights))
+        self.items = list(items)
+        self._probability = [0.0] * count
+        self._alias = [0] * count
+        scaled = [weight * count / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self._probability[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        for index in small + large:
+            self._probability[index] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng=random) -> Any:
+        column = rng.randrange(len(self.items))
+        if rng.random() < self._probability[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
+
+
+class AdaptiveSampler:
+    """Tirage de mots orienté vers les points faibles du joueur
+
+    Une table d'alias sur les unités fautives choisit la cible en O(1), puis
+    un mot est pris dans la réserve de mots contenant cette unité. Les
+    réserves se remplissent au fil des tirages et survivent aux
+    reconstructions : seule la petite table d'alias est refaite après chaque
+    manche.
+    """
+
+    def __init__(self, store, base_sampler, profile: ErrorProfile,
+                 exploration: float = 0.3, pool_size: int = 64, probe_limit: int = 48):
+        self.store = store
+        self.base_sampler = base_sampler
+        self.profile = profile
+        self.exploration = exploration
+        self.pool_size = pool_size
+        self.probe_limit = probe_limit
+        self.pools: Dict[str, List[int]] = {}
+        self.table: Optional[AliasTable] = None
+        self._built_version = -1
+        self.rebuild()
+
+    def rebuild(self):
+        """Reconstruit la table d'alias si le profil a changé"""
+        if self._built_version == self.profile.version:
+            return
+        weak = self.profile.weak_units()
+        self.table = AliasTable(list(weak), list(weak.values())) if weak else None
+        self._built_version = self.profile.version
+
+    def _probe(self, unit: str, rng) -> Optional[int]:
+        """Cherche un mot contenant l'unité et alimente les réserves au passage"""
+        targets = self.table.items if self.table else [unit]
+        found = None
+        for _ in range(self.probe_limit):
+            word_id = self.base_sampler.random_id(rng)
+            word = self.store[word_id]
+            for target in targets:
+                if target in word:
+                    pool = self.pools.setdefault(target, [])
+                    if len(pool) < self.pool_size:
+                        pool.append(word_id)
+                    elif target == unit:
+                        pool[rng.randrange(self.pool_size)] = word_id
+            if unit in word:
+                found = word_id
+                break
+        return found
+
+    def random_id(self, rng=random) -> int:
+        if self.table is None or rng.random() < self.exploration:
+            return self.base_sampler.random_id(rng)
+        unit = self.table.sample(rng)
+        pool = self.pools.get(unit)
+        # Réserve encore petite : on la complète, sinon tirage direct
+        if not pool or len(pool) < self.pool_size and rng.random() < 0.5:
+            word_id = self._probe(unit, rng)
+            if word_id is not None:
+                return word_id
+            if not pool:
+                return self.base_sampler.random_id(rng)
+        return pool[rng.randrange(len(pool))]
+
+    def random_word(self, rng=random) -> str:
+        return self.store[self.random_id(rng)]
@@ -0,0 +1,595 @@
+import mmap
+import os
+import queue
+import random
+import re
+import struct
+import sys
+import threading
+import unicodedata
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from heapq import merge
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Liste intégrée : permet de jouer pendant le chargement du dictionnaire,
+# ou à sa place quand il est introuvable
+FALLBACK_WORDS = [
+    "python", "programmation", "ordinateur", "clavier", "écran",
+    "souris", "fenêtre", "maison", "jardin", "soleil", "musique", "voiture",
+    "chocolat", "montagne", "rivière", "bonjour", "lumière", "histoire",
+    "cuisine", "fromage", "papillon", "étoile", "forêt", "nuage",
+    "chat", "chien", "livre", "table", "porte", "pomme", "arbre", "fleur",
+    "vitesse", "frappe", "lettre", "phrase", "accent", "jouer", "gagner",
+    "réseau", "logiciel", "fichier", "dossier", "mémoire", "processeur",
+]
+
+_NEWLINE_RE = re.compile(rb'\n')
+_BLANK_LINE_RE = re.compile(rb'(?m)^[ \t\r]*\n')
+_WORD_LINE_RE = re.compile(rb'(?m)^[^\r\n]*\S[^\r\n]*')
+
+# Lettres peu fréquentes en français, utilisées pour noter la rareté d'un mot
+RARE_LETTERS = frozenset("jkqwxyz")
+# Les niveaux d'accents et de rareté sont plafonnés : 0, 1, puis 2 et plus
+MAX_TIER = 2
+
+# Format binaire compilé (petit-boutiste) :
+#   en-tête | table des tranches (longueur, accents, rareté) | offsets uint32
+#   | permutation uint32 des identifiants dans l'ordre alphabétique
+#   | même permutation sur les formes normalisées | mots UTF-8
+BINARY_MAGIC = b'MJWORDS\x00'
+BINARY_VERSION = 4
+_HEADER = struct.Struct('<8sHHIIQqII')
+_BUCKET = struct.Struct('<HBBII')
+
+BucketKey = Tuple[int, int, int]
+
+
+def word_tiers(word: str) -> Tuple[int, int]:
+    """Retourne les niveaux (accents, rareté) d'un mot, plafonnés à MAX_TIER"""
+    accents = 0
+    rare = 0
+    for char in word.lower():
+        if char in RARE_LETTERS:
+            rare += 1
+        elif not char.isascii() and unicodedata.decomposition(char):
+            accents += 1
+    return min(accents, MAX_TIER), min(rare, MAX_TIER)
+
+
+def bucket_key(word: str) -> BucketKey:
+    """Clé de tranche de difficulté : (longueur, accents, rareté)"""
+    return (len(word),) + word_tiers(word)
+
+
+def _build_fold_table() -> Dict[int, str]:
+    """Table de `str.translate` : lettre accentuée ou majuscule -> lettre de base
+
+    Seules les correspondances d'un caractère vers un caractère sont gardées
+    (les ligatures comme « œ » restent telles quelles), si bien qu'une forme
+    normalisée a toujours la longueur du mot d'origine.
+    """
+    table = {}
+    for code in range(0x250):
+        char = chr(code)
+        base = ''.join(c for c in unicodedata.normalize('NFD', char) if not unicodedata.combining(c)).lower()
+        if len(base) == 1 and base != char:
+            table[code] = base
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+@lru_cache(maxsize=8192)
+def fold_word(word: str) -> str:
+    """Forme sans accents ni majuscules d'un mot, de même longueur
+
+    `unicodedata` n'est consulté qu'une fois, à la construction de la table ;
+    les mots déjà vus sont servis par le cache.
+    """
+    return word.translate(_FOLD_TABLE)
+
+
+class WordStore(ABC):
+    """Interface commune des sources de mots pour le jeu de frappe
+
+    Une source expose `len()` et l'accès par index, ce qui suffit pour
+    `random.choice` sans jamais matérialiser la liste complète des mots.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Nombre de mots"""
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> str:
+        """Mot d'identifiant `index`"""
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def random_word(self, rng=random) -> str:
+        """Tire un mot au hasard en ne lisant qu'une seule entrée"""
+        return self[rng.randrange(len(self))]
+
+    def bucket_index(self) -> Dict[BucketKey, Sequence[int]]:
+        """Index des identifiants de mots par tranche de difficulté
+
+        Calculé une seule fois par un parcours complet ; le dictionnaire
+        compilé le fournit directement sans parcours.
+        """
+        index = getattr(self, '_bucket_index', None)
+        if index is None:
+            index = {}
+            for word_id, word in enumerate(self):
+                index.setdefault(bucket_key(word), array('I')).append(word_id)
+            self._bucket_index = index
+        return index
+
+    def sampler(self, level: Optional[Dict[str, Any]] = None) -> 'DifficultySampler':
+        """Crée un échantillonneur limité aux tranches d'un niveau de difficulté"""
+        return DifficultySampler(self, select_buckets(self.bucket_index(), level or {}))
+
+    def fingerprint(self) -> int:
+        """Empreinte du contenu et de la numérotation des mots (caches disque)"""
+        crc = 0
+        for word in self:
+            crc = zlib.crc32(word.encode('utf-8') + b'\n', crc)
+        return crc
+
+    def sorted_order(self) -> Sequence[int]:
+        """Identifiants des mots dans l'ordre alphabétique (pour l'arbre des préfixes)"""
+        order = getattr(self, '_sorted_order', None)
+        if order is None:
+            order = array('I', sorted(range(len(self)), key=self.__getitem__))
+            self._sorted_order = order
+        return order
+
+    def folded(self, index: int) -> str:
+        """Forme normalisée (sans accents ni majuscules) d'un mot"""
+        return fold_word(self[index])
+
+    def folded_order(self) -> Sequence[int]:
+        """Identifiants des mots dans l'ordre alphabétique de leurs formes normalisées
+
+        Les mots déjà normalisés restent triés dans `sorted_order()` : seuls
+        les autres sont triés à part, puis les deux suites sont fusionnées.
+        """
+        order = getattr(self, '_folded_order', None)
+        if order is None:
+            kept = array('I')
+            changed = []
+            for word_id in self.sorted_order():
+                word = self[word_id]
+                if word.translate(_FOLD_TABLE) == word:
+                    kept.append(word_id)
+                else:
+                    changed.append(word_id)
+            if changed:
+                changed.sort(key=self.folded)
+                order = array('I', merge(kept, changed, key=self.folded))
+            else:
+                order = self.sorted_order()
+            self._folded_order = order
+        return order
+
+    def close(self):
+        """Libère les ressources associées (fichiers, projections mémoire)"""
+
+
+class ListWordStore(WordStore):
+    """Source de mots en mémoire, pour les petites listes"""
+
+    def __init__(self, words: List[str]):
+        self.words = list(words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, index: int) -> str:
+        return self.words[index]
+
+
+class MmapWordStore(WordStore):
+    """Dictionnaire texte projeté en mémoire avec un index compact des lignes
+
+    Le fichier n'est jamais décodé en entier : seul un tableau `uint32` des
+    fins de ligne est construit, et chaque accès ne décode qu'une ligne.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Un fichier vide ne peut pas être projeté
+            self._file.close()
+            raise ValueError(f"Dictionnaire vide: {path}")
+        self._starts, self._ends = self._build_index()
+
+    def _build_index(self):
+        """Construit les tableaux de début et de fin de chaque mot non vide"""
+        mm = self._mm
+        size = len(mm)
+        if _BLANK_LINE_RE.search(mm) is None:
+            # Cas courant : une ligne par mot, il suffit d'indexer les '\n'
+            ends = array('I', (m.start() for m in _NEWLINE_RE.finditer(mm)))
+            last_start = ends[-1] + 1 if ends else 0
+            if mm[last_start:size].strip():
+                ends.append(size)
+            return None, ends
+        # Lignes vides présentes : on indexe explicitement chaque ligne utile
+        starts = array('I')
+        ends = array('I')
+        for match in _WORD_LINE_RE.finditer(mm):
+            starts.append(match.start())
+            ends.append(match.end())
+        return starts, ends
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index: int) -> str:
+        ends = self._ends
+        if index < 0:
+            index += len(ends)
+        end = ends[index]
+        if self._starts is not None:
+            start = self._starts[index]
+        else:
+            start = ends[index - 1] + 1 if index > 0 else 0
+        return self._mm[start:end].decode('utf-8').strip()
+
+    def fingerprint(self) -> int:
+        stat = os.stat(self.path)
+        return zlib.crc32(repr(('text', stat.st_size, stat.st_mtime_ns, len(self))).encode())
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+class BinaryWordStore(WordStore):
+    """Dictionnaire compilé : mots dédoublonnés, regroupés par longueur
+
+    L'ouverture ne lit que l'en-tête et la table des tranches ; les offsets
+    et les mots restent dans la projection mémoire jusqu'au premier accès.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        """Lit et contrôle l'en-tête du fichier compilé"""
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"Fichier compilé tronqué: {self.path}")
+        (magic, version, _flags, word_count, bucket_count, self.source_size,
+         self.source_mtime_ns, self.source_crc32, self.payload_crc32) = _HEADER.unpack_from(mm, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"Signature invalide: {self.path}")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Version {version} non supportée: {self.path}")
+
+        self.buckets: Dict[BucketKey, Tuple[int, int]] = {}
+        position = _HEADER.size
+        for _ in range(bucket_count):
+            length, accents, rarity, first, count = _BUCKET.unpack_from(mm, position)
+            self.buckets[(length, accents, rarity)] = (first, count)
+            position += _BUCKET.size
+        self._bucket_index = {
+            key: range(first, first + count) for key, (first, count) in self.buckets.items()
+        }
+
+        self._views = []
+        offsets_start = _align(position)
+        order_start = offsets_start + (word_count + 1) * 4
+        folded_start = order_start + word_count * 4
+        self._blob_start = folded_start + word_count * 4
+        if self._blob_start > len(mm):
+            raise ValueError(f"Tables d'index tronquées: {self.path}")
+        self._offsets = self._uint32_table(offsets_start, order_start)
+        self._sorted_order = self._uint32_table(order_start, folded_start)
+        self._folded_order = self._uint32_table(folded_start, self._blob_start)
+        self._payload_start = _HEADER.size
+        self._word_count = word_count
+        if self._blob_start + self._offsets[word_count] != len(mm):
+            raise ValueError(f"Taille incohérente: {self.path}")
+
+    def _uint32_table(self, start: int, end: int) -> Sequence[int]:
+        """Vue sans copie sur une table uint32 petit-boutiste du fichier"""
+        raw = memoryview(self._mm)[start:end]
+        self._views.append(raw)
+        if sys.byteorder == 'little':
+            table = raw.cast('I')
+            self._views.append(table)
+            return table
+        table = array('I', raw.tobytes())
+        table.byteswap()
+        return table
+
+    def __len__(self) -> int:
+        return self._word_count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._word_count
+        if not 0 <= index < self._word_count:
+            raise IndexError("index de mot hors limites")
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def length_range(self, length: int) -> Tuple[int, int]:
+        """Retourne (premier index, nombre de mots) pour une longueur donnée"""
+        ranges = [value for key, value in self.buckets.items() if key[0] == length]
+        if not ranges:
+            return (0, 0)
+        return (min(first for first, _ in ranges), sum(count for _, count in ranges))
+
+    def fingerprint(self) -> int:
+        return zlib.crc32(repr(('binary', self.payload_crc32, self._word_count)).encode())
+
+    def verify(self) -> bool:
+        """Vérifie la somme de contrôle de tout le contenu compilé"""
+        return zlib.crc32(self._mm[self._payload_start:]) == self.payload_crc32
+
+    def is_stale(self, source_path: str) -> bool:
+        """Indique si le fichier compilé ne correspond plus au texte source"""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            # Sans source (exécutable empaqueté), le fichier compilé fait foi
+            return False
+        if stat.st_size != self.source_size:
+            return True
+        if stat.st_mtime_ns == self.source_mtime_ns:
+            return False
+        # Date différente (copie, extraction) : on compare le contenu
+        return _file_crc32(source_path) != self.source_crc32
+
+    def close(self):
+        for view in reversed(getattr(self, '_views', [])):
+            view.release()
+        if hasattr(self, '_mm'):
+            self._mm.close()
+        self._file.close()
+
+
+class DifficultySampler:
+    """Tirage uniforme en temps constant parmi un ensemble de tranches
+
+    Les tailles cumulées des tranches sont calculées une fois ; un tirage
+    choisit la tranche par dichotomie sur cette courte liste, puis le mot
+    par son rang dans la tranche, sans filtrer aucun mot.
+    """
+
+    def __init__(self, store: WordStore, buckets: List[Sequence[int]]):
+        self.store = store
+        self.buckets = [bucket for bucket in buckets if len(bucket)]
+        if not self.buckets:
+            # Niveau sans aucun mot : on retombe sur le dictionnaire entier
+            self.buckets = [range(len(store))]
+        self._cumulative = list(accumulate(len(bucket) for bucket in self.buckets))
+
+    def __len__(self) -> int:
+        return self._cumulative[-1]
+
+    def random_id(self, rng=random) -> int:
+        """Tire l'identifiant d'un mot du niveau"""
+        rank = rng.randrange(self._cumulative[-1])
+        position = bisect_right(self._cumulative, rank)
+        previous = self._cumulative[position - 1] if position else 0
+        return self.buckets[position][rank - previous]
+
+    def random_word(self, rng=random) -> str:
+        """Tire un mot du niveau"""
+        return self.store[self.random_id(rng)]
+
+
+def select_buckets(index: Dict[BucketKey, Sequence[int]], level: Dict[str, Any]) -> List[Sequence[int]]:
+    """Sélectionne les tranches correspondant aux bornes d'un niveau
+
+    Clés reconnues : min_length, max_length, max_accents, max_rarity.
+    """
+    min_length = level.get('min_length', 1)
+    max_length = level.get('max_length', sys.maxsize)
+    max_accents = level.get('max_accents', MAX_TIER)
+    max_rarity = level.get('max_rarity', MAX_TIER)
+    return [
+        ids for (length, accents, rarity), ids in sorted(index.items())
+        if min_length <= length <= max_length and accents <= max_accents and rarity <= max_rarity
+    ]
+
+
+def _align(position: int, boundary: int = 4) -> int:
+    return (position + boundary - 1) // boundary * boundary
+
+
+def _file_crc32(path: str) -> int:
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def compiled_path(source_path: str) -> str:
+    """Chemin du dictionnaire compilé associé à un fichier texte"""
+    return os.path.splitext(source_path)[0] + '.bin'
+
+
+def compile_dictionary(source_path: str, target_path: Optional[str] = None) -> Dict[str, int]:
+    """Compile un dictionnaire texte vers le format binaire
+
+    Les mots sont dédoublonnés puis triés par (longueur, accents, rareté, mot),
+    si bien que chaque tranche de difficulté est un intervalle contigu
+    d'identifiants. Le fichier est écrit à côté puis renommé, pour ne jamais
+    laisser un artefact partiel.
+    """
+    target_path = target_path or compiled_path(source_path)
+    stat = os.stat(source_path)
+    with open(source_path, 'r', encoding='utf-8') as f:
+        keyed = sorted((bucket_key(word), word) for word in {line.strip() for line in f if line.strip()})
+    words = [word for _, word in keyed]
+
+    encoded = [word.encode('utf-8') for word in words]
+    offsets = array('I', [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    buckets = []
+    for index, (key, _) in enumerate(keyed):
+        if buckets and buckets[-1][0] == key:
+            buckets[-1][2] += 1
+        else:
+            buckets.append([key, index, 1])
+
+    payload = bytearray()
+    for key, first, count in buckets:
+        payload += _BUCKET.pack(*key, first, count)
+    payload += b'\x00' * (_align(_HEADER.size + len(payload)) - _HEADER.size - len(payload))
+    payload += offsets.tobytes()
+    order = array('I', sorted(range(len(words)), key=words.__getitem__))
+    folded = array('I', sorted(order, key=lambda i: words[i].translate(_FOLD_TABLE)))
+    if sys.byteorder != 'little':
+        order.byteswap()
+        folded.byteswap()
+    payload += order.tobytes()
+    payload += folded.tobytes()
+    payload += b''.join(encoded)
+
+    header = _HEADER.pack(
+        BINARY_MAGIC, BINARY_VERSION, 0, len(words), len(buckets),
+        stat.st_size, stat.st_mtime_ns, _file_crc32(source_path), zlib.crc32(payload)
+    )
+    temp_path = target_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(temp_path, target_path)
+    return {"words": len(words), "buckets": len(buckets), "bytes": len(header) + len(payload)}
+
+
+def dictionary_path() -> str:
+    """Chemin du dictionnaire livré avec le jeu (dossier de PyInstaller dans l'exécutable)"""
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_path, 'assets', 'dico.txt')
+
+
+def load_dictionary(source_path: Optional[str] = None) -> WordStore:
+    """Ouvre le dictionnaire sans charger tous les mots (liste intégrée en cas d'erreur)"""
+    try:
+        return open_word_store(source_path or dictionary_path())
+    except Exception as e:
+        print(f"Erreur lors du chargement du dictionnaire: {str(e)}")
+        return ListWordStore(FALLBACK_WORDS)
+
+
+def open_word_store(source_path: str) -> WordStore:
+    """Ouvre le dictionnaire compilé s'il est à jour, sinon le fichier texte"""
+    binary_path = compiled_path(source_path)
+    if os.path.exists(binary_path):
+        try:
+            store = BinaryWordStore(binary_path)
+            if not store.is_stale(source_path):
+                return store
+            store.close()
+            print(f"Dictionnaire compilé obsolète, utilisation de {source_path}")
+        except (OSError, ValueError) as e:
+            print(f"Dictionnaire compilé illisible ({e}), utilisation de {source_path}")
+    return MmapWordStore(source_path)
+
+
+class BackgroundLoader:
+    """Exécute un chargement dans un thread de travail
+
+    Le thread prépare entièrement le résultat puis le dépose dans une file
+    thread-safe ; la boucle Tk le récupère avec `poll()` sans jamais bloquer.
+    """
+
+    def __init__(self, opener: Callable[[], Any]):
+        self.opener = opener
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Lance le chargement (sans effet s'il est déjà lancé)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+            self._thread.start()
+
+    def _prepare(self, result: Any):
+        """Travail complémentaire effectué dans le thread avant la remise"""
+
+    def _run(self):
+        try:
+            result = self.opener()
+            self._prepare(result)
+            self._queue.put(result)
+        except Exception as e:
+            self._queue.put(e)
+
+    def poll(self) -> Any:
+        """Retourne le résultat s'il est prêt, sans attendre"""
+        if self.result is None and self.error is None:
+            try:
+                result = self._queue.get_nowait()
+            except queue.Empty:
+                return None
+            if isinstance(result, Exception):
+                self.error = result
+            else:
+                self.result = result
+        return self.result
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Attend la fin du chargement (tests, outils en ligne de commande)"""
+        self.start()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.poll()
+
+    def is_loading(self) -> bool:
+        return self._thread is not None and self.poll() is None and self.error is None
+
+
+class WordStoreLoader(BackgroundLoader):
+    """Ouvre un dictionnaire dans un thread de travail, index compris"""
+
+    def _prepare(self, store: WordStore):
+        # Index calculés ici plutôt qu'au premier mot ou à la première touche (cas du fichier texte)
+        store.bucket_index()
+        store.sorted_order()
+        store.folded_order()
+
+
+def create_word_loader() -> WordStoreLoader:
+    """Lance l'ouverture du dictionnaire du jeu de frappe en arrière-plan"""
+    loader = WordStoreLoader(load_dictionary)
+    loader.start()
+    return loader
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join('assets', 'dico.txt')
+    info = compile_dictionary(source)
+    print(f"{compiled_path(source)}: {info['words']} mots, {info['buckets']} tranches, {info['bytes']} octets")
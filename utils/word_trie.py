@@ -0,0 +1,149 @@
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+# Un nœud est l'intervalle [début, fin) des mots partageant un préfixe dans
+# l'ordre alphabétique, accompagné de la longueur de ce préfixe.
+TrieNode = Tuple[int, int, int]
+
+
+class PrefixTrie:
+    """Arbre des préfixes compact construit sur l'ordre alphabétique des mots
+
+    Aucun nœud n'est créé à l'avance : les fils d'un nœud sont trouvés par
+    dichotomie dans son intervalle puis mémorisés, si bien qu'une transition
+    déjà vue coûte une simple recherche dans un dictionnaire.
+    """
+
+    def __init__(self, order: Sequence[int], key: Callable[[int], str]):
+        self.order = order
+        self.key = key
+        self._children: Dict[TrieNode, Dict[str, Optional[TrieNode]]] = {}
+
+    @classmethod
+    def from_store(cls, store, folded: bool = False) -> 'PrefixTrie':
+        """Construit l'arbre sur un dictionnaire (WordStore)
+
+        Avec `folded`, l'arbre porte sur les formes sans accents ni majuscules.
+        """
+        if folded:
+            return cls(store.folded_order(), store.folded)
+        return cls(store.sorted_order(), store.__getitem__)
+
+    def root(self) -> TrieNode:
+        return (0, len(self.order), 0)
+
+    def _char_at(self, position: int, depth: int) -> str:
+        # Chaîne vide pour un mot égal au préfixe : il se trie avant ses fils
+        return self.key(self.order[position])[depth:depth + 1]
+
+    def _bound(self, lo: int, hi: int, depth: int, char: str, strict: bool) -> int:
+        """Première position de [lo, hi) dont le caractère est >= (ou >) char"""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._char_at(mid, depth)
+            if value < char or (strict and value == char):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def step(self, node: Optional[TrieNode], char: str) -> Optional[TrieNode]:
+        """Descend d'un caractère ; None si aucun mot ne prolonge le préfixe"""
+        if node is None:
+            return None
+        children = self._children.setdefault(node, {})
+        if char not in children:
+            lo, hi, depth = node
+            start = self._bound(lo, hi, depth, char, strict=False)
+            end = self._bound(start, hi, depth, char, strict=True)
+            children[char] = (start, end, depth + 1) if start < end else None
+        return children[char]
+
+    def walk(self, prefix: str, node: Optional[TrieNode] = None) -> Optional[TrieNode]:
+        """Descend le long d'un préfixe complet"""
+        node = self.root() if node is None else node
+        for char in prefix:
+            node = self.step(node, char)
+            if node is None:
+                return None
+        return node
+
+    def is_word(self, node: Optional[TrieNode]) -> bool:
+        """Indique si le préfixe du nœud est lui-même un mot"""
+        if node is None:
+            return False
+        lo, hi, depth = node
+        return lo < hi and len(self.key(self.order[lo])) == depth
+
+    def count(self, node: Optional[TrieNode]) -> int:
+        """Nombre de mots commençant par le préfixe du nœud"""
+        return 0 if node is None else node[1] - node[0]
+
+
+class PrefixTracker:
+    """Suivi incrémental de la saisie d'un mot, caractère par caractère
+
+    Conserve le chemin dans l'arbre pour chaque longueur de saisie : une
+    frappe ajoute au plus une transition, un effacement retire un nœud.
+    Une fonction `fold` (qui doit conserver la longueur) rend la comparaison
+    insensible aux accents et à la casse ; l'arbre doit alors porter sur les
+    mêmes formes normalisées.
+    """
+
+    def __init__(self, trie: Optional[PrefixTrie] = None, fold: Optional[Callable[[str], str]] = None):
+        self.trie = trie
+        self.fold = fold
+        self.target = ""
+        self.typed = ""
+        self._target_key = ""
+        self._typed_key = ""
+        self._correct = 0
+        self._path = [trie.root()] if trie else []
+
+    def set_target(self, target: str):
+        """Change le mot à taper et remet la saisie à zéro"""
+        self.target = target
+        self._target_key = self.fold(target) if self.fold else target
+        self.typed = ""
+        self._typed_key = ""
+        self._correct = 0
+        if self.trie:
+            self._path = [self.trie.root()]
+
+    def update(self, typed: str):
+        """Met à jour l'état à partir du texte actuellement saisi"""
+        key = self.fold(typed) if self.fold else typed
+        common = 0
+        limit = min(len(key), len(self._typed_key))
+        while common < limit and key[common] == self._typed_key[common]:
+            common += 1
+        if self.trie:
+            del self._path[common + 1:]
+            for char in key[common:]:
+                self._path.append(self.trie.step(self._path[-1], char))
+        # Seuls les caractères modifiés sont comparés au mot cible
+        correct = min(self._correct, common)
+        limit = min(len(key), len(self._target_key))
+        while correct < limit and key[correct] == self._target_key[correct]:
+            correct += 1
+        self._correct = correct
+        self.typed = typed
+        self._typed_key = key
+
+    def correct_length(self) -> int:
+        """Longueur du préfixe correct par rapport au mot cible"""
+        return self._correct
+
+    def error_index(self) -> Optional[int]:
+        """Position du premier caractère faux, ou None si la saisie est correcte"""
+        length = self.correct_length()
+        return length if length < len(self.typed) else None
+
+    def is_known_prefix(self) -> bool:
+        """Indique si la saisie peut encore devenir un mot du dictionnaire"""
+        if not self.trie:
+            return True
+        return self._path[-1] is not None
+
+    def is_known_word(self) -> bool:
+        """Indique si la saisie est exactement un mot du dictionnaire"""
+        return bool(self.trie) and self.trie.is_word(self._path[-1])